@@ -5,6 +5,7 @@ from typing import Any
 
 import redis.asyncio as redis
 
+from apps.metrics import REDIS_COMMAND_DURATION
 from apps.types.redis import RedisConfig
 
 
@@ -26,16 +27,22 @@ class RedisCache:
             )
         return self._client
 
+    async def ping(self) -> None:
+        """Redis 연결을 미리 열어 둡니다 (시작 시 warm-up)"""
+        client = await self.get_client()
+        await client.ping()  # type: ignore[misc]
+
     async def close(self) -> None:
         """Redis 연결을 종료합니다"""
         if self._client is not None:
-            await self._client.close()
+            await self._client.aclose()
             self._client = None
 
     async def get(self, key: str) -> str | None:
         """캐시에서 값을 가져옵니다"""
         client = await self.get_client()
-        result: str | None = await client.get(key)
+        with REDIS_COMMAND_DURATION.labels("get").time():
+            result: str | None = await client.get(key)
         return result
 
     async def set(self, key: str, value: str, ex: int | None = None) -> None:
@@ -47,12 +54,28 @@ class RedisCache:
             ex: 만료 시간(초). None이면 만료하지 않음
         """
         client = await self.get_client()
-        await client.set(key, value, ex=ex)
+        with REDIS_COMMAND_DURATION.labels("set").time():
+            await client.set(key, value, ex=ex)
+
+    async def set_if_absent(self, key: str, value: str, ex: int) -> bool:
+        """키가 없을 때만 값을 저장합니다 (SET NX). 저장했으면 True"""
+        client = await self.get_client()
+        with REDIS_COMMAND_DURATION.labels("set").time():
+            result = await client.set(key, value, ex=ex, nx=True)
+        return bool(result)
 
     async def delete(self, key: str) -> None:
         """캐시에서 값을 삭제합니다"""
         client = await self.get_client()
-        await client.delete(key)
+        with REDIS_COMMAND_DURATION.labels("delete").time():
+            await client.delete(key)
+
+    async def incr(self, key: str) -> int:
+        """정수 값을 1 증가시키고 증가된 값을 반환합니다 (키가 없으면 0에서 시작)"""
+        client = await self.get_client()
+        with REDIS_COMMAND_DURATION.labels("incr").time():
+            result: int = await client.incr(key)
+        return result
 
     async def get_json(self, key: str) -> Any | None:
         """JSON으로 저장된 캐시 값을 가져옵니다"""
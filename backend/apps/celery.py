@@ -1,5 +1,9 @@
+from typing import Any
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
 
+from apps.metrics import mark_process_dead, start_metrics_server
 from settings import Settings
 
 _redis = Settings.redis
@@ -19,7 +23,7 @@ celery_app = Celery(
     "helper",
     broker=_build_redis_url(_celery.broker_db),
     backend=_build_redis_url(_celery.result_db),
-    include=["apps.tasks.reminder"],
+    include=["apps.tasks.reminder", "apps.tasks.ai_log"],
 )
 
 celery_app.conf.update(
@@ -35,5 +39,21 @@ celery_app.conf.update(
             "task": "apps.tasks.reminder.process_due_reminders",
             "schedule": 60.0,  # 60초마다
         },
+        "maintain-ai-log": {
+            "task": "apps.tasks.ai_log.maintain_ai_log",
+            "schedule": 3600.0,  # 1시간마다 (오늘 집계 갱신, 파티션은 필요할 때만 생성/삭제)
+        },
     },
 )
+
+
+@worker_init.connect  # type: ignore[untyped-decorator]
+def _start_metrics_server(**kwargs: Any) -> None:
+    """워커 메인 프로세스에서 지표 HTTP 서버를 시작합니다 (prefork 자식 프로세스 지표는 multiprocess 모드로 합침)."""
+    if Settings.metrics.enabled and Settings.metrics.celery_port is not None:
+        start_metrics_server(Settings.metrics.celery_port)
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _mark_metrics_process_dead(pid: int, **kwargs: Any) -> None:
+    mark_process_dead(pid)
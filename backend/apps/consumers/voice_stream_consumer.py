@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import time
 import wave
 from collections.abc import AsyncGenerator, MutableMapping
 from datetime import datetime
@@ -11,6 +12,7 @@ from uuid import uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from apps.metrics import STT_FIRST_RESULT, STT_STREAM_DURATION, WEBSOCKET_CONNECTIONS
 from apps.models.voice import VoiceSession
 from apps.services.streaming_voice import StreamingVoiceService
 from apps.services.voice_session import VoiceSessionService
@@ -81,17 +83,18 @@ class VoiceStreamConsumer:
 
         WebSocket 연결을 처리하고 오디오 수신/전송 태스크를 관리합니다.
         """
-        receive_task = asyncio.create_task(self._receive_audio())
-        send_task = asyncio.create_task(self._send_results())
+        with WEBSOCKET_CONNECTIONS.track_inprogress():
+            receive_task = asyncio.create_task(self._receive_audio())
+            send_task = asyncio.create_task(self._send_results())
 
-        try:
-            await asyncio.gather(receive_task, send_task)
-        except WebSocketDisconnect:
-            pass
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            await self._cleanup(receive_task, send_task)
+            try:
+                await asyncio.gather(receive_task, send_task)
+            except WebSocketDisconnect:
+                pass
+            except Exception as e:
+                logger.exception(e)
+            finally:
+                await self._cleanup(receive_task, send_task)
 
     async def _receive_audio(self) -> None:
         """
@@ -175,12 +178,18 @@ class VoiceStreamConsumer:
             if chunk is None:
                 return
 
-            # Google Cloud API 스트리밍 시작
+            # Google Cloud API 스트리밍 시작 (스트림 시간, 첫 결과까지 걸린 시간 기록)
+            stream_started = time.perf_counter()
+            first_result = True
             async for result in self.streaming_voice_service.stream_transcribe(
                 audio_generator=self._audio_generator(chunk),
                 language=self.language,
                 sample_rate=self.sample_rate,
             ):
+                if first_result:
+                    STT_FIRST_RESULT.observe(time.perf_counter() - stream_started)
+                    first_result = False
+
                 # Final result 저장
                 if result.is_final:
                     self.final_transcript = result.text
@@ -192,6 +201,7 @@ class VoiceStreamConsumer:
                         await self.websocket.send_json(result.model_dump())
                     except Exception:
                         self._websocket_closed = True
+            STT_STREAM_DURATION.observe(time.perf_counter() - stream_started)
         except Exception as e:
             logger.error(
                 f"❌ 음성 인식 에러 - session_id={self.session_id}, error={e}",
@@ -315,7 +325,7 @@ class VoiceStreamConsumer:
             return None
 
     async def _send_session_created_notification(self) -> None:
-        """클라이언트에게 session_id를 전송합니다."""
+        """클라이언트에게 session_id를 전송합니다 (audio_chunks: 서버가 받은 오디오 청크 수)."""
         if self._websocket_closed:
             return
 
@@ -326,6 +336,7 @@ class VoiceStreamConsumer:
                     "session_id": str(self.session_id),
                     "transcript": self.final_transcript,
                     "confidence": self.final_confidence,
+                    "audio_chunks": len(self.audio_chunks),
                 }
             )
         except Exception as e:
@@ -342,6 +353,7 @@ class VoiceStreamConsumer:
                 {
                     "type": "no_speech",
                     "message": "음성이 감지되지 않았습니다",
+                    "audio_chunks": len(self.audio_chunks),
                 }
             )
         except Exception as e:
@@ -1,4 +1,4 @@
-from . import assistant, auth, device, reminder, voice
+from . import assistant, auth, device, health, metrics, reminder, voice
 
 routers = [
     assistant.router,
@@ -9,5 +9,7 @@ routers = [
 ]
 
 __all__ = [
+    "health",
+    "metrics",
     "routers",
 ]
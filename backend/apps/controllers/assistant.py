@@ -6,16 +6,22 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 from starlette import status
 from starlette.authentication import requires
+from starlette.responses import Response as HTTPResponse
 
 from apps.repositories.memory import MemoryRepository
-from apps.schemas.assistant import AssistantRequest, AssistantResponse
-from apps.schemas.common import Response, ResponseProvider
+from apps.schemas.assistant import AssistantJobResponse, AssistantRequest, AssistantResponse
+from apps.schemas.common import CursorResponse, Response, ResponseProvider
 from apps.schemas.conversation import ConversationResponse, ProcessVoiceRequest
-from apps.schemas.memory import MemoryResponse
+from apps.schemas.memory import MemoryImportJobResponse, MemoryImportRequest, MemoryResponse
 from apps.services.assistant import AssistantService
+from apps.services.assistant_job import AssistantJobService
 from apps.services.conversation import ConversationService
-from apps.utils.datetime_utils import TimezoneConverter, format_datetime_for_timezone
+from apps.services.memory_calendar import MemoryCalendarService
+from apps.services.memory_import import MemoryImportService
+from apps.types.assistant_job import ProcessMode
+from apps.utils.pagination import Cursor
 from containers import Container
+from database import on_commit
 
 router = APIRouter(
     prefix="/api/v1/assistant",
@@ -23,7 +29,12 @@ router = APIRouter(
 )
 
 
-@router.post("/chat", response_model=Response[AssistantResponse], status_code=status.HTTP_200_OK)
+@router.post(
+    "/chat",
+    response_model=Response[AssistantResponse],
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_202_ACCEPTED: {"model": Response[AssistantJobResponse]}},
+)
 @requires("authenticated")
 @inject
 async def chat(
@@ -33,22 +44,33 @@ async def chat(
         AssistantService,
         Depends(Provide[Container.assistant_service]),
     ],
+    assistant_job_service: Annotated[
+        AssistantJobService,
+        Depends(Provide[Container.assistant_job_service]),
+    ],
+    mode: ProcessMode = ProcessMode.SYNC,
 ) -> JSONResponse:
     """
     AI 어시스턴트와 대화합니다.
 
     - 정보 저장 요청: "~를 기억해", "~에 뒀어" 등
     - 질문: "~어디 있어?", "~어떻게 가?" 등
+    - mode=async: 작업 ID를 즉시 반환 (202), 결과는 GET /assistant/jobs/{job_id}로 조회
     """
     user_id = request.user.user.id
+    if mode == ProcessMode.ASYNC:
+        job = await assistant_job_service.submit_chat(text=body.text, user_id=user_id, timezone=request.state.timezone)
+        return ResponseProvider.accepted(job)
+
     result = await assistant_service.process(text=body.text, user_id=user_id, timezone=request.state.timezone)
-    return ResponseProvider.success(TimezoneConverter.model_dump(result, request.state.timezone))
+    return ResponseProvider.success(result, timezone=request.state.timezone)
 
 
 @router.post(
     "/voice",
     response_model=Response[ConversationResponse],
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_202_ACCEPTED: {"model": Response[AssistantJobResponse]}},
 )
 @requires("authenticated")
 @inject
@@ -59,6 +81,11 @@ async def voice(
         ConversationService,
         Depends(Provide[Container.conversation_service]),
     ],
+    assistant_job_service: Annotated[
+        AssistantJobService,
+        Depends(Provide[Container.assistant_job_service]),
+    ],
+    mode: ProcessMode = ProcessMode.SYNC,
 ) -> JSONResponse:
     """
     음성 세션을 처리하여 대화 기록을 생성합니다.
@@ -66,13 +93,42 @@ async def voice(
     - WebSocket STT 완료 후 session_id를 받아 처리
     - 사용자가 확인/수정한 텍스트로 AI 처리
     - Memory/Reminder 생성 및 Conversation 기록
+    - mode=async: 작업 ID를 즉시 반환 (202), 결과는 GET /assistant/jobs/{job_id}로 조회
     """
     user_id = request.user.user.id
+    if mode == ProcessMode.ASYNC:
+        job = await assistant_job_service.submit_voice(request=body, user_id=user_id, timezone=request.state.timezone)
+        return ResponseProvider.accepted(job)
+
     result = await conversation_service.process_voice(request=body, user_id=user_id, timezone=request.state.timezone)
     return ResponseProvider.success(result)
 
 
-@router.get("/memories", response_model=Response[list[MemoryResponse]], status_code=status.HTTP_200_OK)
+@router.get("/jobs/{job_id}", response_model=Response[AssistantJobResponse], status_code=status.HTTP_200_OK)
+@requires("authenticated")
+@inject
+async def get_job(
+    request: Request,
+    job_id: str,
+    assistant_job_service: Annotated[
+        AssistantJobService,
+        Depends(Provide[Container.assistant_job_service]),
+    ],
+    wait: float = 0,
+) -> JSONResponse:
+    """
+    mode=async로 요청한 작업의 상태와 결과를 조회합니다.
+
+    - wait: 작업이 끝날 때까지 최대 wait초 대기 후 응답 (long-poll, 서버 설정 최대값으로 제한)
+    - status: pending, running, completed, failed
+    - result: completed일 때 동기 응답의 result와 같은 형태
+    """
+    user_id = request.user.user.id
+    job = await assistant_job_service.wait(job_id, user_id, wait_seconds=wait)
+    return ResponseProvider.success(job)
+
+
+@router.get("/memories", response_model=CursorResponse[MemoryResponse], status_code=status.HTTP_200_OK)
 @requires("authenticated")
 @inject
 async def get_memories(
@@ -83,17 +139,21 @@ async def get_memories(
     ],
     limit: int = 10,
     offset: int = 0,
+    cursor: str | None = None,
     date: str | None = None,
 ) -> JSONResponse:
     """
     사용자의 메모리 목록을 조회합니다.
 
-    - date 없음: 최신순 paginated list (limit, offset 사용)
+    - date 없음: 최신순 paginated list
+      - cursor 사용 권장: 응답의 next_cursor를 다음 요청의 cursor로 전달 (없으면 마지막 페이지)
+      - offset: 하위 호환용 (cursor가 있으면 무시)
     - date 있음: 해당 날짜의 메모리 목록 (YYYY-MM-DD)
     - X-Timezone 헤더로 시간대 지정 가능
     """
     user_id = request.user.user.id
     timezone = request.state.timezone
+    next_cursor = None
 
     if date is not None:
         target_date = date_from_str(date)
@@ -101,23 +161,16 @@ async def get_memories(
             return ResponseProvider.failed(status_code=400, message="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)")
         memories = await memory_repository.get_by_date(target_date=target_date, user_id=user_id, timezone=timezone)
     else:
-        memories = await memory_repository.get_all(user_id=user_id, limit=limit, offset=offset)
-
-    response_data = [
-        {
-            "id": m.id,
-            "type": m.type,
-            "keywords": m.keywords,
-            "content": m.content,
-            "metadata_": m.metadata_,
-            "original_text": m.original_text,
-            "created_at": format_datetime_for_timezone(m.created_at, timezone),
-            "updated_at": format_datetime_for_timezone(m.updated_at, timezone),
-        }
-        for m in memories
-    ]
+        memories = await memory_repository.get_all(
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            cursor=Cursor.decode(cursor) if cursor else None,
+        )
+        next_cursor = Cursor.next(memories, limit, lambda m: (m.created_at, m.id))
 
-    return ResponseProvider.success(response_data)
+    response_data = [MemoryResponse.model_validate(m) for m in memories]
+    return ResponseProvider.paginated(response_data, next_cursor, timezone=timezone)
 
 
 @router.get("/memories/calendar", response_model=Response[dict[str, int]], status_code=status.HTTP_200_OK)
@@ -125,21 +178,98 @@ async def get_memories(
 @inject
 async def get_calendar_marks(
     request: Request,
-    memory_repository: Annotated[
-        MemoryRepository,
-        Depends(Provide[Container.memory_repository]),
+    memory_calendar_service: Annotated[
+        MemoryCalendarService,
+        Depends(Provide[Container.memory_calendar_service]),
     ],
-) -> JSONResponse:
+    start: str | None = None,
+    end: str | None = None,
+) -> HTTPResponse:
     """
     메모리가 있는 날짜와 개수를 반환합니다 (캘린더 마킹용).
 
+    - start/end: 조회할 월 범위 (YYYY-MM, 양 끝 포함). 하나만 주면 그 달만 조회, 없으면 전체 기간
     - 응답: {"YYYY-MM-DD": count, ...}
+    - ETag 헤더 제공: If-None-Match가 같으면 304 응답
     - X-Timezone 헤더로 시간대 지정 가능
     """
     user_id = request.user.user.id
 
-    marks = await memory_repository.get_calendar_marks(user_id=user_id, timezone=request.state.timezone)
-    return ResponseProvider.success(marks)
+    start_month = month_from_str(start) if start is not None else None
+    end_month = month_from_str(end) if end is not None else None
+    if (start is not None and start_month is None) or (end is not None and end_month is None):
+        return ResponseProvider.failed(status_code=400, message="월 형식이 올바르지 않습니다 (YYYY-MM)")
+
+    result = await memory_calendar_service.get_marks(
+        user_id=user_id,
+        timezone=request.state.timezone,
+        start_month=start_month or end_month,
+        end_month=end_month or start_month,
+    )
+    headers = {"ETag": result.etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == result.etag:
+        return HTTPResponse(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = ResponseProvider.success(result.marks)
+    response.headers.update(headers)
+    return response
+
+
+@router.post(
+    "/memories/import",
+    response_model=Response[MemoryImportJobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@requires("authenticated")
+@inject
+async def import_memories(
+    request: Request,
+    body: MemoryImportRequest,
+    memory_import_service: Annotated[
+        MemoryImportService,
+        Depends(Provide[Container.memory_import_service]),
+    ],
+) -> JSONResponse:
+    """
+    다른 앱의 메모를 일괄로 가져옵니다 (백그라운드 작업).
+
+    - items: 메모 텍스트 목록 (항목당 하나의 Memory, 의도 분류 없이 저장)
+    - 응답의 job_id로 진행 상태를 조회
+    - X-Timezone 헤더 기준으로 알림 시각 계산
+    """
+    user_id = request.user.user.id
+    job = await memory_import_service.start_import(
+        items=body.items,
+        user_id=user_id,
+        timezone=request.state.timezone,
+    )
+    return ResponseProvider.accepted(job)
+
+
+@router.get(
+    "/memories/import/{job_id}",
+    response_model=Response[MemoryImportJobResponse],
+    status_code=status.HTTP_200_OK,
+)
+@requires("authenticated")
+@inject
+async def get_import_job(
+    request: Request,
+    job_id: str,
+    memory_import_service: Annotated[
+        MemoryImportService,
+        Depends(Provide[Container.memory_import_service]),
+    ],
+) -> JSONResponse:
+    """
+    메모 일괄 가져오기 작업의 진행 상태를 조회합니다.
+
+    - status: pending, running, completed, failed
+    - parsed/saved/failed: 단계별 처리 항목 수
+    """
+    user_id = request.user.user.id
+    job = await memory_import_service.get_job(job_id, user_id)
+    return ResponseProvider.success(job)
 
 
 def date_from_str(date_str: str) -> date | None:
@@ -150,6 +280,14 @@ def date_from_str(date_str: str) -> date | None:
         return None
 
 
+def month_from_str(month_str: str) -> date | None:
+    """YYYY-MM 문자열을 해당 월 1일의 date 객체로 변환합니다."""
+    try:
+        return date.fromisoformat(f"{month_str}-01")
+    except ValueError:
+        return None
+
+
 @router.delete("/memories/{memory_id}", response_model=Response[None], status_code=status.HTTP_200_OK)
 @requires("authenticated")
 @inject
@@ -160,6 +298,10 @@ async def delete_memory(
         MemoryRepository,
         Depends(Provide[Container.memory_repository]),
     ],
+    memory_calendar_service: Annotated[
+        MemoryCalendarService,
+        Depends(Provide[Container.memory_calendar_service]),
+    ],
 ) -> JSONResponse:
     """
     메모리를 삭제합니다.
@@ -169,12 +311,12 @@ async def delete_memory(
     """
     user_id = request.user.user.id
 
-    # 메모리 조회 (본인 것만)
-    memory = await memory_repository.get_by_id(memory_id, user_id=user_id)
+    # 삭제 (본인 것만, 조회 없이 DELETE ... RETURNING 한 번으로 처리)
+    memory = await memory_repository.delete_by_id(memory_id, user_id=user_id)
     if memory is None:
         return ResponseProvider.failed(status_code=404, message="메모리를 찾을 수 없습니다")
 
-    # 삭제
-    await memory_repository.delete(memory)
+    # 요청 단위 세션이 커밋된 뒤 무효화 (커밋 전에 다른 요청이 삭제 전 개수를 다시 캐시하지 않도록)
+    await on_commit(lambda: memory_calendar_service.invalidate(user_id))
 
     return ResponseProvider.success(None)
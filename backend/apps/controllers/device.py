@@ -38,7 +38,7 @@ async def register_device_token(
         platform=data.platform,
     )
     response = DeviceTokenResponse.model_validate(device_token)
-    return ResponseProvider.success(response.model_dump(mode="json"))
+    return ResponseProvider.success(response)
 
 
 @router.post("/test-push", response_model=Response[None], status_code=200)
@@ -67,11 +67,12 @@ async def update_notification(
     device_token = await device_token_repository.update_is_active(
         token=data.token,
         is_active=data.is_active,
+        user_id=request.user.user.id,
     )
     if device_token is None:
         return ResponseProvider.failed(404, "등록되지 않은 토큰입니다.")
     response = DeviceTokenResponse.model_validate(device_token)
-    return ResponseProvider.success(response.model_dump(mode="json"))
+    return ResponseProvider.success(response)
 
 
 @router.delete("", response_model=Response[None], status_code=200)
@@ -83,5 +84,5 @@ async def delete_device_token(
     device_token_repository: Annotated[DeviceTokenRepository, Depends(Provide[Container.device_token_repository])],
 ) -> JSONResponse:
     """FCM 디바이스 토큰을 삭제합니다."""
-    await device_token_repository.delete_by_token(token=data.token)
+    await device_token_repository.delete_by_token(token=data.token, user_id=request.user.user.id)
     return ResponseProvider.success(None)
@@ -0,0 +1,37 @@
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from apps.services.lifecycle import LifecycleService
+from containers import Container
+
+router = APIRouter(
+    tags=["health"],
+    include_in_schema=False,
+)
+
+
+@router.get("/health")
+async def health() -> JSONResponse:
+    """liveness 확인 - 프로세스가 응답하면 항상 200 (외부 의존성은 확인하지 않음)"""
+    return JSONResponse(content={"status": "ok"})
+
+
+@router.get("/ready")
+@inject
+async def ready(
+    lifecycle_service: Annotated[
+        LifecycleService,
+        Depends(Provide[Container.lifecycle_service]),
+    ],
+) -> JSONResponse:
+    """
+    readiness 확인 - warm-up이 끝났으면 200, 시작/종료 중이면 503
+
+    로드 밸런서/쿠버네티스 readinessProbe에 연결해서 warm-up 전이나 종료 중인 프로세스로
+    트래픽이 가지 않게 합니다.
+    """
+    status_code = status.HTTP_200_OK if lifecycle_service.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(status_code=status_code, content=lifecycle_service.readiness().model_dump(mode="json"))
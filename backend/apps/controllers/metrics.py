@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from apps.metrics import render_metrics
+
+router = APIRouter(
+    tags=["metrics"],
+    include_in_schema=False,
+)
+
+
+@router.get("/metrics")
+async def get_metrics() -> Response:
+    """
+    Prometheus 지표를 반환합니다 (MetricsConfig.enabled일 때만 등록).
+
+    인증 없이 노출되므로 외부에서는 접근하지 못하도록 ingress/프록시에서 막아야 합니다.
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
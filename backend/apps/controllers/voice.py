@@ -1,7 +1,7 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, WebSocket
+from fastapi import APIRouter, Depends, Query, WebSocket, status
 from fastapi.responses import JSONResponse
 from starlette.authentication import requires
 
@@ -12,6 +12,7 @@ from apps.schemas.voice import (
     TranscribeRequest,
     TranscribeResponse,
 )
+from apps.services.lifecycle import LifecycleService
 from apps.services.streaming_voice import StreamingVoiceService
 from apps.services.voice import VoiceService
 from apps.services.voice_session import VoiceSessionService
@@ -59,6 +60,10 @@ async def stream_transcribe(
         VoiceSessionService,
         Depends(Provide[Container.voice_session_service]),
     ],
+    lifecycle_service: Annotated[
+        LifecycleService,
+        Depends(Provide[Container.lifecycle_service]),
+    ],
     language: LanguageCode | None = Query(default=None),
     sample_rate: int = Query(default=16000),
 ) -> None:
@@ -77,6 +82,11 @@ async def stream_transcribe(
         - 샘플레이트: 16000Hz (또는 query로 지정)
         - 채널: 모노
     """
+    # 종료 중이면 거절 (클라이언트는 다른 서버로 재연결)
+    if not lifecycle_service.accepting_streams:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
     await websocket.accept()
 
     # 인증된 사용자 정보 추출 (websocket.user는 AuthenticationMiddleware가 설정)
@@ -91,4 +101,6 @@ async def stream_transcribe(
         language=language,
         sample_rate=sample_rate,
     )
-    await consumer.handle()
+    # 종료 시 녹음 저장/VoiceSession 생성까지 끝날 때까지 기다리도록 등록
+    with lifecycle_service.track_stream():
+        await consumer.handle()
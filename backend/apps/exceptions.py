@@ -56,6 +56,16 @@ class VoiceProcessingError(AppException):
         )
 
 
+class AIUnavailableError(AppException):
+    """LLM/임베딩을 일시적으로 사용할 수 없음 (서킷 브레이커 차단, 대기/제한 시간 초과)"""
+
+    def __init__(self, message: str | None = None):
+        super().__init__(
+            message or _("AI service is temporarily unavailable. Please try again later."),
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
 class ValidationErrorDetail(BaseModel):
     field: str
     message: str
@@ -0,0 +1,185 @@
+"""
+Prometheus 지표 정의
+
+지표는 모듈 전역에 한 번만 정의하고, 각 모듈에서 import해서 기록합니다.
+PROMETHEUS_MULTIPROC_DIR가 지정되어 있으면 프로세스별 파일에 기록하고 조회 시 합칩니다
+(uvicorn 워커 여러 개, Celery prefork 자식 프로세스). 이 환경 변수는 prometheus_client를
+처음 import하기 전에 설정되어 있어야 합니다.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+from apps.types.ai_log import AILogStep
+
+logger = logging.getLogger(__name__)
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (route는 경로 템플릿)",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "websocket_connections",
+    "연결 중인 WebSocket 수",
+    multiprocess_mode="livesum",
+)
+
+# LLM / 임베딩 (step: AILogStep)
+AI_CALL_DURATION = Histogram(
+    "ai_call_duration_seconds",
+    "LLM/임베딩 호출 시간",
+    ["step", "model"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60),
+)
+AI_CALL_ERRORS = Counter(
+    "ai_call_errors_total",
+    "LLM/임베딩 호출 실패 수",
+    ["step", "model", "error"],
+)
+AI_GUARD_STATE = Gauge(
+    "ai_guard_circuit_state",
+    "LLM/임베딩 서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)",
+    ["dependency"],
+    multiprocess_mode="livemax",
+)
+AI_GUARD_REJECTIONS = Counter(
+    "ai_guard_rejections_total",
+    "거절(open, queue_timeout)하거나 제한 시간으로 중단(deadline)한 LLM/임베딩 호출 수",
+    ["dependency", "reason"],
+)
+AI_COALESCED_CALLS = Counter(
+    "ai_coalesced_calls_total",
+    "진행 중인 같은 호출의 결과를 받아 생략한 LLM/임베딩 호출 수 (scope: process, redis)",
+    ["step", "scope"],
+)
+EMBEDDING_BATCH_SIZE = Histogram(
+    "embedding_batch_size",
+    "EmbeddingBatcher가 한 번에 보낸 텍스트 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 100),
+)
+
+# STT 스트리밍
+STT_STREAM_DURATION = Histogram(
+    "stt_stream_duration_seconds",
+    "STT 스트림 시작부터 종료까지 걸린 시간",
+    buckets=(1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+STT_FIRST_RESULT = Histogram(
+    "stt_time_to_first_result_seconds",
+    "STT 스트림 시작부터 첫 인식 결과까지 걸린 시간",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10),
+)
+
+# DB 연결 풀 (pool: primary 또는 복제본 host:port)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "연결 풀 연결 수 (state: in_use, idle, overflow)",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "연결 풀 체크아웃 대기 시간",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+DB_POOL_OVERFLOW_CHECKOUTS = Counter(
+    "db_pool_overflow_checkouts_total",
+    "overflow 연결을 사용한 체크아웃 수",
+    ["pool"],
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "pool_timeout 초과로 실패한 체크아웃 수",
+    ["pool"],
+)
+
+# Redis
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 응답 시간",
+    ["command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+
+# 리마인더 / 푸시
+REMINDER_LAG = Histogram(
+    "reminder_lag_seconds",
+    "리마인더 발송 지연 (발송 시각 - next_run_at)",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+)
+PUSH_NOTIFICATIONS = Counter(
+    "push_notifications_total",
+    "FCM 푸시 전송 결과 (기기 토큰 기준)",
+    ["result"],
+)
+
+
+@contextmanager
+def track_ai_call(step: AILogStep, model: str | None) -> Iterator[None]:
+    """
+    LLM/임베딩 호출 시간과 실패를 기록합니다.
+
+    사용 예:
+        with track_ai_call(AILogStep.EMBEDDING, self.config.embedding_model):
+            embedding = await self.embeddings.aembed_query(text)
+    """
+    labels = {"step": step.value, "model": model or ""}
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        AI_CALL_ERRORS.labels(**labels, error=type(e).__name__).inc()
+        raise
+    finally:
+        AI_CALL_DURATION.labels(**labels).observe(time.perf_counter() - started)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def _collector_registry() -> CollectorRegistry:
+    """multiprocess 모드면 모든 프로세스의 지표를 합친 registry를, 아니면 기본 registry를 반환합니다."""
+    if not multiprocess_enabled():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus text format으로 지표를 렌더링합니다 (본문, Content-Type)."""
+    return generate_latest(_collector_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int) -> None:
+    """별도 HTTP 서버로 지표를 노출합니다 (Celery 워커용)."""
+    if not multiprocess_enabled():
+        # prefork 자식 프로세스에서 기록한 지표는 부모 프로세스 registry에 보이지 않음
+        logger.warning("PROMETHEUS_MULTIPROC_DIR is not set; metrics from worker child processes are not exported")
+    start_http_server(port, registry=_collector_registry())
+
+
+def mark_process_dead(pid: int) -> None:
+    """종료된 프로세스의 live gauge 값을 정리합니다 (multiprocess 모드)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
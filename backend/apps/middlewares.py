@@ -1,8 +1,18 @@
-from collections.abc import Awaitable, Callable
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from apps.cache import RedisCache
+from apps.metrics import HTTP_REQUEST_DURATION
+from database import Database, read_routing
+
+logger = logging.getLogger(__name__)
 
 RequestResponseEndpoint = Callable[[Request], Awaitable[Response]]
 
@@ -12,3 +22,132 @@ class TimezoneMiddleware(BaseHTTPMiddleware):
         request.state.timezone = request.headers.get("X-Timezone", "Asia/Seoul")
         response = await call_next(request)
         return response
+
+
+class RequestSessionMiddleware:
+    """
+    요청 단위 DB 세션 미들웨어 (DatabaseConfig.request_scope로 활성화)
+
+    요청마다 repository 호출이 각자 세션을 열고 커밋하는 대신, 요청 전체가 세션 하나를 공유합니다.
+    인증(SessionAuthBackend)까지 같은 세션을 쓰도록 AuthenticationMiddleware보다 바깥에 등록합니다.
+
+    - 세션은 첫 DB 접근 시점에 생성 (DB를 쓰지 않는 요청은 연결을 잡지 않음)
+    - 응답 시작 직전에 한 번 커밋하므로, 클라이언트는 커밋된 결과만 받음
+    - 쓰기가 없는 요청은 COMMIT을 보내지 않음
+    - 상태 코드 400 이상이면 커밋하지 않음 (요청 전체가 롤백)
+    - @transactional 블록은 SAVEPOINT로 처리되어 블록 단위 롤백이 유지됨
+
+    LLM 호출처럼 오래 걸리는 경로는 exclude_paths로 제외해 연결을 붙잡지 않습니다.
+    BaseHTTPMiddleware는 응답 시작 시점을 가로챌 수 없으므로 순수 ASGI 미들웨어로 구현합니다.
+    """
+
+    def __init__(self, app: ASGIApp, database: Database, exclude_paths: Sequence[str] = ()):
+        self.app = app
+        self.database = database
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        async with self.database.request_scope() as request_scope:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # 커밋이 실패하면 예외가 전파되어 500 응답으로 처리됨
+                    await request_scope.finish(commit=message["status"] < 400)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class ReadReplicaMiddleware:
+    """
+    읽기 복제본 read-your-writes 미들웨어 (DatabaseConfig.replicas가 있을 때 등록)
+
+    사용자가 쓰기를 하면 Redis에 표시를 남기고, read_your_writes_seconds 동안 그 사용자의
+    session(readonly=True) 읽기도 primary로 보냅니다. 복제 지연 때문에 방금 저장한 데이터가
+    목록에서 빠져 보이는 일을 막습니다.
+
+    인증된 사용자를 알아야 하므로 AuthenticationMiddleware 안쪽에 등록합니다.
+    표시는 복제본 읽기 세션을 처음 열 때만 조회하고, Redis 오류는 기록만 하고 넘어갑니다
+    (조회 실패는 표시 없음으로 처리 → 복제본에서 읽음).
+    """
+
+    STICKY_KEY_PREFIX = "db_primary_reads:"
+
+    def __init__(self, app: ASGIApp, redis_cache: RedisCache, sticky_seconds: int):
+        self.app = app
+        self.redis_cache = redis_cache
+        self.sticky_seconds = sticky_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        user = scope.get("user")
+        if scope["type"] != "http" or user is None or not user.is_authenticated:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{self.STICKY_KEY_PREFIX}{user.user.id}"
+
+        with read_routing(sticky=partial(self._is_sticky, key)) as routing:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and routing.wrote:
+                    await self._mark_sticky(key)
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+    async def _is_sticky(self, key: str) -> bool:
+        try:
+            return await self.redis_cache.get(key) is not None
+        except Exception as e:
+            logger.warning("Read-your-writes lookup failed, reading from replica: %r", e)
+            return False
+
+    async def _mark_sticky(self, key: str) -> None:
+        try:
+            await self.redis_cache.set(key, "1", ex=self.sticky_seconds)
+        except Exception as e:
+            logger.warning("Read-your-writes mark failed: %r", e)
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 처리 시간 지표 미들웨어 (MetricsConfig.enabled로 활성화)
+
+    route 레이블에는 실제 경로 대신 라우트 템플릿(예: /api/v1/memories/{memory_id})을 써서
+    경로 파라미터 값마다 시계열이 늘어나지 않게 합니다. 라우트에 매칭되지 않은 요청(404, 정적 파일)은
+    UNMATCHED_ROUTE 하나로 모읍니다. 다른 미들웨어 처리 시간까지 포함되도록 가장 바깥에 등록합니다.
+    """
+
+    UNMATCHED_ROUTE = "unmatched"
+
+    def __init__(self, app: ASGIApp, exclude_paths: Sequence[str] = ("/metrics", "/health", "/ready")):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        # 응답을 시작하기 전에 예외가 나면 ServerErrorMiddleware가 500으로 응답함
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # FastAPI 라우터가 매칭된 APIRoute를 scope["route"]에 남김
+            route = getattr(scope.get("route"), "path", self.UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - started
+            )
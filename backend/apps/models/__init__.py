@@ -1,19 +1,22 @@
-from .ai_log import AIProcessingLog
+from .ai_log import AIProcessingLog, AIProcessingLogDaily
 from .conversation import Conversation
 from .device_token import DeviceToken
 from .links import ConversationMemoryLink, ConversationReminderLink
 from .memory import Memory
+from .memory_count import MemoryHourlyCount
 from .reminder import Reminder
 from .user import User
 from .voice import VoiceSession
 
 __all__ = [
     "AIProcessingLog",
+    "AIProcessingLogDaily",
     "Conversation",
     "ConversationMemoryLink",
     "ConversationReminderLink",
     "DeviceToken",
     "Memory",
+    "MemoryHourlyCount",
     "Reminder",
     "User",
     "VoiceSession",
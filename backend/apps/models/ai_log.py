@@ -1,38 +1,53 @@
 """AI 처리 로그 모델"""
 
+from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import JSON, Text
-from sqlmodel import Field
+from sqlalchemy import JSON, Column, Date, DateTime, Index, String, Text
+from sqlmodel import Field, SQLModel
 
 from apps.models.base import BaseModel
 
 
 class AIProcessingLog(BaseModel, table=True):
-    """AI 처리 단계별 로그 - 디버깅 및 성능 분석용"""
+    """
+    AI 처리 단계별 로그 - 디버깅 및 성능 분석용
+
+    created_at 기준 월별 RANGE 파티션 테이블입니다 (ai_processing_log_pYYYYMM).
+    파티션 생성/삭제와 일별 집계는 apps.tasks.ai_log.maintain_ai_log가 처리합니다.
+    쓰기 비용을 줄이기 위해 외래 키는 두지 않습니다.
+    """
 
     __tablename__ = "ai_processing_log"
+    __table_args__ = (
+        Index("ix_ai_processing_log_user_id_created_at", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # 파티션 키는 기본 키에 포함되어야 하므로 (id, created_at) 복합 키
+    id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    created_at: datetime = Field(  # type: ignore[call-overload]
+        default_factory=lambda: datetime.now(UTC),
+        sa_type=DateTime(timezone=True),
+        primary_key=True,
+    )
 
     # 연결된 Conversation (nullable - Conversation 생성 전 로그도 있을 수 있음)
     conversation_id: int | None = Field(
         default=None,
-        foreign_key="conversation.id",
         index=True,
         description="연결된 Conversation ID",
     )
 
-    # 사용자 ID
+    # 사용자 ID - 조회는 ix_ai_processing_log_user_id_created_at 인덱스 사용
     user_id: int | None = Field(
         default=None,
-        foreign_key="user.id",
-        index=True,
         description="사용자 ID",
     )
 
     # AI 처리 단계
     step: str = Field(
         max_length=50,
-        index=True,
         description="처리 단계 (intent_classification, text_parsing, answer_generation)",
     )
 
@@ -61,3 +76,25 @@ class AIProcessingLog(BaseModel, table=True):
         default=None,
         description="처리 소요 시간 (ms)",
     )
+
+
+class AIProcessingLogDaily(SQLModel, table=True):
+    """
+    AI 처리 로그 일별 집계 (UTC 날짜/단계/모델)
+
+    원본 로그 파티션이 보관 기간이 지나 삭제되어도 분석에 필요한 지표는 이 테이블에 남습니다.
+    """
+
+    __tablename__ = "ai_processing_log_daily"
+
+    day: date = Field(sa_column=Column(Date, primary_key=True))
+    step: str = Field(sa_column=Column(String(50), primary_key=True))
+    # 모델 정보가 없는 로그는 빈 문자열로 집계
+    model_name: str = Field(sa_column=Column(String(100), primary_key=True, server_default=""))
+    count: int = Field(default=0, nullable=False)
+    # 처리 시간 통계 (ms, processing_time_ms가 있는 로그 기준)
+    avg_ms: float | None = Field(default=None)
+    p50_ms: float | None = Field(default=None)
+    p95_ms: float | None = Field(default=None)
+    p99_ms: float | None = Field(default=None)
+    max_ms: int | None = Field(default=None)
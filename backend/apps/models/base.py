@@ -1,10 +1,15 @@
 from datetime import UTC, datetime
+from typing import Any, ClassVar
 
 from sqlalchemy import DateTime, func
 from sqlmodel import Field, SQLModel
 
 
 class BaseModel(SQLModel):
+    # INSERT/UPDATE 시 서버에서 정해지는 값(id, onupdate의 updated_at 등)을 RETURNING으로 함께 받아
+    # flush 후 refresh(SELECT) 없이 바로 사용할 수 있게 합니다.
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
+
     id: int | None = Field(
         default=None,
         primary_key=True,
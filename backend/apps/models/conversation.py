@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 from sqlmodel import Field, Relationship
 
 from apps.models.base import BaseModel
@@ -17,6 +17,8 @@ class Conversation(BaseModel, table=True):
     """대화 처리 결과 모델 - AI 처리 및 생성된 데이터 관계 저장"""
 
     __tablename__ = "conversation"
+    # 사용자별 최신순 목록 keyset 페이지네이션용
+    __table_args__ = (Index("ix_conversation_user_id_created_at_id", "user_id", "created_at", "id"),)
 
     voice_session_id: int = Field(
         foreign_key="voice_session.id",
@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING, Any
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column
+from sqlalchemy import Column, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, Relationship
 
 from apps.models.base import BaseModel
@@ -14,9 +15,22 @@ if TYPE_CHECKING:
     from apps.models.user import User
 
 
+# 임베딩 컬럼 (3072차원, 행당 약 12KB) - 기본 지연 로딩
+_embedding_column = Column("embedding", Vector(3072))
+
+
 class Memory(BaseModel, table=True):
     """통합 정보 기억 모델 - 물품, 장소, 일정, 인물, 메모 등 모든 정보 저장"""
 
+    __table_args__ = (
+        # 사용자별 최신순 목록 keyset 페이지네이션용 (역방향 스캔으로 DESC 정렬도 처리)
+        Index("ix_memory_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 임베딩 없이 저장된 Memory 찾기용 (임베딩 채우기) - 평소에는 거의 비어 있음
+        Index("ix_memory_embedding_missing", "id", postgresql_where=text("embedding IS NULL")),
+    )
+    # embedding은 조회 시 SELECT에서 제외 (필요하면 undefer(Memory.embedding)로 명시적으로 로딩)
+    __mapper_args__ = {**BaseModel.__mapper_args__, "properties": {"embedding": deferred(_embedding_column)}}
+
     # 정보 유형
     type: MemoryType = Field(nullable=False, index=True)
 
@@ -39,14 +53,14 @@ class Memory(BaseModel, table=True):
     # 원본 입력 텍스트
     original_text: str = Field(nullable=False)
 
-    # 임베딩 벡터 (pgvector)
+    # 임베딩 벡터 (pgvector) - 지연 로딩, 벡터 검색은 SQL 안에서만 사용
     embedding: list[float] | None = Field(
         default=None,
-        sa_column=Column(Vector(3072)),
+        sa_column=_embedding_column,
     )
 
-    # 사용자 ID (멀티유저 지원 시)
-    user_id: int | None = Field(default=None, foreign_key="user.id", index=True)
+    # 사용자 ID (멀티유저 지원 시) - 조회는 ix_memory_user_id_created_at_id 인덱스 사용
+    user_id: int | None = Field(default=None, foreign_key="user.id")
 
     ####### Relationship #######
     user: "User" = Relationship(back_populates="memories")
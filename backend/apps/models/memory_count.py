@@ -0,0 +1,28 @@
+"""Memory 개수 집계(rollup) 모델"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlmodel import Field, SQLModel
+
+
+class MemoryHourlyCount(SQLModel, table=True):
+    """
+    사용자별 Memory 개수 - UTC 1시간 단위 버킷
+
+    캘린더 마킹용 집계 테이블로, Memory 생성/삭제 시 같은 트랜잭션에서 증감합니다.
+    시간 단위로 저장하므로 조회 시 어떤 시간대로도 날짜별 합계를 계산할 수 있습니다.
+    """
+
+    __tablename__ = "memory_hourly_count"
+
+    user_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    # 버킷 시작 시각 (UTC, 정시로 절삭)
+    bucket: datetime = Field(sa_column=Column(DateTime(timezone=True), primary_key=True))
+    count: int = Field(default=0, nullable=False)
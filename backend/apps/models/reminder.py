@@ -2,7 +2,7 @@ from datetime import date, datetime
 from datetime import time as _time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy import Time as SATime
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Field, Relationship
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 class Reminder(BaseModel, table=True):
     """알림 스케줄 모델"""
 
+    # 사용자별 다음 실행 시각순 목록 keyset 페이지네이션용
+    __table_args__ = (Index("ix_reminder_user_id_next_run_at_id", "user_id", "next_run_at", "id"),)
+
     # Memory 연결 (알림 대상 정보) - CASCADE 삭제
     memory_id: int = Field(
         sa_column=Column(
@@ -61,8 +64,8 @@ class Reminder(BaseModel, table=True):
     # 상태
     status: ReminderStatus = Field(default=ReminderStatus.ACTIVE, nullable=False, index=True)
 
-    # 사용자 ID
-    user_id: int | None = Field(default=None, foreign_key="user.id", index=True)
+    # 사용자 ID - 조회는 ix_reminder_user_id_next_run_at_id 인덱스 사용
+    user_id: int | None = Field(default=None, foreign_key="user.id")
 
     # Relationships
     conversations: list["Conversation"] = Relationship(
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlmodel import Field, Relationship
 
 from apps.models.base import BaseModel
@@ -14,6 +14,8 @@ class VoiceSession(BaseModel, table=True):
     """음성 세션 모델 - STT 결과 및 사용자 확인 저장"""
 
     __tablename__ = "voice_session"
+    # 사용자별 최신순 목록 keyset 페이지네이션용
+    __table_args__ = (Index("ix_voice_session_user_id_created_at_id", "user_id", "created_at", "id"),)
 
     session_id: UUID = Field(
         default_factory=uuid4,
@@ -1,16 +1,30 @@
 """AI 처리 로그 저장소"""
 
+import re
+from datetime import UTC, date, datetime, time
 from typing import Any
 
-from sqlalchemy import desc
+from sqlalchemy import Date, cast, desc, func, insert, literal, text
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
 
-from apps.models.ai_log import AIProcessingLog
+from apps.models.ai_log import AIProcessingLog, AIProcessingLogDaily
+from apps.utils.datetime_utils import add_months
 from database import Database
 
 
 class AIProcessingLogRepository:
-    """AI 처리 로그 저장소"""
+    """
+    AI 처리 로그 저장소
+
+    ai_processing_log는 월별 파티션(ai_processing_log_pYYYYMM) 테이블이며,
+    파티션 생성/삭제와 일별 집계(ai_processing_log_daily)도 이 저장소에서 처리합니다.
+    """
+
+    PARTITION_PREFIX = "ai_processing_log_p"
+    _PARTITION_NAME = re.compile(r"^ai_processing_log_p(\d{4})(\d{2})$")
 
     def __init__(self, database: Database):
         self.database = database
@@ -20,9 +34,15 @@ class AIProcessingLogRepository:
         async with self.database.session() as session:
             session.add(log)
             await session.flush()
-            await session.refresh(log)
             return log
 
+    async def bulk_create(self, logs: list[AIProcessingLog]) -> None:
+        """여러 로그를 multi-row INSERT로 한 번에 생성합니다 (생성된 행은 다시 읽지 않음)."""
+        if not logs:
+            return
+        async with self.database.session() as session:
+            await session.execute(insert(AIProcessingLog), [log.model_dump(exclude={"id"}) for log in logs])
+
     async def create_log(
         self,
         step: str,
@@ -70,3 +90,107 @@ class AIProcessingLogRepository:
             stmt = stmt.order_by(desc(col(AIProcessingLog.created_at))).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
+
+    async def ensure_partitions(self, start: date, months: int) -> list[str]:
+        """start가 속한 달부터 months개월의 월별 파티션을 만들고, 새로 만든 파티션 이름을 반환합니다."""
+        created = []
+        async with self.database.session() as session:
+            existing = set(await self._partition_names(session))
+            for offset in range(months):
+                month = add_months(start, offset)
+                name = f"{self.PARTITION_PREFIX}{month:%Y%m}"
+                if name in existing:
+                    continue
+                lower = datetime.combine(month, time.min, tzinfo=UTC)
+                upper = datetime.combine(add_months(month, 1), time.min, tzinfo=UTC)
+                await session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {AIProcessingLog.__tablename__} "
+                        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+                    )
+                )
+                created.append(name)
+        return created
+
+    async def drop_partitions_before(self, cutoff: date) -> list[str]:
+        """
+        cutoff가 속한 달 이전의 월별 파티션을 삭제하고, 삭제한 파티션 이름을 반환합니다.
+
+        삭제 전에 해당 달을 다시 집계하므로, 집계 작업이 밀렸더라도 일별 지표는 남습니다.
+        """
+        cutoff_month = cutoff.replace(day=1)
+        dropped = []
+        async with self.database.session() as session:
+            for name in sorted(await self._partition_names(session)):
+                matched = self._PARTITION_NAME.match(name)
+                if matched is None:
+                    continue
+                month = date(int(matched[1]), int(matched[2]), 1)
+                if month >= cutoff_month:
+                    continue
+                await self._rollup(session, month, add_months(month, 1))
+                await session.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+        return dropped
+
+    async def rollup(self, start: date, end: date) -> None:
+        """UTC 날짜 구간 [start, end)의 로그를 일/단계/모델별로 집계합니다 (다시 실행하면 덮어씀)."""
+        async with self.database.session() as session:
+            await self._rollup(session, start, end)
+
+    @staticmethod
+    async def _rollup(session: AsyncSession, start: date, end: date) -> None:
+        created_at = col(AIProcessingLog.created_at)
+        elapsed = col(AIProcessingLog.processing_time_ms)
+        day = cast(func.timezone("UTC", created_at), Date)
+        model_name = func.coalesce(col(AIProcessingLog.model_name), literal(""))
+
+        def percentile(fraction: float) -> Any:
+            return func.percentile_cont(fraction).within_group(elapsed.asc())
+
+        # sqlmodel.select는 컬럼 4개까지만 지원
+        summary = (
+            sa_select(
+                day,
+                col(AIProcessingLog.step),
+                model_name,
+                func.count(),
+                func.avg(elapsed),
+                percentile(0.5),
+                percentile(0.95),
+                percentile(0.99),
+                func.max(elapsed),
+            )
+            .where(
+                created_at >= datetime.combine(start, time.min, tzinfo=UTC),
+                created_at < datetime.combine(end, time.min, tzinfo=UTC),
+            )
+            .group_by(day, col(AIProcessingLog.step), model_name)
+        )
+        stmt = pg_insert(AIProcessingLogDaily).from_select(
+            ["day", "step", "model_name", "count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"],
+            summary,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", "step", "model_name"],
+            set_={
+                column: stmt.excluded[column] for column in ("count", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+            },
+        )
+        await session.execute(stmt)
+
+    @staticmethod
+    async def _partition_names(session: AsyncSession) -> list[str]:
+        """ai_processing_log의 파티션 이름 목록을 조회합니다."""
+        result = await session.execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:parent AS regclass)
+                """
+            ),
+            {"parent": AIProcessingLog.__tablename__},
+        )
+        return list(result.scalars().all())
@@ -1,8 +1,9 @@
-from sqlalchemy import desc
+from sqlalchemy import desc, literal, tuple_
 from sqlmodel import col, select
 
 from apps.models.conversation import Conversation
 from apps.models.links import ConversationMemoryLink, ConversationReminderLink
+from apps.utils.pagination import Cursor
 from database import Database
 
 
@@ -28,16 +29,43 @@ class ConversationRepository:
             result = await session.execute(stmt)
             return result.scalar_one_or_none()
 
-    async def get_all_by_user(self, user_id: int, limit: int = 100, offset: int = 0) -> list[Conversation]:
-        """사용자의 Conversation 목록을 조회합니다."""
+    async def get_linked_ids(self, conversation_id: int) -> tuple[list[int], list[int]]:
+        """Conversation에 연결된 (Memory ID 목록, Reminder ID 목록)을 조회합니다."""
         async with self.database.session() as session:
-            stmt = (
-                select(Conversation)
-                .where(Conversation.user_id == user_id)
-                .order_by(desc(col(Conversation.created_at)))
-                .limit(limit)
-                .offset(offset)
+            memory_ids = await session.scalars(
+                select(ConversationMemoryLink.memory_id).where(
+                    ConversationMemoryLink.conversation_id == conversation_id
+                )
             )
+            reminder_ids = await session.scalars(
+                select(ConversationReminderLink.reminder_id).where(
+                    ConversationReminderLink.conversation_id == conversation_id
+                )
+            )
+            return list(memory_ids.all()), list(reminder_ids.all())
+
+    async def get_all_by_user(
+        self,
+        user_id: int,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> list[Conversation]:
+        """
+        사용자의 Conversation 목록을 조회합니다 (최신순).
+
+        cursor가 있으면 (created_at, id) 기준 keyset 페이지네이션을 사용하며 offset은 무시됩니다.
+        """
+        async with self.database.session(readonly=True) as session:
+            stmt = select(Conversation).where(Conversation.user_id == user_id)
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(col(Conversation.created_at), col(Conversation.id))
+                    < tuple_(literal(cursor.value), literal(cursor.id))
+                )
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(desc(col(Conversation.created_at)), desc(col(Conversation.id))).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
@@ -75,5 +103,4 @@ class ConversationRepository:
                     session.add(reminder_link)
 
             await session.flush()
-            await session.refresh(conversation)
             return conversation
@@ -1,3 +1,5 @@
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import col, select
 
 from apps.models.device_token import DeviceToken
@@ -28,45 +30,45 @@ class DeviceTokenRepository:
             return list(result.scalars().all())
 
     async def upsert(self, user_id: int, token: str, platform: str) -> DeviceToken:
-        """FCM 토큰을 등록하거나 업데이트합니다."""
-        async with self.database.session() as session:
-            stmt = select(DeviceToken).where(col(DeviceToken.token) == token)
-            result = await session.execute(stmt)
-            existing = result.scalar_one_or_none()
+        """
+        FCM 토큰을 등록하거나 업데이트합니다.
 
-            if existing is not None:
-                existing.user_id = user_id
-                existing.platform = platform
-                session.add(existing)
-                await session.flush()
-                await session.refresh(existing)
-                return existing
-
-            device_token = DeviceToken(user_id=user_id, token=token, platform=platform)
-            session.add(device_token)
-            await session.flush()
-            await session.refresh(device_token)
-            return device_token
+        INSERT ... ON CONFLICT (token) DO UPDATE ... RETURNING 한 번으로 처리하므로
+        같은 토큰이 동시에 등록되어도 중복 키 오류가 나지 않습니다.
+        """
+        async with self.database.session() as session:
+            insert_stmt = pg_insert(DeviceToken).values(
+                **DeviceToken(user_id=user_id, token=token, platform=platform).model_dump(exclude={"id"})
+            )
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[col(DeviceToken.token)],
+                set_={
+                    "user_id": insert_stmt.excluded.user_id,
+                    "platform": insert_stmt.excluded.platform,
+                    "updated_at": func.now(),
+                },
+            ).returning(DeviceToken)
+            result = await session.scalars(stmt, execution_options={"populate_existing": True})
+            return result.one()
 
-    async def update_is_active(self, token: str, is_active: bool) -> DeviceToken | None:
-        """FCM 토큰의 알림 활성화 여부를 변경합니다."""
+    async def update_is_active(self, token: str, is_active: bool, user_id: int | None = None) -> DeviceToken | None:
+        """FCM 토큰의 알림 활성화 여부를 UPDATE ... RETURNING 한 번으로 변경합니다 (없으면 None)."""
         async with self.database.session() as session:
-            stmt = select(DeviceToken).where(col(DeviceToken.token) == token)
-            result = await session.execute(stmt)
-            device_token = result.scalar_one_or_none()
-            if device_token is None:
-                return None
-            device_token.is_active = is_active
-            session.add(device_token)
-            await session.flush()
-            await session.refresh(device_token)
-            return device_token
+            stmt = (
+                update(DeviceToken)
+                .where(col(DeviceToken.token) == token)
+                .values(is_active=is_active)
+                .returning(DeviceToken)
+            )
+            if user_id is not None:
+                stmt = stmt.where(col(DeviceToken.user_id) == user_id)
+            result = await session.scalars(stmt)
+            return result.one_or_none()
 
-    async def delete_by_token(self, token: str) -> None:
+    async def delete_by_token(self, token: str, user_id: int | None = None) -> None:
         """FCM 토큰을 삭제합니다."""
         async with self.database.session() as session:
-            stmt = select(DeviceToken).where(col(DeviceToken.token) == token)
-            result = await session.execute(stmt)
-            device_token = result.scalar_one_or_none()
-            if device_token is not None:
-                await session.delete(device_token)
+            stmt = delete(DeviceToken).where(col(DeviceToken.token) == token)
+            if user_id is not None:
+                stmt = stmt.where(col(DeviceToken.user_id) == user_id)
+            await session.execute(stmt)
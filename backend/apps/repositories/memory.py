@@ -1,24 +1,65 @@
-from datetime import date
-from typing import Any
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, ClassVar
 
-from sqlalchemy import desc, func
+from sqlalchemy import Select, delete, desc, func, insert, literal, tuple_, update
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute, defer, undefer
 from sqlmodel import col, select
 
 from apps.models.memory import Memory
+from apps.models.memory_count import MemoryHourlyCount
 from apps.types.assistant import MemoryType
+from apps.types.memory import MemorySummary
+from apps.utils.datetime_utils import local_dates_to_utc_range
+from apps.utils.pagination import Cursor
 from database import Database
 
 
 class MemoryRepository:
-    """Memory 저장소"""
+    """
+    Memory 저장소
+
+    Memory.embedding은 매핑 수준에서 지연 로딩되므로 엔티티 조회에도 포함되지 않습니다.
+    목록 조회는 필요한 컬럼만 읽는 MemorySummary를 반환합니다.
+    """
+
+    # MemorySummary 필드 순서와 같아야 합니다.
+    SUMMARY_COLUMNS = (
+        col(Memory.id),
+        col(Memory.type),
+        col(Memory.keywords),
+        col(Memory.content),
+        col(Memory.metadata_),
+        col(Memory.original_text),
+        col(Memory.created_at),
+        col(Memory.updated_at),
+    )
+    # defer/undefer 옵션용 (SQLModel 필드 타입으로는 매핑 속성으로 인식되지 않음)
+    EMBEDDING: ClassVar[QueryableAttribute[Any]] = Memory.embedding  # type: ignore[assignment]
 
     def __init__(self, database: Database):
         self.database = database
 
-    async def get_by_id(self, memory_id: int, user_id: int | None = None) -> Memory | None:
-        """ID로 Memory를 조회합니다."""
+    @classmethod
+    def _select_summaries(cls) -> Select[Any]:
+        """MemorySummary 컬럼만 읽는 SELECT (sqlmodel.select는 컬럼 4개까지만 지원)"""
+        return sa_select(*cls.SUMMARY_COLUMNS)
+
+    async def get_by_id(
+        self,
+        memory_id: int,
+        user_id: int | None = None,
+        with_embedding: bool = False,
+    ) -> Memory | None:
+        """ID로 Memory를 조회합니다 (with_embedding=True면 embedding도 함께 로딩)."""
         async with self.database.session() as session:
             stmt = select(Memory).where(Memory.id == memory_id)
+            if with_embedding:
+                stmt = stmt.options(undefer(self.EMBEDDING))
             if user_id is not None:
                 stmt = stmt.where(Memory.user_id == user_id)
             result = await session.execute(stmt)
@@ -30,38 +71,109 @@ class MemoryRepository:
         type_filter: MemoryType | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[Memory]:
-        """Memory 목록을 조회합니다."""
-        async with self.database.session() as session:
-            stmt = select(Memory)
+        cursor: Cursor | None = None,
+    ) -> list[MemorySummary]:
+        """
+        Memory 목록을 조회합니다 (최신순).
+
+        cursor가 있으면 (created_at, id) 기준 keyset 페이지네이션을 사용하며 offset은 무시됩니다.
+        """
+        async with self.database.session(readonly=True) as session:
+            stmt = self._select_summaries()
             if user_id is not None:
-                stmt = stmt.where(Memory.user_id == user_id)
+                stmt = stmt.where(col(Memory.user_id) == user_id)
             if type_filter:
-                stmt = stmt.where(Memory.type == type_filter)
-            stmt = stmt.order_by(desc(col(Memory.created_at))).limit(limit).offset(offset)
+                stmt = stmt.where(col(Memory.type) == type_filter)
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(col(Memory.created_at), col(Memory.id)) < tuple_(literal(cursor.value), literal(cursor.id))
+                )
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(desc(col(Memory.created_at)), desc(col(Memory.id))).limit(limit)
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return [MemorySummary(*row) for row in result.tuples()]
 
     async def create(self, memory: Memory) -> Memory:
         """Memory를 생성합니다."""
         async with self.database.session() as session:
             session.add(memory)
             await session.flush()
-            await session.refresh(memory)
+            await self._adjust_hourly_counts(session, [memory], 1)
             return memory
 
+    async def bulk_create(self, memories: list[Memory]) -> list[Memory]:
+        """여러 Memory를 multi-row INSERT ... RETURNING 한 번으로 생성합니다 (입력 순서 유지)."""
+        if not memories:
+            return []
+        async with self.database.session() as session:
+            # 방금 넣은 embedding은 RETURNING으로 다시 받지 않음
+            stmt = insert(Memory).returning(Memory, sort_by_parameter_order=True).options(defer(self.EMBEDDING))
+            result = await session.scalars(stmt, [memory.model_dump(exclude={"id"}) for memory in memories])
+            created = list(result.all())
+            await self._adjust_hourly_counts(session, created, 1)
+            return created
+
     async def update(self, memory: Memory) -> Memory:
         """Memory를 수정합니다."""
         async with self.database.session() as session:
             session.add(memory)
             await session.flush()
-            await session.refresh(memory)
             return memory
 
-    async def delete(self, memory: Memory) -> None:
-        """Memory를 삭제합니다."""
+    async def delete_by_id(self, memory_id: int, user_id: int | None = None) -> Memory | None:
+        """
+        DELETE ... RETURNING 한 번으로 Memory를 삭제하고 삭제된 행을 반환합니다 (embedding 제외).
+
+        대상이 없으면(다른 사용자의 Memory 포함) None을 반환합니다.
+        """
         async with self.database.session() as session:
-            await session.delete(memory)
+            stmt = delete(Memory).where(col(Memory.id) == memory_id).returning(Memory)
+            if user_id is not None:
+                stmt = stmt.where(col(Memory.user_id) == user_id)
+            result = await session.scalars(stmt.options(defer(self.EMBEDDING)))
+            memory = result.one_or_none()
+            if memory is not None:
+                await self._adjust_hourly_counts(session, [memory], -1)
+            return memory
+
+    @staticmethod
+    async def _adjust_hourly_counts(session: AsyncSession, memories: Sequence[Memory], delta: int) -> None:
+        """
+        사용자별 UTC 시간 버킷 개수(memory_hourly_count)를 증감합니다.
+
+        Memory 쓰기와 같은 세션에서 실행되어 함께 커밋/롤백됩니다.
+        INSERT ... ON CONFLICT DO UPDATE로 동시 요청에서도 원자적으로 누적합니다.
+        """
+        counts = Counter(
+            (memory.user_id, memory.created_at.astimezone(UTC).replace(minute=0, second=0, microsecond=0))
+            for memory in memories
+            if memory.user_id is not None
+        )
+        if not counts:
+            return
+
+        # 동시 트랜잭션 간 행 잠금 순서를 맞춰 교착 상태를 방지합니다.
+        keys = sorted(counts)
+        stmt = pg_insert(MemoryHourlyCount).values(
+            [
+                {"user_id": user_id, "bucket": bucket, "count": counts[(user_id, bucket)] * delta}
+                for user_id, bucket in keys
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[col(MemoryHourlyCount.user_id), col(MemoryHourlyCount.bucket)],
+            set_={"count": col(MemoryHourlyCount.count) + stmt.excluded.count},
+        )
+        await session.execute(stmt)
+
+        if delta < 0:
+            await session.execute(
+                delete(MemoryHourlyCount).where(
+                    tuple_(col(MemoryHourlyCount.user_id), col(MemoryHourlyCount.bucket)).in_(keys),
+                    col(MemoryHourlyCount.count) <= 0,
+                )
+            )
 
     async def search_by_vector(
         self,
@@ -72,7 +184,7 @@ class MemoryRepository:
         threshold: float = 0.5,
     ) -> list[tuple[Memory, float]]:
         """벡터 유사도 검색을 수행합니다 (cosine similarity)."""
-        async with self.database.session() as session:
+        async with self.database.session(readonly=True) as session:
             # cosine_distance: 0 = 동일, 2 = 정반대
             # similarity = 1 - cosine_distance
             distance_threshold = 1 - threshold
@@ -99,35 +211,81 @@ class MemoryRepository:
 
             return [(row[0], float(row[1])) for row in rows]
 
+    async def get_without_embedding(self, limit: int) -> list[tuple[int, str]]:
+        """임베딩 없이 저장된 Memory의 (id, original_text)를 오래된 순으로 조회합니다 (임베딩 채우기용)."""
+        async with self.database.session() as session:
+            stmt = (
+                sa_select(col(Memory.id), col(Memory.original_text))
+                .where(self.EMBEDDING.is_(None))
+                .order_by(col(Memory.id))
+                .limit(limit)
+            )
+            result = await session.execute(stmt)
+            return [(memory_id, text) for memory_id, text in result.tuples() if memory_id is not None]
+
+    async def update_embeddings(self, embeddings: list[tuple[int, list[float]]]) -> None:
+        """
+        (id, embedding) 목록으로 임베딩을 채웁니다 (primary key 기준 bulk UPDATE).
+
+        그 사이 삭제됐거나 이미 채워진 Memory는 건너뜁니다.
+        """
+        if not embeddings:
+            return
+        async with self.database.session() as session:
+            # 추가 WHERE 조건이 있는 bulk UPDATE는 세션 객체 동기화를 지원하지 않음 (세션에 올린 Memory 없음)
+            await session.execute(
+                update(Memory).where(self.EMBEDDING.is_(None)).execution_options(synchronize_session=None),
+                [{"id": memory_id, "embedding": embedding} for memory_id, embedding in embeddings],
+            )
+
     async def get_by_date(
         self,
         target_date: date,
         user_id: int | None = None,
         timezone: str = "UTC",
         limit: int = 100,
-    ) -> list[Memory]:
-        """특정 날짜(사용자 시간대 기준)의 Memory 목록을 조회합니다."""
-        async with self.database.session() as session:
-            local_date_expr = func.date(func.timezone(timezone, col(Memory.created_at)))
-            stmt = select(Memory).where(local_date_expr == target_date)
+    ) -> list[MemorySummary]:
+        """
+        특정 날짜(사용자 시간대 기준)의 Memory 목록을 조회합니다.
+
+        날짜를 UTC [start, end) 구간으로 바꿔 created_at을 직접 비교하므로
+        (user_id, created_at, id) 인덱스 범위 스캔을 사용합니다.
+        """
+        start, end = local_dates_to_utc_range(target_date, target_date + timedelta(days=1), timezone)
+        async with self.database.session(readonly=True) as session:
+            created_at = col(Memory.created_at)
+            stmt = self._select_summaries().where(created_at >= start, created_at < end)
             if user_id is not None:
-                stmt = stmt.where(Memory.user_id == user_id)
-            stmt = stmt.order_by(desc(col(Memory.created_at))).limit(limit)
+                stmt = stmt.where(col(Memory.user_id) == user_id)
+            stmt = stmt.order_by(desc(created_at), desc(col(Memory.id))).limit(limit)
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return [MemorySummary(*row) for row in result.tuples()]
 
     async def get_calendar_marks(
         self,
-        user_id: int | None = None,
+        user_id: int,
         timezone: str = "UTC",
+        start: datetime | None = None,
+        end: datetime | None = None,
     ) -> dict[str, int]:
-        """메모리가 있는 날짜와 개수를 반환합니다 (캘린더 마킹용)."""
-        async with self.database.session() as session:
-            local_date_expr = func.date(func.timezone(timezone, col(Memory.created_at)))
-            stmt = select(local_date_expr, func.count(col(Memory.id)))
-            if user_id is not None:
-                stmt = stmt.where(Memory.user_id == user_id)
-            stmt = stmt.group_by(local_date_expr)
+        """
+        메모리가 있는 날짜와 개수를 반환합니다 (캘린더 마킹용).
+
+        memory 테이블 대신 UTC 시간 버킷 집계(memory_hourly_count)를 사용자 시간대 날짜로 합산합니다.
+        start/end(UTC, [start, end))가 주어지면 해당 구간의 버킷만 읽습니다.
+        30/45분 단위 오프셋 시간대에서는 버킷 시작 시각의 날짜로 집계됩니다.
+        """
+        async with self.database.session(readonly=True) as session:
+            bucket = col(MemoryHourlyCount.bucket)
+            local_date_expr = func.date(func.timezone(timezone, bucket))
+            stmt = select(local_date_expr, func.sum(col(MemoryHourlyCount.count))).where(
+                MemoryHourlyCount.user_id == user_id
+            )
+            if start is not None:
+                stmt = stmt.where(bucket >= start)
+            if end is not None:
+                stmt = stmt.where(bucket < end)
+            stmt = stmt.group_by(local_date_expr).having(func.sum(col(MemoryHourlyCount.count)) > 0)
             result = await session.execute(stmt)
             rows = result.all()
             return {str(row[0]): int(row[1]) for row in rows}
@@ -138,14 +296,14 @@ class MemoryRepository:
         user_id: int | None = None,
         type_filter: MemoryType | None = None,
         limit: int = 10,
-    ) -> list[Memory]:
+    ) -> list[MemorySummary]:
         """키워드로 검색합니다 (ILIKE)."""
-        async with self.database.session() as session:
-            stmt = select(Memory).where(col(Memory.keywords).ilike(f"%{keywords}%"))
+        async with self.database.session(readonly=True) as session:
+            stmt = self._select_summaries().where(col(Memory.keywords).ilike(f"%{keywords}%"))
             if user_id is not None:
-                stmt = stmt.where(Memory.user_id == user_id)
+                stmt = stmt.where(col(Memory.user_id) == user_id)
             if type_filter:
-                stmt = stmt.where(Memory.type == type_filter)
+                stmt = stmt.where(col(Memory.type) == type_filter)
             stmt = stmt.order_by(desc(col(Memory.created_at))).limit(limit)
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return [MemorySummary(*row) for row in result.tuples()]
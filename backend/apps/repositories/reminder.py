@@ -1,11 +1,14 @@
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, and_, delete, insert, literal, or_, tuple_, update
 from sqlalchemy.orm import selectinload
 from sqlmodel import col, select
 
+from apps.models.memory import Memory
 from apps.models.reminder import Reminder
 from apps.types.reminder import ReminderStatus
+from apps.utils.pagination import Cursor
 from database import Database
 
 
@@ -31,9 +34,14 @@ class ReminderRepository:
         memory_id: int | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[Reminder]:
-        """Reminder 목록을 조회합니다."""
-        async with self.database.session() as session:
+        """
+        Reminder 목록을 조회합니다 (다음 실행 시각순).
+
+        cursor가 있으면 (next_run_at, id) 기준 keyset 페이지네이션을 사용하며 offset은 무시됩니다.
+        """
+        async with self.database.session(readonly=True) as session:
             stmt = select(Reminder)
             if user_id is not None:
                 stmt = stmt.where(Reminder.user_id == user_id)
@@ -41,7 +49,11 @@ class ReminderRepository:
                 stmt = stmt.where(Reminder.status == status)
             if memory_id is not None:
                 stmt = stmt.where(Reminder.memory_id == memory_id)
-            stmt = stmt.order_by(col(Reminder.next_run_at).asc().nullslast()).limit(limit).offset(offset)
+            if cursor is not None:
+                stmt = stmt.where(self._after_cursor(cursor))
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(col(Reminder.next_run_at).asc().nullslast(), col(Reminder.id).asc()).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
@@ -51,25 +63,49 @@ class ReminderRepository:
         status: ReminderStatus | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[Reminder]:
-        """메모리 정보를 포함하여 Reminder 목록을 조회합니다."""
-        async with self.database.session() as session:
-            stmt = select(Reminder).options(selectinload(Reminder.memory))  # type: ignore[arg-type]
+        """메모리 정보를 포함하여 Reminder 목록을 조회합니다 (get_all과 같은 정렬/커서 규칙)."""
+        async with self.database.session(readonly=True) as session:
+            # 목록 응답에 필요한 Memory 컬럼만 로딩
+            stmt = select(Reminder).options(
+                selectinload(Reminder.memory).load_only(  # type: ignore[arg-type]
+                    col(Memory.type),  # type: ignore[arg-type]
+                    col(Memory.keywords),  # type: ignore[arg-type]
+                    col(Memory.content),  # type: ignore[arg-type]
+                )
+            )
             if user_id is not None:
                 stmt = stmt.where(Reminder.user_id == user_id)
             if status is not None:
                 stmt = stmt.where(Reminder.status == status)
-            stmt = stmt.order_by(col(Reminder.next_run_at).asc().nullslast()).limit(limit).offset(offset)
+            if cursor is not None:
+                stmt = stmt.where(self._after_cursor(cursor))
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(col(Reminder.next_run_at).asc().nullslast(), col(Reminder.id).asc()).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
+    @staticmethod
+    def _after_cursor(cursor: Cursor) -> ColumnElement[bool]:
+        """(next_run_at ASC NULLS LAST, id ASC) 정렬에서 커서 다음 행 조건을 만듭니다."""
+        next_run_at = col(Reminder.next_run_at)
+        if cursor.value is None:
+            # NULL 구간은 정렬의 마지막이므로 id만 비교
+            return and_(next_run_at.is_(None), col(Reminder.id) > cursor.id)
+        return or_(
+            tuple_(next_run_at, col(Reminder.id)) > tuple_(literal(cursor.value), literal(cursor.id)),
+            next_run_at.is_(None),
+        )
+
     async def get_due_reminders(self, limit: int = 100) -> list[Reminder]:
         """실행 시간이 된 활성 리마인더를 memory와 함께 조회합니다."""
         async with self.database.session() as session:
             now = datetime.now(UTC)
             stmt = (
                 select(Reminder)
-                .options(selectinload(Reminder.memory))  # type: ignore[arg-type]
+                .options(selectinload(Reminder.memory).load_only(col(Memory.content)))  # type: ignore[arg-type]
                 .where(
                     and_(
                         col(Reminder.next_run_at) <= now,
@@ -86,21 +122,50 @@ class ReminderRepository:
         async with self.database.session() as session:
             session.add(reminder)
             await session.flush()
-            await session.refresh(reminder)
             return reminder
 
+    async def bulk_create(self, reminders: list[Reminder]) -> list[Reminder]:
+        """여러 Reminder를 multi-row INSERT ... RETURNING 한 번으로 생성합니다 (입력 순서 유지)."""
+        if not reminders:
+            return []
+        async with self.database.session() as session:
+            stmt = insert(Reminder).returning(Reminder, sort_by_parameter_order=True)
+            result = await session.scalars(stmt, [reminder.model_dump(exclude={"id"}) for reminder in reminders])
+            return list(result.all())
+
     async def update(self, reminder: Reminder) -> Reminder:
         """Reminder를 수정합니다."""
         async with self.database.session() as session:
             session.add(reminder)
             await session.flush()
-            await session.refresh(reminder)
             return reminder
 
-    async def delete(self, reminder: Reminder) -> None:
-        """Reminder를 삭제합니다."""
+    async def update_by_id(
+        self,
+        reminder_id: int,
+        values: dict[str, Any],
+        user_id: int | None = None,
+    ) -> Reminder | None:
+        """
+        UPDATE ... RETURNING 한 번으로 Reminder를 수정하고 수정된 행을 반환합니다.
+
+        먼저 조회하지 않으며, 대상이 없으면(다른 사용자의 Reminder 포함) None을 반환합니다.
+        """
+        async with self.database.session() as session:
+            stmt = update(Reminder).where(col(Reminder.id) == reminder_id).values(**values).returning(Reminder)
+            if user_id is not None:
+                stmt = stmt.where(col(Reminder.user_id) == user_id)
+            result = await session.scalars(stmt)
+            return result.one_or_none()
+
+    async def delete_by_id(self, reminder_id: int, user_id: int | None = None) -> bool:
+        """DELETE ... RETURNING 한 번으로 Reminder를 삭제하고, 삭제된 행이 있었는지 반환합니다."""
         async with self.database.session() as session:
-            await session.delete(reminder)
+            stmt = delete(Reminder).where(col(Reminder.id) == reminder_id).returning(col(Reminder.id))
+            if user_id is not None:
+                stmt = stmt.where(col(Reminder.user_id) == user_id)
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none() is not None
 
     async def get_by_memory_id(self, memory_id: int, user_id: int | None = None) -> Reminder | None:
         """Memory ID로 Reminder를 조회합니다."""
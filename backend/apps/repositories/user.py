@@ -43,7 +43,6 @@ class UserRepository:
         async with self.database.session() as session:
             session.add(user)
             await session.flush()
-            await session.refresh(user)
             return user
 
     async def update(self, user: User) -> User:
@@ -51,5 +50,4 @@ class UserRepository:
         async with self.database.session() as session:
             session.add(user)
             await session.flush()
-            await session.refresh(user)
             return user
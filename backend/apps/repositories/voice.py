@@ -1,9 +1,10 @@
 from uuid import UUID
 
-from sqlalchemy import desc
+from sqlalchemy import desc, literal, tuple_
 from sqlmodel import col, select
 
 from apps.models.voice import VoiceSession
+from apps.utils.pagination import Cursor
 from database import Database
 
 
@@ -29,16 +30,28 @@ class VoiceSessionRepository:
             result = await session.execute(stmt)
             return result.scalar_one_or_none()
 
-    async def get_all_by_user(self, user_id: int, limit: int = 100, offset: int = 0) -> list[VoiceSession]:
-        """사용자의 VoiceSession 목록을 조회합니다."""
-        async with self.database.session() as session:
-            stmt = (
-                select(VoiceSession)
-                .where(VoiceSession.user_id == user_id)
-                .order_by(desc(col(VoiceSession.created_at)))
-                .limit(limit)
-                .offset(offset)
-            )
+    async def get_all_by_user(
+        self,
+        user_id: int,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Cursor | None = None,
+    ) -> list[VoiceSession]:
+        """
+        사용자의 VoiceSession 목록을 조회합니다 (최신순).
+
+        cursor가 있으면 (created_at, id) 기준 keyset 페이지네이션을 사용하며 offset은 무시됩니다.
+        """
+        async with self.database.session(readonly=True) as session:
+            stmt = select(VoiceSession).where(VoiceSession.user_id == user_id)
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(col(VoiceSession.created_at), col(VoiceSession.id))
+                    < tuple_(literal(cursor.value), literal(cursor.id))
+                )
+            else:
+                stmt = stmt.offset(offset)
+            stmt = stmt.order_by(desc(col(VoiceSession.created_at)), desc(col(VoiceSession.id))).limit(limit)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
@@ -47,7 +60,6 @@ class VoiceSessionRepository:
         async with self.database.session() as session:
             session.add(voice_session)
             await session.flush()
-            await session.refresh(voice_session)
             return voice_session
 
     async def update(self, voice_session: VoiceSession) -> VoiceSession:
@@ -55,5 +67,4 @@ class VoiceSessionRepository:
         async with self.database.session() as session:
             session.add(voice_session)
             await session.flush()
-            await session.refresh(voice_session)
             return voice_session
@@ -1,8 +1,11 @@
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from apps.schemas.memory import MemoryResponse, MemorySearchResult
 from apps.schemas.reminder import ReminderResponse
 from apps.types.assistant import IntentType
+from apps.types.assistant_job import AssistantJobKind, AssistantJobStatus
 
 
 class AssistantRequest(BaseModel):
@@ -33,3 +36,17 @@ class AssistantResponse(BaseModel):
     save_result: AssistantSaveResponse | None = Field(default=None, description="저장 결과 (intent=save일 때)")
     query_result: AssistantQueryResponse | None = Field(default=None, description="질문 응답 (intent=query일 때)")
     error_message: str | None = Field(default=None, description="에러 메시지 (intent=unknown일 때)")
+
+
+class AssistantJobResponse(BaseModel):
+    """Assistant 비동기 작업 상태 응답"""
+
+    job_id: str = Field(description="작업 ID")
+    kind: AssistantJobKind = Field(description="작업 종류 (chat/voice)")
+    status: AssistantJobStatus = Field(description="작업 상태 (pending/running/completed/failed)")
+    result: dict[str, Any] | None = Field(
+        default=None, description="처리 결과 (completed일 때, 동기 응답의 result와 같은 형태)"
+    )
+    error: str | None = Field(default=None, description="작업 실패 사유 (failed일 때)")
+
+    model_config = {"from_attributes": True}
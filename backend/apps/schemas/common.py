@@ -1,8 +1,13 @@
-from typing import TypeVar
+from collections.abc import Mapping
+from typing import Any, TypeVar
 
 from fastapi import status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+
+from apps.utils.datetime_utils import TIMEZONE_CONTEXT_KEY
 
 T = TypeVar("T")
 
@@ -13,21 +18,76 @@ class Response[T](BaseModel):
     result: T | None = None
 
 
+class CursorResponse[T](BaseModel):
+    """목록 응답 + 다음 페이지 커서 (마지막 페이지면 next_cursor=None)"""
+
+    code: int
+    message: str
+    result: list[T] | None = None
+    next_cursor: str | None = None
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    pydantic 모델을 JSON bytes로 한 번에 직렬화하는 응답 (pydantic-core to_json)
+
+    model_dump(mode="json")로 dict를 만든 뒤 json.dumps로 다시 인코딩하는 대신,
+    모델(또는 모델을 담은 dict/list)을 직렬화 한 번으로 bytes로 만듭니다.
+    timezone을 주면 LocalDatetime 필드가 직렬화 중에 그 시간대로 변환됩니다.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        timezone: str | None = None,
+    ) -> None:
+        # render()가 부모 생성자 안에서 호출되므로 먼저 설정
+        self.timezone = timezone
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        context = {TIMEZONE_CONTEXT_KEY: self.timezone} if self.timezone else None
+        return to_json(content, context=context)
+
+
 class ResponseProvider:
+    """
+    공통 응답 형식({code, message, result})으로 응답을 만듭니다.
+
+    result에는 pydantic 모델(또는 모델 목록)을 그대로 넘기고, 사용자 시간대로 보여줄
+    datetime이 있으면 timezone=request.state.timezone을 넘깁니다.
+    """
+
     @staticmethod
-    def success(result: T, status_code: int = status.HTTP_200_OK) -> JSONResponse:
+    def success(result: T, status_code: int = status.HTTP_200_OK, timezone: str | None = None) -> JSONResponse:
         response = Response(code=status_code, message="SUCCESS", result=result)
-        return JSONResponse(status_code=status_code, content=response.model_dump(mode="json"))
+        return ModelJSONResponse(response, status_code=status_code, timezone=timezone)
 
     @staticmethod
-    def created(result: T) -> JSONResponse:
+    def paginated(
+        result: list[T],
+        next_cursor: str | None,
+        status_code: int = status.HTTP_200_OK,
+        timezone: str | None = None,
+    ) -> JSONResponse:
+        response = CursorResponse(code=status_code, message="SUCCESS", result=result, next_cursor=next_cursor)
+        return ModelJSONResponse(response, status_code=status_code, timezone=timezone)
+
+    @staticmethod
+    def created(result: T, timezone: str | None = None) -> JSONResponse:
         response = Response(code=status.HTTP_201_CREATED, message="CREATED", result=result)
-        return JSONResponse(
-            status_code=status.HTTP_201_CREATED,
-            content=response.model_dump(mode="json"),
-        )
+        return ModelJSONResponse(response, status_code=status.HTTP_201_CREATED, timezone=timezone)
+
+    @staticmethod
+    def accepted(result: T, timezone: str | None = None) -> JSONResponse:
+        response = Response(code=status.HTTP_202_ACCEPTED, message="ACCEPTED", result=result)
+        return ModelJSONResponse(response, status_code=status.HTTP_202_ACCEPTED, timezone=timezone)
 
     @staticmethod
     def failed(status_code: int, message: str, result: T | None = None) -> JSONResponse:
         response = Response(code=status_code, message=message, result=result)
-        return JSONResponse(status_code=status_code, content=response.model_dump(mode="json"))
+        return ModelJSONResponse(response, status_code=status_code)
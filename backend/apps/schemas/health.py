@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+from apps.types.lifecycle import ComponentStatus, LifecycleState
+
+
+class ReadinessResponse(BaseModel):
+    """readiness 확인 결과 (/ready)"""
+
+    state: LifecycleState = Field(description="프로세스 상태")
+    components: dict[str, ComponentStatus] = Field(description="구성 요소별 warm-up 상태")
+    active_streams: int = Field(description="처리 중인 음성 스트리밍 WebSocket 수")
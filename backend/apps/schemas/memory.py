@@ -1,9 +1,10 @@
-from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from apps.types.assistant import MemoryType
+from apps.types.memory_import import MemoryImportStatus
+from apps.utils.datetime_utils import LocalDatetime
 
 
 class MemoryCreate(BaseModel):
@@ -34,8 +35,8 @@ class MemoryResponse(BaseModel):
     content: str = Field(description="핵심 내용")
     metadata_: dict[str, Any] | None = Field(default=None, description="추가 정보")
     original_text: str = Field(description="원본 입력 텍스트")
-    created_at: datetime = Field(description="생성 시간")
-    updated_at: datetime = Field(description="수정 시간")
+    created_at: LocalDatetime = Field(description="생성 시간")
+    updated_at: LocalDatetime = Field(description="수정 시간")
 
     model_config = {"from_attributes": True}
 
@@ -45,3 +46,25 @@ class MemorySearchResult(BaseModel):
 
     memory: MemoryResponse = Field(description="Memory 정보")
     similarity: float = Field(description="유사도 점수 (0.0 ~ 1.0)")
+
+
+class MemoryImportRequest(BaseModel):
+    """Memory 일괄 가져오기 요청 (다른 앱의 메모 이전용)"""
+
+    items: list[str] = Field(min_length=1, description="가져올 메모 텍스트 목록 (항목당 하나의 Memory)")
+
+
+class MemoryImportJobResponse(BaseModel):
+    """Memory 일괄 가져오기 작업 상태 응답"""
+
+    job_id: str = Field(description="작업 ID")
+    status: MemoryImportStatus = Field(description="작업 상태")
+    total: int = Field(description="전체 항목 수")
+    parsed: int = Field(description="파싱 완료 항목 수")
+    saved: int = Field(description="저장 완료 항목 수")
+    failed: int = Field(description="실패 항목 수")
+    memory_ids: list[int] = Field(description="생성된 Memory ID 목록")
+    reminder_ids: list[int] = Field(description="생성된 Reminder ID 목록")
+    error: str | None = Field(default=None, description="작업 실패 사유")
+
+    model_config = {"from_attributes": True}
@@ -1,10 +1,11 @@
-from datetime import date, datetime
+from datetime import date
 from datetime import time as _time
 
 from pydantic import BaseModel, Field, model_validator
 
 from apps.types.assistant import MemoryType, ReminderFrequency, Weekday
 from apps.types.reminder import ReminderStatus
+from apps.utils.datetime_utils import LocalDatetime
 
 
 class ReminderCreate(BaseModel):
@@ -74,10 +75,10 @@ class ReminderResponse(BaseModel):
     day_of_month: int | None = Field(description="매월 몇 일")
     specific_date: date | None = Field(description="특정 일자")
     time: _time = Field(description="알림 시간")
-    next_run_at: datetime | None = Field(description="다음 실행 시각")
+    next_run_at: LocalDatetime | None = Field(description="다음 실행 시각")
     status: ReminderStatus = Field(description="상태")
-    created_at: datetime = Field(description="생성일시")
-    updated_at: datetime = Field(description="수정일시")
+    created_at: LocalDatetime = Field(description="생성일시")
+    updated_at: LocalDatetime = Field(description="수정일시")
 
     model_config = {"from_attributes": True}
 
@@ -95,9 +96,9 @@ class ReminderWithMemoryResponse(BaseModel):
     day_of_month: int | None
     specific_date: date | None
     time: _time
-    next_run_at: datetime | None
+    next_run_at: LocalDatetime | None
     status: ReminderStatus
-    created_at: datetime
-    updated_at: datetime
+    created_at: LocalDatetime
+    updated_at: LocalDatetime
 
     model_config = {"from_attributes": True}
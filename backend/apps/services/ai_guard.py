@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import NoReturn
+
+from apps.exceptions import AIUnavailableError
+from apps.metrics import AI_GUARD_REJECTIONS, AI_GUARD_STATE
+from apps.types.ai_guard import AIGuardConfig, CircuitState
+
+logger = logging.getLogger(__name__)
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class AIGuard:
+    """
+    외부 AI 의존성(LLM, 임베딩) 하나의 호출 보호
+
+    Gemini가 느려지면 요청마다 호출이 쌓여 이벤트 루프/연결/메모리가 모두 묶이므로,
+    호출 전후로 다음을 적용합니다.
+
+    - 동시 호출 제한: 프로세스당 max_concurrency개, 슬롯을 queue_timeout_seconds 안에 못 얻으면 거절
+    - 호출 제한 시간: deadline_seconds가 지나면 호출을 취소하고 실패로 기록
+    - 서킷 브레이커: 최근 breaker_window개 호출의 실패/느린 호출 비율이 기준을 넘으면
+      breaker_open_seconds 동안 호출하지 않고 바로 거절 → 이후 시험 호출(half-open)이
+      breaker_half_open_calls번 성공하면 다시 허용, 하나라도 실패하면 다시 차단
+
+    거절/제한 시간 초과는 AIUnavailableError(503)로 알리며, 호출자는 이 예외로 대체 동작을 선택합니다.
+    응답은 받았지만 형식이 잘못된 경우(IGNORED_ERRORS)는 의존성 장애가 아니므로 실패로 기록하지 않습니다.
+
+    사용 예:
+        async with self.embedding_guard.call():
+            embedding = await self.embeddings.aembed_query(text)
+    """
+
+    # 구조화 출력 파싱 실패 등 응답 내용 오류 (OutputParserException, pydantic ValidationError 모두 ValueError)
+    IGNORED_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+
+    def __init__(self, name: str, config: AIGuardConfig):
+        self.name = name
+        self.config = config
+        self.state = CircuitState.CLOSED
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        # 최근 호출 결과 (실패 여부, 느린 호출 여부)
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=config.breaker_window)
+        self._opened_at = 0.0
+        self._probes = 0  # half-open에서 진행 중인 시험 호출 수
+        self._probe_successes = 0
+        # half-open 구간 번호 - 이전 구간에 시작한 시험 호출의 결과가 현재 구간에 반영되지 않도록 구분
+        self._generation = 0
+        AI_GUARD_STATE.labels(dependency=name).set(_STATE_VALUES[self.state])
+
+    @property
+    def available(self) -> bool:
+        """지금 호출하면 차단으로 거절되지 않는지 (차단 시간이 지났으면 시험 호출 가능)"""
+        if not self.config.enabled or self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return time.monotonic() >= self._opened_at + self.config.breaker_open_seconds
+        return self._probes < self.config.breaker_half_open_calls
+
+    @asynccontextmanager
+    async def call(self, deadline_seconds: float | None = None) -> AsyncIterator[None]:
+        """
+        보호된 호출 구간 (deadline_seconds: 이 호출의 제한 시간, None이면 config.deadline_seconds)
+
+        차단 중이거나 슬롯 대기/제한 시간을 넘기면 AIUnavailableError를 발생시킵니다.
+        """
+        if not self.config.enabled:
+            yield
+            return
+
+        probe = self._admit()  # 시험 호출이면 half-open 구간 번호, 아니면 None
+        try:
+            async with asyncio.timeout(self.config.queue_timeout_seconds):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            self._release_probe(probe)
+            self._reject("queue_timeout")
+        except BaseException:
+            self._release_probe(probe)
+            raise
+
+        started = time.monotonic()
+        # 취소(클라이언트 연결 끊김 등)되거나 응답 내용 오류면 None - 결과로 기록하지 않음
+        succeeded: bool | None = None
+        try:
+            async with asyncio.timeout(deadline_seconds or self.config.deadline_seconds):
+                yield
+            succeeded = True
+        except TimeoutError as e:
+            succeeded = False
+            AI_GUARD_REJECTIONS.labels(dependency=self.name, reason="deadline").inc()
+            raise AIUnavailableError() from e
+        except self.IGNORED_ERRORS:
+            raise
+        except Exception:
+            succeeded = False
+            raise
+        finally:
+            self._semaphore.release()
+            if succeeded is None:
+                self._release_probe(probe)
+            else:
+                self._record(succeeded, time.monotonic() - started, probe)
+
+    def _admit(self) -> int | None:
+        """호출을 허용할지 판단합니다 (차단 중이면 거절, half-open 시험 호출이면 구간 번호 반환)."""
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() < self._opened_at + self.config.breaker_open_seconds:
+                self._reject("open")
+            self._set_state(CircuitState.HALF_OPEN)
+            self._generation += 1
+            self._probes = 0
+            self._probe_successes = 0
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes >= self.config.breaker_half_open_calls:
+                self._reject("open")
+            self._probes += 1
+            return self._generation
+        return None
+
+    def _current_probe(self, probe: int | None) -> bool:
+        """현재 half-open 구간의 시험 호출인지 (이전 구간에 시작했거나 이미 차단/해제되었으면 False)"""
+        return probe is not None and probe == self._generation and self.state == CircuitState.HALF_OPEN
+
+    def _release_probe(self, probe: int | None) -> None:
+        if self._current_probe(probe):
+            self._probes -= 1
+
+    def _reject(self, reason: str) -> NoReturn:
+        AI_GUARD_REJECTIONS.labels(dependency=self.name, reason=reason).inc()
+        raise AIUnavailableError()
+
+    def _record(self, succeeded: bool, elapsed: float, probe: int | None) -> None:
+        """호출 결과를 기록하고 차단/해제 여부를 판단합니다."""
+        if probe is not None:
+            # 다른 구간의 시험 호출 결과는 무시 (예: 다른 시험 호출이 실패해 다시 차단된 뒤 끝난 호출)
+            if not self._current_probe(probe):
+                return
+            self._release_probe(probe)
+            if not succeeded:
+                self._open("half-open probe failed")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.breaker_half_open_calls:
+                self._set_state(CircuitState.CLOSED)
+                self._outcomes.clear()
+                logger.info("AI guard %s closed: probes succeeded", self.name)
+            return
+
+        # 차단 전에 시작한 호출의 결과는 반영하지 않음
+        if self.state != CircuitState.CLOSED:
+            return
+
+        self._outcomes.append((not succeeded, elapsed >= self.config.breaker_slow_call_seconds))
+        calls = len(self._outcomes)
+        if calls < self.config.breaker_min_calls:
+            return
+        error_rate = sum(failed for failed, _slow in self._outcomes) / calls
+        slow_rate = sum(slow for _failed, slow in self._outcomes) / calls
+        if error_rate >= self.config.breaker_error_rate or slow_rate >= self.config.breaker_slow_call_rate:
+            self._open(f"error rate {error_rate:.0%}, slow call rate {slow_rate:.0%} of last {calls} calls")
+
+    def _open(self, reason: str) -> None:
+        self._set_state(CircuitState.OPEN)
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        # 진행 중인 시험 호출은 이 구간에 속하지 않게 되므로 카운터를 초기화
+        self._generation += 1
+        self._probes = 0
+        self._probe_successes = 0
+        logger.warning("AI guard %s opened for %.0fs: %s", self.name, self.config.breaker_open_seconds, reason)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        AI_GUARD_STATE.labels(dependency=self.name).set(_STATE_VALUES[state])
@@ -0,0 +1,117 @@
+import asyncio
+import contextvars
+import logging
+
+from apps.models.ai_log import AIProcessingLog
+from apps.repositories.ai_log import AIProcessingLogRepository
+from apps.types.ai_log import AILogConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AILogSink:
+    """
+    AI 처리 로그 비동기 저장소 (@ai_log 데코레이터에서 사용)
+
+    로그를 메모리 큐에 넣고 즉시 반환하며, 백그라운드 태스크가 batch_size개가 모이거나
+    flush_interval_seconds가 지나면 multi-row INSERT 한 번으로 저장합니다.
+    LLM 호출 응답 시간에 로그 INSERT가 더해지지 않고, 호출자의 트랜잭션과도 분리됩니다.
+
+    - 큐가 가득 차면 로그를 폐기하고 dropped를 증가시킵니다 (요청 처리를 막지 않음)
+    - 저장 실패 시 해당 배치는 버리고 failed를 증가시킵니다
+    - 시작되지 않은 상태(스크립트 등)에서는 기존처럼 즉시 저장합니다
+    """
+
+    def __init__(self, config: AILogConfig, ai_log_repository: AIProcessingLogRepository):
+        self.config = config
+        self.ai_log_repository = ai_log_repository
+        self._queue: asyncio.Queue[AIProcessingLog | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """백그라운드 저장 태스크를 시작합니다 (main.lifespan에서 호출)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        # 요청 컨텍스트(현재 트랜잭션 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        self._task = asyncio.create_task(self._run(self._queue), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        """큐에 남은 로그를 저장한 뒤 태스크를 종료합니다."""
+        if self._queue is None or self._task is None:
+            return
+        queue, task = self._queue, self._task
+        self._queue = None
+
+        try:
+            await asyncio.wait_for(queue.put(None), timeout=self.config.shutdown_timeout_seconds)
+            await asyncio.wait_for(task, timeout=self.config.shutdown_timeout_seconds)
+        except TimeoutError:
+            task.cancel()
+            logger.warning("AI log sink stop timed out: %d logs not saved", queue.qsize())
+
+        self._task = None
+        logger.info(
+            "AI log sink stopped: written=%d, dropped=%d, failed=%d",
+            self.written,
+            self.dropped,
+            self.failed,
+        )
+
+    async def emit(self, log: AIProcessingLog) -> None:
+        """로그를 저장 대기열에 넣습니다."""
+        if self._queue is None:
+            await self.ai_log_repository.bulk_create([log])
+            self.written += 1
+            return
+
+        try:
+            self._queue.put_nowait(log)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            # 큐가 계속 가득 찬 상태에서 로그가 쏟아지지 않도록 일정 간격으로만 경고합니다.
+            if self.dropped % 1000 == 1:
+                logger.warning("AI log queue full, dropping logs (dropped=%d)", self.dropped)
+
+    async def _run(self, queue: asyncio.Queue[AIProcessingLog | None]) -> None:
+        """배치 크기 또는 시간 기준으로 로그를 모아 저장합니다."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = loop.time() + self.config.flush_interval_seconds
+            while len(batch) < self.config.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    log = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except TimeoutError:
+                    break
+                if log is None:
+                    stopping = True
+                    break
+                batch.append(log)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[AIProcessingLog]) -> None:
+        try:
+            await self.ai_log_repository.bulk_create(batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("Failed to save %d AI logs", len(batch))
+        else:
+            self.written += len(batch)
@@ -0,0 +1,151 @@
+import itertools
+import re
+from typing import Any
+
+from apps.i18n import _
+from apps.models.memory import Memory
+from apps.types.assistant import AssistantConfig, MemoryType
+
+# 템플릿 답변 필드를 묻는 질문 단어 - 부분 문자열이 아니라 단어 단위로 비교합니다.
+# 한국어는 단어 뒤에 조사/어미(QUESTION_SUFFIXES)만 붙은 경우도 같은 단어로 봅니다 (예: "어디에", "번호가").
+LOCATION_QUESTION_WORDS = frozenset({"어디", "어딨어", "어딨지", "어딨더라", "위치", "where's"})
+PHONE_QUESTION_WORDS = frozenset(
+    {"전화번호", "연락처", "번호", "폰번호", "휴대폰번호", "핸드폰번호", "phone", "telephone"}
+)
+QUESTION_SUFFIXES = (
+    "은",
+    "는",
+    "이",
+    "가",
+    "을",
+    "를",
+    "에",
+    "야",
+    "지",
+    "좀",
+    "였지",
+    "였더라",
+    "더라",
+    "있어",
+    "있지",
+)
+# 영어 where는 바로 뒤가 be동사일 때만 위치 질문으로 봄 ("Where did I buy ..."는 행동이 일어난 곳)
+WHERE_FOLLOWERS = frozenset({"is", "are", "was", "were"})
+
+# 질문 단어가 있어도 다른 것을 묻는 표현 (LLM이 답변)
+# 한국어는 붙여 쓴 합성어(계좌번호, 비밀번호)도 잡도록 부분 문자열, 영어는 단어 단위로 비교합니다.
+LOCATION_EXCLUDED_WORDS = ("어디서", "어디에서", "어디로", "어디까지")  # 현재 위치가 아니라 행동이 일어난 곳
+PHONE_EXCLUDED_WORDS = (  # 전화번호가 아닌 번호
+    "계좌",
+    "비밀",
+    "카드",
+    "방번호",
+    "여권",
+    "주민",
+    "번호판",
+    "차량",
+    "사번",
+    "학번",
+    "account",
+    "password",
+    "passcode",
+    "pin",
+    "card",
+    "passport",
+    "room",
+    "bank",
+)
+
+_WORD = re.compile(r"[\w']+")
+
+
+def _field(metadata: dict[str, Any], key: str) -> str | None:
+    """metadata 값을 문자열로 반환합니다 (없거나 빈 값이면 None)."""
+    value = metadata.get(key)
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def _words(question: str) -> list[str]:
+    """질문을 소문자 단어 목록으로 나눕니다 (문장 부호 제외)."""
+    return _WORD.findall(question.lower())
+
+
+def _has_word(words: list[str], candidates: frozenset[str]) -> bool:
+    """words 중에 candidates의 단어(또는 단어 + 조사/어미)가 있는지 확인합니다."""
+    return any(
+        word in candidates
+        or any(word.endswith(suffix) and word[: -len(suffix)] in candidates for suffix in QUESTION_SUFFIXES)
+        for word in words
+    )
+
+
+def _has_excluded(question: str, words: list[str], excluded: tuple[str, ...]) -> bool:
+    lowered = question.lower()
+    return any(word in words if word.isascii() else word in lowered for word in excluded)
+
+
+def asks_location(question: str) -> bool:
+    """물건의 현재 위치를 묻는 질문인지 확인합니다."""
+    words = _words(question)
+    if _has_excluded(question, words, LOCATION_EXCLUDED_WORDS):
+        return False
+    if _has_word(words, LOCATION_QUESTION_WORDS):
+        return True
+    return any(word == "where" and following in WHERE_FOLLOWERS for word, following in itertools.pairwise(words))
+
+
+def asks_phone(question: str) -> bool:
+    """전화번호를 묻는 질문인지 확인합니다."""
+    words = _words(question)
+    return not _has_excluded(question, words, PHONE_EXCLUDED_WORDS) and _has_word(words, PHONE_QUESTION_WORDS)
+
+
+class AnswerPlanner:
+    """
+    질문 답변 방식 선택 (AssistantConfig.answer_template_*)
+
+    물건 위치(item의 location), 인물 전화번호(person의 phone)처럼 답이 metadata 필드 하나인 질문은
+    LLM 없이 현재 locale의 템플릿으로 바로 답변합니다. 다음을 모두 만족할 때만 템플릿을 사용하고,
+    나머지(애매하거나 여러 Memory를 종합해야 하는 경우)는 LLM이 답변합니다.
+
+    - 1위 검색 결과의 유사도가 answer_template_min_similarity 이상
+    - 2위와 유사도 차이가 answer_template_min_margin 이상 (비슷한 후보가 여럿이면 애매함)
+    - 1위 Memory 유형에 템플릿이 있고, 질문이 그 필드를 묻고, metadata에 값이 있음
+    """
+
+    def __init__(self, config: AssistantConfig):
+        self.config = config
+
+    def plan(self, question: str, results: list[tuple[Memory, float]]) -> str | None:
+        """템플릿 답변을 반환합니다 (LLM이 답변해야 하면 None)."""
+        if not self.config.answer_template_enabled or not results:
+            return None
+
+        memory, similarity = results[0]
+        if similarity < self.config.answer_template_min_similarity:
+            return None
+        if len(results) > 1 and similarity - results[1][1] < self.config.answer_template_min_margin:
+            return None
+        return self.render(question, memory)
+
+    @staticmethod
+    def render(question: str, memory: Memory) -> str | None:
+        """Memory 유형별 템플릿으로 답변을 만듭니다 (템플릿이 없거나 질문이 다른 것을 물으면 None)."""
+        metadata = memory.metadata_ or {}
+
+        if memory.type == MemoryType.ITEM and asks_location(question):
+            location = _field(metadata, "location")
+            if location is not None:
+                return _("It's in {location}.").format(location=location)
+
+        if memory.type == MemoryType.PERSON and asks_phone(question):
+            phone = _field(metadata, "phone")
+            if phone is not None:
+                name = _field(metadata, "name")
+                if name is None:
+                    return _("The phone number is {phone}.").format(phone=phone)
+                return _("{name}'s phone number is {phone}.").format(name=name, phone=phone)
+
+        return None
@@ -1,12 +1,17 @@
+import asyncio
+import contextvars
 import logging
 from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
-from pydantic import SecretStr
+from pydantic import SecretStr, TypeAdapter
 
+from apps.cache import RedisCache
+from apps.exceptions import AIUnavailableError
 from apps.i18n import _
+from apps.metrics import track_ai_call
 from apps.models.memory import Memory
 from apps.models.reminder import Reminder
 from apps.repositories.memory import MemoryRepository
@@ -18,22 +23,72 @@ from apps.schemas.assistant import (
 )
 from apps.schemas.memory import MemoryResponse, MemorySearchResult
 from apps.schemas.reminder import ReminderResponse
+from apps.services.ai_guard import AIGuard
+from apps.services.answer_planner import AnswerPlanner
+from apps.services.embedding_batcher import EmbeddingBatcher
+from apps.services.memory_calendar import MemoryCalendarService
+from apps.services.prompt_cache import PromptCache
+from apps.services.single_flight import SingleFlight
 from apps.types.ai_log import AILogStep
 from apps.types.assistant import (
     AssistantConfig,
     IntentClassification,
     IntentType,
+    MemoryType,
     ParsedMemory,
+    PreparedSave,
     ReminderInfo,
 )
 from apps.utils.log import ai_log
 from apps.utils.reminder_calculator import ReminderCalculator
+from database import on_commit, transactional
+
+# LangChain/Gemini SDK는 import 비용이 커서 (수백 ms~수 초) 처음 사용할 때 import합니다.
+# Celery 워커 등 LLM을 쓰지 않는 프로세스는 로딩하지 않습니다.
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_core.runnables import Runnable
+    from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 간 single-flight 결과 전달용 JSON 직렬화
+_INTENT_ADAPTER = TypeAdapter(IntentClassification)
+_PARSED_ADAPTER = TypeAdapter(ParsedMemory)
+_EMBEDDING_ADAPTER = TypeAdapter(list[float])
+
+
+def _chat_messages(system: str | None, human: str, context: str | None = None) -> list["BaseMessage"]:
+    """
+    시스템 프롬프트와 사용자 입력으로 LLM 메시지 목록을 만듭니다.
+
+    - system: None이면 생략 (cached content에 시스템 프롬프트가 들어 있는 경우)
+    - context: 현재 시각처럼 호출마다 바뀌는 정보. 시스템 프롬프트가 모든 호출에서 같은 prefix가 되도록
+      사용자 턴에 입력보다 먼저 넣습니다 (입력은 항상 마지막 part).
+    """
+    from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+    messages: list[BaseMessage] = [] if system is None else [SystemMessage(content=system)]
+    if context is None:
+        messages.append(HumanMessage(content=human))
+    else:
+        messages.append(HumanMessage(content=[{"type": "text", "text": context}, {"type": "text", "text": human}]))
+    return messages
+
 
 class AssistantService:
-    """AI Assistant 서비스 (LangChain + Gemini)"""
+    """
+    AI Assistant 서비스 (LangChain + Gemini)
+
+    LLM/임베딩 호출은 각각 AIGuard(동시 호출 제한, 제한 시간, 서킷 브레이커)를 거치며,
+    사용할 수 없으면(AIUnavailableError) 단계별로 대체 동작을 합니다.
+
+    - 의도 분류: 질문 표현이 있으면 query, 아니면 save로 추정
+    - 파싱: 원문 그대로 memo로 저장
+    - 저장 임베딩: 임베딩 없이 저장하고 백그라운드에서 나중에 채움
+    - 답변 생성: 검색된 관련 정보만 안내
+    - 질문 임베딩: 검색할 수 없으므로 503
+    """
 
     INTENT_SYSTEM_PROMPT = """당신은 사용자의 입력을 분류하는 AI입니다.
 사용자의 입력이 다음 중 어떤 의도인지 판단하세요:
@@ -60,6 +115,8 @@ class AssistantService:
 
     PARSE_SYSTEM_PROMPT = """당신은 사용자의 입력에서 정보를 추출하는 AI입니다.
 입력된 텍스트에서 핵심 정보를 추출하세요.
+사용자 메시지는 "현재 날짜/시간"과 입력 텍스트 순서로 주어집니다.
+"오늘", "내일", "다음 주" 같은 상대적인 날짜/시간은 "현재 날짜/시간"을 기준으로 계산하세요.
 
 type 설명:
 - item: 물건 위치/보관 정보 (예: "안경 서랍에 뒀어")
@@ -115,6 +172,9 @@ weekday 값 (frequency=weekly일 때):
 시간은 단일 값만 저장합니다. 여러 시간이 언급되면 첫 번째 시간을 사용하세요.
 날짜/시간 언급이 전혀 없으면 reminder는 null로 두세요."""
 
+    # LLM을 쓸 수 없을 때 질문으로 추정하는 표현 (INTENT_SYSTEM_PROMPT의 query 기준)
+    QUESTION_MARKERS = ("?", "어디", "뭐", "무엇", "어떻게", "언제", "누구", "몇")
+
     ANSWER_SYSTEM_PROMPT = """당신은 친절한 AI 비서입니다.
 사용자의 질문에 대해 검색된 관련 정보를 바탕으로 자연스럽게 답변하세요.
 
@@ -126,35 +186,181 @@ weekday 값 (frequency=weekly일 때):
         config: AssistantConfig,
         memory_repository: MemoryRepository,
         reminder_repository: ReminderRepository,
+        memory_calendar_service: MemoryCalendarService,
+        redis_cache: RedisCache,
+        llm: "ChatGoogleGenerativeAI | None" = None,
+        embeddings: "GoogleGenerativeAIEmbeddings | None" = None,
     ):
         self.config = config
         self.memory_repository = memory_repository
         self.reminder_repository = reminder_repository
-        self._llm: ChatGoogleGenerativeAI | None = None
-        self._embeddings: GoogleGenerativeAIEmbeddings | None = None
-
-    @property
-    def llm(self) -> ChatGoogleGenerativeAI:
-        """LLM 지연 로딩"""
-        if self._llm is None:
-            self._llm = ChatGoogleGenerativeAI(
-                model=self.config.model,
+        self.memory_calendar_service = memory_calendar_service
+        # 주입하지 않으면 처음 사용할 때 설정으로 생성 (벤치마크에서는 fake를 주입)
+        # 주입한 LLM은 모든 단계에서 사용하고, 아니면 단계별 설정(AssistantConfig.steps)마다 생성
+        self._llm = llm
+        self._step_llms: dict[str, ChatGoogleGenerativeAI] = {}
+        self._embeddings = embeddings
+        self.prompt_cache = PromptCache(config)
+        self.llm_guard = AIGuard("llm", config.guard)
+        self.embedding_guard = AIGuard("embedding", config.guard)
+        self.single_flight = SingleFlight(config.single_flight, redis_cache)
+        self.embedding_batcher = EmbeddingBatcher(config.embedding_batch, self.embed_documents)
+        self.answer_planner = AnswerPlanner(config)
+        self._backfill_task: asyncio.Task[None] | None = None
+
+    def llm_for(self, step: AILogStep) -> "ChatGoogleGenerativeAI":
+        """단계별 LLM 지연 로딩 (설정이 같은 단계끼리는 클라이언트를 공유)"""
+        if self._llm is not None:
+            return self._llm
+
+        settings = self.config.llm_settings(step)
+        key = settings.model_dump_json()
+        llm = self._step_llms.get(key)
+        if llm is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            llm = ChatGoogleGenerativeAI(
+                model=settings.model or self.config.model,
                 google_api_key=self.config.api_key,
-                temperature=self.config.temperature,
-                max_output_tokens=self.config.max_tokens,
+                temperature=settings.temperature,
+                max_output_tokens=settings.max_tokens,
+                timeout=settings.timeout_seconds,
+                thinking_budget=settings.thinking_budget,
             )
-        return self._llm
+            self._step_llms[key] = llm
+        return llm
+
+    def model_name(self, step: AILogStep) -> str:
+        """step에서 실제로 호출하는 모델명 (AI 로그, 지표용)"""
+        if step == AILogStep.EMBEDDING:
+            return self.config.embedding_model
+        if step == AILogStep.ANSWER_TEMPLATE:
+            return "template"
+        if self._llm is not None:
+            return self._llm.model
+        return self.config.llm_settings(step).model or self.config.model
 
     @property
-    def embeddings(self) -> GoogleGenerativeAIEmbeddings:
+    def embeddings(self) -> "GoogleGenerativeAIEmbeddings":
         """Embeddings 지연 로딩"""
         if self._embeddings is None:
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
             self._embeddings = GoogleGenerativeAIEmbeddings(
                 model=f"models/{self.config.embedding_model}",
                 api_key=SecretStr(self.config.api_key),
             )
         return self._embeddings
 
+    async def warmup(self, call_embedding: bool = False) -> None:
+        """
+        단계별 LLM/임베딩 클라이언트를 미리 생성합니다 (SDK import와 클라이언트 생성 비용 제거).
+
+        call_embedding=True면 짧은 임베딩 호출까지 해서 HTTP 연결(TLS)도 미리 맺습니다.
+        """
+        self.llm_for(AILogStep.ANSWER_GENERATION)
+        embeddings = self.embeddings
+        if call_embedding:
+            await embeddings.aembed_query("warmup")
+        # prompt_cache_enabled면 cached content도 미리 생성 (첫 요청이 생성 시간을 기다리지 않음)
+        await self._prompt_llm(AILogStep.INTENT_CLASSIFICATION, self.INTENT_SYSTEM_PROMPT)
+        await self._prompt_llm(AILogStep.TEXT_PARSING, self.PARSE_SYSTEM_PROMPT)
+
+    async def close(self) -> None:
+        """이 프로세스가 만든 cached content를 삭제하고, LLM/임베딩 클라이언트의 HTTP 연결을 닫습니다."""
+        if self._backfill_task is not None:
+            # 남은 Memory는 다음 프로세스가 시작할 때 다시 채움
+            self._backfill_task.cancel()
+        await self.embedding_batcher.close()
+        llms = [*self._step_llms.values(), *([self._llm] if self._llm is not None else [])]
+        if llms and llms[0].client is not None:
+            await self.prompt_cache.clear(llms[0].client)
+        for model in (*llms, self._embeddings):
+            if model is not None and model.client is not None:
+                await model.client.aio.aclose()
+                model.client.close()
+
+    async def _prompt_llm(self, step: AILogStep, system_prompt: str) -> tuple["ChatGoogleGenerativeAI", str | None]:
+        """
+        고정 시스템 프롬프트로 호출할 step의 LLM과 메시지에 넣을 시스템 프롬프트를 반환합니다.
+
+        cached content를 쓸 수 있으면 cached content를 지정한 LLM과 None(시스템 프롬프트 생략)을,
+        아니면 단계별 LLM과 시스템 프롬프트를 반환합니다.
+        """
+        llm = self.llm_for(step)
+        cached_content = None
+        if llm.client is not None:
+            cached_content = await self.prompt_cache.get(llm.client, step.value, system_prompt, llm.model)
+        if cached_content is None:
+            return llm, system_prompt
+        return llm.model_copy(update={"cached_content": cached_content}), None
+
+    def _llm_deadline(self, step: AILogStep) -> float | None:
+        """step LLM 호출의 제한 시간 (단계별 timeout_seconds, 없으면 AIGuard 기본값)"""
+        return self.config.llm_settings(step).timeout_seconds
+
+    async def _invoke_llm(self, step: AILogStep, model: str, runnable: "Runnable[Any, Any]", messages: Any) -> Any:
+        """step LLM을 AIGuard 안에서 호출합니다 (사용할 수 없으면 AIUnavailableError)."""
+        async with self.llm_guard.call(self._llm_deadline(step)):
+            with track_ai_call(step, model):
+                return await runnable.ainvoke(messages)
+
+    async def embed_query(self, text: str) -> list[float]:
+        """텍스트 하나를 임베딩합니다 (같은 텍스트의 동시 호출은 합침, 사용할 수 없으면 AIUnavailableError)."""
+        return await self.single_flight.do(
+            AILogStep.EMBEDDING,
+            (self.config.embedding_model, text),
+            partial(self._embed_query, text),
+            _EMBEDDING_ADAPTER,
+        )
+
+    async def _embed_query(self, text: str) -> list[float]:
+        if self.config.embedding_batch.enabled:
+            # 다른 요청과 묶어 aembed_documents 한 번으로 보냄 (배치 하나가 AIGuard 슬롯 하나)
+            return await self.embedding_batcher.embed(text)
+        async with self.embedding_guard.call():
+            with track_ai_call(AILogStep.EMBEDDING, self.config.embedding_model):
+                return await self.embeddings.aembed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """여러 텍스트를 한 번의 요청으로 임베딩합니다 (사용할 수 없으면 AIUnavailableError)."""
+        # 단건(embed_query)과 같은 벡터 공간을 쓰도록 task_type을 맞춥니다.
+        async with self.embedding_guard.call():
+            with track_ai_call(AILogStep.EMBEDDING, self.config.embedding_model):
+                return await self.embeddings.aembed_documents(texts, task_type="RETRIEVAL_QUERY")
+
+    def schedule_embedding_backfill(self) -> None:
+        """임베딩 없이 저장된 Memory의 임베딩 채우기를 백그라운드에서 시작합니다 (실행 중이면 무시)."""
+        if self._backfill_task is not None and not self._backfill_task.done():
+            return
+        # 요청 컨텍스트(요청 단위 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        self._backfill_task = asyncio.create_task(self._backfill_embeddings(), context=contextvars.Context())
+
+    async def _backfill_embeddings(self) -> None:
+        """
+        임베딩 서비스를 쓸 수 있을 때 배치 단위로 임베딩을 채우고, 남은 Memory가 없으면 끝냅니다.
+
+        저장 트랜잭션이 커밋될 시간을 두기 위해 처음에도 backfill_interval_seconds만큼 기다립니다.
+        """
+        config = self.config.guard
+        while True:
+            await asyncio.sleep(config.backfill_interval_seconds)
+            try:
+                while self.embedding_guard.available:
+                    pending = await self.memory_repository.get_without_embedding(config.backfill_batch_size)
+                    if not pending:
+                        return
+                    embeddings = await self.embed_documents([text for _memory_id, text in pending])
+                    await self.memory_repository.update_embeddings(
+                        [
+                            (memory_id, embedding)
+                            for (memory_id, _text), embedding in zip(pending, embeddings, strict=True)
+                        ]
+                    )
+                    logger.info("Embeddings backfilled: %d memories", len(pending))
+            except Exception as e:
+                logger.warning("Embedding backfill failed, retrying in %.0fs: %r", config.backfill_interval_seconds, e)
+
     async def process(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> AssistantResponse:
         """
         사용자 입력을 처리합니다.
@@ -163,14 +369,33 @@ weekday 값 (frequency=weekly일 때):
         2. save면 파싱 후 저장
         3. query면 벡터 검색 후 답변 생성
         """
+        prepared = await self.prepare(text, user_id, timezone)
+        if isinstance(prepared, PreparedSave):
+            return await self.apply(prepared, user_id, timezone)
+        return prepared
+
+    async def prepare(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> AssistantResponse | PreparedSave:
+        """
+        LLM/임베딩 단계만 수행합니다 (DB 쓰기 없음).
+
+        - save: 파싱 + 임베딩 결과(PreparedSave) 반환 → apply()로 저장
+        - query/unknown: 최종 응답 반환 (query의 벡터 검색은 짧은 읽기 세션만 사용)
+
+        LLM 호출 동안 트랜잭션(커넥션)을 잡고 있지 않도록, 호출자는 이 메서드를
+        트랜잭션 밖에서 호출하고 apply()만 짧은 트랜잭션으로 감싸야 합니다.
+        """
         intent_result = await self._classify_intent(text, user_id)
 
         if intent_result.intent == IntentType.SAVE:
-            save_result = await self._handle_save(text, user_id, timezone)
-            return AssistantResponse(
-                intent=IntentType.SAVE,
-                save_result=save_result,
-            )
+            parsed = await self._parse_text(text, user_id, timezone)
+            embedding: list[float] | None
+            try:
+                embedding = await self.embed_query(text)
+            except AIUnavailableError:
+                logger.warning("Embedding unavailable, saving without embedding (backfilled later)")
+                embedding = None
+                self.schedule_embedding_backfill()
+            return PreparedSave(text=text, parsed=parsed, embedding=embedding)
         elif intent_result.intent == IntentType.QUERY:
             query_result = await self._handle_query(text, user_id)
             return AssistantResponse(
@@ -185,20 +410,36 @@ weekday 값 (frequency=weekly일 때):
                 ),
             )
 
+    @transactional
+    async def apply(self, prepared: PreparedSave, user_id: int, timezone: str = "Asia/Seoul") -> AssistantResponse:
+        """prepare() 결과를 저장합니다 (Memory + Reminder를 하나의 트랜잭션으로)."""
+        save_result = await self._handle_save(prepared, user_id, timezone)
+        return AssistantResponse(
+            intent=IntentType.SAVE,
+            save_result=save_result,
+        )
+
     @ai_log(step=AILogStep.INTENT_CLASSIFICATION)
     async def _classify_intent(self, text: str, user_id: int) -> IntentClassification:
         """의도를 분류합니다 (with_structured_output 사용)."""
-        structured_llm = self.llm.with_structured_output(IntentClassification)
+        llm, system_prompt = await self._prompt_llm(AILogStep.INTENT_CLASSIFICATION, self.INTENT_SYSTEM_PROMPT)
+        structured_llm = llm.with_structured_output(IntentClassification)
 
-        messages = [
-            SystemMessage(content=self.INTENT_SYSTEM_PROMPT),
-            HumanMessage(content=text),
-        ]
+        messages = _chat_messages(system_prompt, text)
 
         try:
-            result = await structured_llm.ainvoke(messages)
+            # 중복 전송/재시도로 같은 입력이 동시에 들어오면 호출 하나의 결과를 같이 사용
+            result = await self.single_flight.do(
+                AILogStep.INTENT_CLASSIFICATION,
+                (llm.model, text),
+                partial(self._invoke_llm, AILogStep.INTENT_CLASSIFICATION, llm.model, structured_llm, messages),
+                _INTENT_ADAPTER,
+            )
             if isinstance(result, IntentClassification):
                 return result
+        except AIUnavailableError:
+            logger.warning("LLM unavailable, estimating intent without classification")
+            return self._estimate_intent(text)
         except ValueError as e:
             logger.warning(f"Intent classification parsing failed: {e}")
         except Exception as e:
@@ -206,17 +447,24 @@ weekday 값 (frequency=weekly일 때):
 
         return IntentClassification(intent=IntentType.UNKNOWN, reason=_("Classification failed"))
 
-    async def _handle_save(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> AssistantSaveResponse:
-        """정보를 파싱하고 저장합니다."""
-        parsed = await self._parse_text(text, user_id, timezone)
-        embedding = await self.embeddings.aembed_query(text)
-        saved_memory = await self._save_memory(parsed, text, embedding, user_id)
+    def _estimate_intent(self, text: str) -> IntentClassification:
+        """LLM 없이 의도를 추정합니다 (질문 표현이 있으면 query, 아니면 save - 원문이 memo로 저장됨)."""
+        intent = IntentType.QUERY if any(marker in text for marker in self.QUESTION_MARKERS) else IntentType.SAVE
+        return IntentClassification(intent=intent, reason=_("Estimated without AI (AI service unavailable)"))
+
+    async def _handle_save(
+        self, prepared: PreparedSave, user_id: int, timezone: str = "Asia/Seoul"
+    ) -> AssistantSaveResponse:
+        """파싱된 정보를 저장합니다."""
+        parsed = prepared.parsed
+        saved_memory = await self._save_memory(parsed, prepared.text, prepared.embedding, user_id)
 
         memory_id = saved_memory.id
         if memory_id is None:
             raise ValueError("Memory ID should not be None after creation")
 
         saved_reminder = await self._save_reminder(parsed.reminder, memory_id, user_id, timezone)
+        await on_commit(lambda: self.memory_calendar_service.invalidate(user_id))
         message = self._build_save_message(parsed)
 
         return AssistantSaveResponse(
@@ -229,11 +477,22 @@ weekday 값 (frequency=weekly일 때):
         self,
         parsed: ParsedMemory,
         original_text: str,
-        embedding: list[float],
+        embedding: list[float] | None,
         user_id: int,
     ) -> Memory:
         """Memory를 저장합니다."""
-        memory = Memory(
+        memory = self.build_memory(parsed, original_text, embedding, user_id)
+        return await self.memory_repository.create(memory)
+
+    def build_memory(
+        self,
+        parsed: ParsedMemory,
+        original_text: str,
+        embedding: list[float] | None,
+        user_id: int,
+    ) -> Memory:
+        """파싱 결과로 저장 전 Memory 객체를 만듭니다."""
+        return Memory(
             type=parsed.type,
             keywords=parsed.keywords,
             content=parsed.content,
@@ -242,7 +501,6 @@ weekday 값 (frequency=weekly일 때):
             embedding=embedding,
             user_id=user_id,
         )
-        return await self.memory_repository.create(memory)
 
     def _to_reminder_response(self, reminder: Reminder | None) -> ReminderResponse | None:
         """Reminder를 ReminderResponse로 변환합니다."""
@@ -258,10 +516,23 @@ weekday 값 (frequency=weekly일 때):
         timezone: str = "Asia/Seoul",
     ) -> Reminder | None:
         """Reminder를 저장합니다."""
+        reminder = self.build_reminder(reminder_info, memory_id, user_id, timezone)
+        if reminder is None:
+            return None
+        return await self.reminder_repository.create(reminder)
+
+    def build_reminder(
+        self,
+        reminder_info: ReminderInfo | None,
+        memory_id: int,
+        user_id: int,
+        timezone: str = "Asia/Seoul",
+    ) -> Reminder | None:
+        """알림 정보로 저장 전 Reminder 객체를 만듭니다 (next_run_at 계산 포함)."""
         if reminder_info is None:
             return None
 
-        reminder = Reminder(
+        return Reminder(
             memory_id=memory_id,
             frequency=reminder_info.frequency,
             weekdays=reminder_info.weekdays,
@@ -278,7 +549,6 @@ weekday 값 (frequency=weekly일 때):
             ),
             user_id=user_id,
         )
-        return await self.reminder_repository.create(reminder)
 
     def _build_save_message(self, parsed: ParsedMemory) -> str:
         """저장 응답 메시지를 생성합니다."""
@@ -287,33 +557,40 @@ weekday 값 (frequency=weekly일 때):
             message += " " + _("Reminder has also been set.")
         return message
 
+    async def parse(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> ParsedMemory:
+        """의도 분류 없이 텍스트를 파싱만 합니다 (일괄 가져오기용, 저장하지 않음)."""
+        return await self._parse_text(text, user_id, timezone)
+
     @ai_log(step=AILogStep.TEXT_PARSING)
     async def _parse_text(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> ParsedMemory:
         """텍스트에서 정보를 추출합니다 (with_structured_output 사용)."""
-        structured_llm = self.llm.with_structured_output(ParsedMemory)
+        llm, system_prompt = await self._prompt_llm(AILogStep.TEXT_PARSING, self.PARSE_SYSTEM_PROMPT)
+        structured_llm = llm.with_structured_output(ParsedMemory)
 
-        tz = ZoneInfo(timezone)
-        now = datetime.now(tz)
-        current_datetime_str = now.strftime("%Y-%m-%d %H:%M (%A)")
-        system_prompt = self.PARSE_SYSTEM_PROMPT + f"\n\n현재 날짜/시간: {current_datetime_str}"
+        # 호출마다 바뀌는 현재 시각은 사용자 턴에 넣어 시스템 프롬프트가 항상 같은 prefix가 되게 함
+        now = datetime.now(ZoneInfo(timezone))
+        context = f"현재 날짜/시간: {now.strftime('%Y-%m-%d %H:%M (%A)')} ({timezone})"
 
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=text),
-        ]
+        messages = _chat_messages(system_prompt, text, context=context)
 
         try:
-            result = await structured_llm.ainvoke(messages)
+            # 현재 시각(분 단위)도 입력이므로 key에 포함
+            result = await self.single_flight.do(
+                AILogStep.TEXT_PARSING,
+                (llm.model, context, text),
+                partial(self._invoke_llm, AILogStep.TEXT_PARSING, llm.model, structured_llm, messages),
+                _PARSED_ADAPTER,
+            )
             if isinstance(result, ParsedMemory):
                 return result
+        except AIUnavailableError:
+            logger.warning("LLM unavailable, saving the text as memo without parsing")
         except ValueError as e:
             logger.warning(f"Text parsing failed: {e}")
         except Exception as e:
             logger.error(f"Unexpected error during text parsing: {e}", exc_info=True)
 
         # 파싱 실패시 기본값
-        from apps.types.assistant import MemoryType
-
         return ParsedMemory(
             type=MemoryType.MEMO,
             keywords="",
@@ -323,8 +600,8 @@ weekday 값 (frequency=weekly일 때):
 
     async def _handle_query(self, text: str, user_id: int) -> AssistantQueryResponse:
         """질문에 답변합니다."""
-        # 1. 쿼리 임베딩 생성
-        embedding = await self.embeddings.aembed_query(text)
+        # 1. 쿼리 임베딩 생성 (사용할 수 없으면 검색할 수 없으므로 AIUnavailableError → 503)
+        embedding = await self.embed_query(text)
 
         # 2. 벡터 검색
         results = await self.memory_repository.search_by_vector(
@@ -343,7 +620,26 @@ weekday 값 (frequency=weekly일 때):
             for memory, similarity in results
         ]
 
-        # 4. LLM으로 답변 생성
+        # 4. 답이 metadata 필드 하나인 확실한 결과는 템플릿으로, 나머지는 LLM으로 답변 생성
+        planned = self.answer_planner.plan(text, results)
+        if planned is not None:
+            answer = await self._template_answer(text, user_id, planned)
+        else:
+            answer = await self._generate_answer(text, user_id, results)
+
+        return AssistantQueryResponse(
+            answer=answer,
+            related_memories=related_memories,
+        )
+
+    @ai_log(step=AILogStep.ANSWER_TEMPLATE)
+    async def _template_answer(self, text: str, user_id: int, answer: str) -> str:
+        """AnswerPlanner가 만든 템플릿 답변 (LLM 답변과의 비율을 AI 로그로 남기기 위한 단계)"""
+        return answer
+
+    @ai_log(step=AILogStep.ANSWER_GENERATION)
+    async def _generate_answer(self, text: str, user_id: int, results: list[tuple[Memory, float]]) -> str:
+        """검색 결과를 바탕으로 LLM이 답변을 생성합니다."""
         if results:
             context = "\n".join([f"- {memory.content} (관련도: {similarity:.2f})" for memory, similarity in results])
             answer_prompt = f"""사용자 질문: {text}
@@ -357,14 +653,17 @@ weekday 값 (frequency=weekly일 때):
 
 관련 정보가 없습니다. 적절히 답변해주세요."""
 
-        messages = [
-            SystemMessage(content=self.ANSWER_SYSTEM_PROMPT),
-            HumanMessage(content=answer_prompt),
-        ]
-        response = await self.llm.ainvoke(messages)
-        answer = response.content if isinstance(response.content, str) else str(response.content)
-
-        return AssistantQueryResponse(
-            answer=answer,
-            related_memories=related_memories,
-        )
+        messages = _chat_messages(self.ANSWER_SYSTEM_PROMPT, answer_prompt)
+        llm = self.llm_for(AILogStep.ANSWER_GENERATION)
+        try:
+            response = await self._invoke_llm(AILogStep.ANSWER_GENERATION, llm.model, llm, messages)
+        except AIUnavailableError:
+            # 답변 없이 검색된 관련 정보만 안내
+            logger.warning("LLM unavailable, answering with related memories only")
+            if results:
+                answer = _("AI answers are temporarily unavailable. Here are the related memories I found.")
+            else:
+                answer = _("AI answers are temporarily unavailable, and no related memories were found.")
+        else:
+            answer = response.content if isinstance(response.content, str) else str(response.content)
+        return answer
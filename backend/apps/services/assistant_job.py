@@ -0,0 +1,241 @@
+import asyncio
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from fastapi import status
+from pydantic_core import to_jsonable_python
+
+from apps.cache import RedisCache
+from apps.exceptions import AppException, NotFoundError
+from apps.i18n import _, get_locale, set_locale
+from apps.schemas.assistant import AssistantJobResponse
+from apps.schemas.conversation import ProcessVoiceRequest
+from apps.services.assistant import AssistantService
+from apps.services.conversation import ConversationService
+from apps.types.assistant_job import AssistantJob, AssistantJobConfig, AssistantJobKind, AssistantJobStatus
+from apps.utils.datetime_utils import TIMEZONE_CONTEXT_KEY
+from database import read_routing
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _QueuedJob:
+    """대기열에 들어간 작업"""
+
+    job: AssistantJob
+    run: Callable[[], Awaitable[dict[str, Any]]]
+    locale: str
+    # 작업이 끝나면 설정 (long-poll 즉시 응답용)
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class AssistantJobService:
+    """
+    Assistant 비동기 작업 서비스 (/assistant/chat, /assistant/voice의 mode=async)
+
+    요청을 받으면 작업 상태만 Redis에 기록하고 작업 ID를 즉시 반환합니다.
+    LLM 처리 시간 동안 HTTP 요청을 붙잡지 않으므로, API 처리량이 LLM 지연과 분리됩니다.
+
+    - 사용자별 대기열 하나에 워커 하나: 같은 사용자의 작업은 들어온 순서대로 하나씩 처리
+    - 전체 동시 처리 수는 max_concurrency로 제한
+    - 결과는 GET /assistant/jobs/{job_id}?wait=N (long-poll)으로 조회
+    - 종료 시 shutdown_timeout_seconds 안에 끝나지 않은 작업은 재시도 안내와 함께 failed로 기록
+
+    순서 보장은 프로세스 단위입니다. 여러 프로세스로 띄운다면 사용자별로 같은 프로세스에
+    라우팅해야 저장 순서가 보장됩니다.
+    """
+
+    JOB_KEY_PREFIX = "assistant_job:"
+
+    def __init__(
+        self,
+        config: AssistantJobConfig,
+        assistant_service: AssistantService,
+        conversation_service: ConversationService,
+        redis_cache: RedisCache,
+    ):
+        self.config = config
+        self.assistant_service = assistant_service
+        self.conversation_service = conversation_service
+        self.redis_cache = redis_cache
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        self._queues: dict[int, asyncio.Queue[_QueuedJob]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        # 이 프로세스에서 아직 끝나지 않은 작업 (대기 중 + 처리 중)
+        self._jobs: dict[str, _QueuedJob] = {}
+        # 종료 중이면 워커가 대기열의 다음 작업을 시작하지 않음
+        self._stopping = False
+
+    async def submit_chat(self, text: str, user_id: int, timezone: str = "Asia/Seoul") -> AssistantJobResponse:
+        """/assistant/chat 요청을 작업으로 등록합니다."""
+
+        async def run() -> dict[str, Any]:
+            result = await self.assistant_service.process(text=text, user_id=user_id, timezone=timezone)
+            data: dict[str, Any] = to_jsonable_python(result, context={TIMEZONE_CONTEXT_KEY: timezone})
+            return data
+
+        return await self._submit(AssistantJobKind.CHAT, user_id, run)
+
+    async def submit_voice(
+        self, request: ProcessVoiceRequest, user_id: int, timezone: str = "Asia/Seoul"
+    ) -> AssistantJobResponse:
+        """/assistant/voice 요청을 작업으로 등록합니다."""
+
+        async def run() -> dict[str, Any]:
+            result = await self.conversation_service.process_voice(request=request, user_id=user_id, timezone=timezone)
+            return result.model_dump(mode="json")
+
+        return await self._submit(AssistantJobKind.VOICE, user_id, run)
+
+    async def wait(self, job_id: str, user_id: int, wait_seconds: float = 0) -> AssistantJobResponse:
+        """
+        작업 상태를 조회합니다 (본인 작업만).
+
+        wait_seconds > 0이면 작업이 끝나거나 대기 시간이 지날 때까지 기다렸다가 응답합니다 (long-poll).
+        """
+        job = await self._load_job(job_id, user_id)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(wait_seconds, self.config.max_wait_seconds)
+        while not job.finished and (remaining := deadline - loop.time()) > 0:
+            item = self._jobs.get(job_id)
+            if item is not None:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(item.finished.wait(), timeout=remaining)
+            else:
+                # 다른 프로세스에서 처리 중인 작업 - Redis 상태를 주기적으로 확인
+                await asyncio.sleep(min(self.config.poll_interval_seconds, remaining))
+            job = await self._load_job(job_id, user_id)
+
+        return AssistantJobResponse.model_validate(job)
+
+    async def stop(self) -> None:
+        """
+        처리 중인 작업이 끝날 때까지 기다립니다 (main.lifespan 종료 시 호출).
+
+        shutdown_timeout_seconds가 지나면 남은 작업(대기/처리 중)을 failed로 기록한 뒤 워커를 취소합니다.
+        기록하지 않으면 작업이 pending/running으로 남아 클라이언트가 job_ttl_seconds 동안 기다리게 됩니다.
+        """
+        workers = list(self._workers.values())
+        if not workers:
+            return
+        _done, pending = await asyncio.wait(workers, timeout=self.config.shutdown_timeout_seconds)
+        if not pending:
+            return
+
+        self._stopping = True
+        await self._fail_unfinished()
+        for task in pending:
+            task.cancel()
+        logger.warning("Assistant job workers cancelled on shutdown: %d users", len(pending))
+
+    async def _fail_unfinished(self) -> None:
+        """끝나지 않은 작업을 재시도 안내와 함께 failed로 기록합니다."""
+        items = list(self._jobs.values())
+        locale = get_locale()
+        try:
+            for item in items:
+                set_locale(item.locale)
+                item.job.status = AssistantJobStatus.FAILED
+                item.job.error = _("The server restarted before the request finished. Please try again.")
+        finally:
+            set_locale(locale)
+
+        results = await asyncio.gather(*(self._save_job(item.job) for item in items), return_exceptions=True)
+        for item, result in zip(items, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("Failed to save interrupted assistant job: job_id=%s: %r", item.job.job_id, result)
+            self._finish(item)
+        logger.warning("Assistant jobs failed on shutdown: %d jobs", len(items))
+
+    async def _submit(
+        self,
+        kind: AssistantJobKind,
+        user_id: int,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> AssistantJobResponse:
+        queue = self._queues.get(user_id)
+        if queue is not None and queue.qsize() >= self.config.max_pending_per_user:
+            raise AppException(_("Too many pending requests."), status.HTTP_429_TOO_MANY_REQUESTS)
+
+        job = AssistantJob(job_id=uuid4().hex, user_id=user_id, kind=kind)
+        await self._save_job(job)
+
+        # 아래부터는 await 없이 실행되어 워커 종료와 경합하지 않습니다.
+        item = _QueuedJob(job=job, run=run, locale=get_locale())
+        self._jobs[job.job_id] = item
+        queue = self._queues.setdefault(user_id, asyncio.Queue())
+        queue.put_nowait(item)
+        if user_id not in self._workers:
+            # 요청 컨텍스트(트랜잭션 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+            self._workers[user_id] = asyncio.create_task(self._worker(user_id, queue), context=contextvars.Context())
+
+        return AssistantJobResponse.model_validate(job)
+
+    async def _worker(self, user_id: int, queue: asyncio.Queue[_QueuedJob]) -> None:
+        """사용자의 작업을 들어온 순서대로 하나씩 처리하고, 대기열이 비면 종료합니다."""
+        try:
+            while not queue.empty() and not self._stopping:
+                item = queue.get_nowait()
+                # 앞선 작업에서 저장한 내용을 바로 다음 작업이 읽을 수 있도록 읽기도 primary에서 수행
+                async with self._semaphore:
+                    if self._stopping:
+                        # 슬롯을 기다리는 동안 종료가 시작됨 - 작업은 stop()이 failed로 기록
+                        break
+                    with read_routing(primary=True):
+                        await self._execute(item)
+        finally:
+            self._queues.pop(user_id, None)
+            self._workers.pop(user_id, None)
+
+    async def _execute(self, item: _QueuedJob) -> None:
+        job = item.job
+        set_locale(item.locale)
+
+        try:
+            job.status = AssistantJobStatus.RUNNING
+            await self._save_job(job)
+            job.result = await item.run()
+            job.status = AssistantJobStatus.COMPLETED
+        except AppException as e:
+            job.status = AssistantJobStatus.FAILED
+            job.error = e.message
+        except Exception:
+            logger.exception("Assistant job failed: job_id=%s, kind=%s", job.job_id, job.kind.value)
+            job.status = AssistantJobStatus.FAILED
+            job.error = _("Failed to process the request.")
+
+        try:
+            await self._save_job(job)
+        except Exception:
+            logger.exception("Failed to save assistant job result: job_id=%s", job.job_id)
+
+        self._finish(item)
+
+    def _finish(self, item: _QueuedJob) -> None:
+        if self._jobs.pop(item.job.job_id, None) is not None:
+            item.finished.set()
+
+    async def _load_job(self, job_id: str, user_id: int) -> AssistantJob:
+        data = await self.redis_cache.get_json(f"{self.JOB_KEY_PREFIX}{job_id}")
+        if data is None:
+            raise NotFoundError(_("Job not found."))
+
+        job = AssistantJob.model_validate(data)
+        if job.user_id != user_id:
+            raise NotFoundError(_("Job not found."))
+        return job
+
+    async def _save_job(self, job: AssistantJob) -> None:
+        """작업 상태를 Redis에 저장합니다."""
+        await self.redis_cache.set_json(
+            f"{self.JOB_KEY_PREFIX}{job.job_id}",
+            job.model_dump(mode="json"),
+            ex=self.config.job_ttl_seconds,
+        )
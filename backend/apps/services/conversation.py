@@ -2,6 +2,8 @@ import logging
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+
 from apps.exceptions import NotFoundError
 from apps.models.conversation import Conversation
 from apps.models.voice import VoiceSession
@@ -10,7 +12,7 @@ from apps.schemas.assistant import AssistantResponse
 from apps.schemas.conversation import ConversationResponse, ProcessVoiceRequest
 from apps.services.assistant import AssistantService
 from apps.services.voice_session import VoiceSessionService
-from apps.types.assistant import IntentType
+from apps.types.assistant import IntentType, PreparedSave
 from apps.types.conversation import ExtractedConversationData, Intent
 from database import transactional
 
@@ -30,22 +32,65 @@ class ConversationService:
         self.conversation_repository = conversation_repository
         self.assistant_service = assistant_service
 
-    @transactional
     async def process_voice(
         self, request: ProcessVoiceRequest, user_id: int, timezone: str = "Asia/Seoul"
     ) -> ConversationResponse:
-        """음성 세션을 처리하여 대화 기록을 생성합니다. (트랜잭션 적용)"""
+        """
+        음성 세션을 처리하여 대화 기록을 생성합니다.
+
+        LLM 호출 동안 DB 커넥션을 잡고 있지 않도록 세 단계로 나눕니다.
+
+        1. 읽기: VoiceSession 조회 (이미 처리된 세션이면 기존 결과 반환)
+        2. LLM: 의도 분류/파싱/임베딩/답변 생성 (트랜잭션 없음)
+        3. 쓰기: VoiceSession 확인, Memory/Reminder, Conversation을 하나의 짧은 트랜잭션으로 저장
+
+        같은 세션에 대한 재시도/동시 요청은 conversation.voice_session_id 유니크 제약으로
+        한 번만 저장되며, 나머지는 먼저 저장된 결과를 반환합니다.
+        """
         voice_session = await self._get_voice_session(request.session_id, user_id)
-        final_text = self._determine_final_text(request.text, voice_session)
-        await self._update_voice_session_confirmation(voice_session, final_text)
+        voice_session_id = voice_session.id
+        if voice_session_id is None:
+            raise ValueError("VoiceSession ID should not be None")
 
-        assistant_response = await self.assistant_service.process(final_text, user_id, timezone)
-        extracted = self._extract_result_data(assistant_response)
+        existing = await self._get_existing_response(voice_session_id)
+        if existing is not None:
+            return existing
+
+        final_text = self._determine_final_text(request.text, voice_session)
+        prepared = await self.assistant_service.prepare(final_text, user_id, timezone)
+
+        try:
+            return await self._save_result(voice_session, final_text, prepared, user_id, timezone)
+        except IntegrityError:
+            # 다른 요청이 먼저 저장함 - 이 요청의 쓰기는 롤백되었으므로 기존 결과 반환
+            existing = await self._get_existing_response(voice_session_id)
+            if existing is None:
+                raise
+            logger.info(f"VoiceSession already processed concurrently: voice_session_id={voice_session_id}")
+            return existing
 
+    @transactional
+    async def _save_result(
+        self,
+        voice_session: VoiceSession,
+        final_text: str,
+        prepared: AssistantResponse | PreparedSave,
+        user_id: int,
+        timezone: str,
+    ) -> ConversationResponse:
+        """LLM 처리 결과를 하나의 트랜잭션으로 저장합니다."""
         voice_session_id = voice_session.id
         if voice_session_id is None:
             raise ValueError("VoiceSession ID should not be None")
 
+        await self._update_voice_session_confirmation(voice_session, final_text)
+
+        if isinstance(prepared, PreparedSave):
+            assistant_response = await self.assistant_service.apply(prepared, user_id, timezone)
+        else:
+            assistant_response = prepared
+        extracted = self._extract_result_data(assistant_response)
+
         conversation = await self._create_conversation_record(
             voice_session_id=voice_session_id,
             user_id=user_id,
@@ -68,6 +113,21 @@ class ConversationService:
             created_reminder_ids=extracted.reminder_ids,
         )
 
+    async def _get_existing_response(self, voice_session_id: int) -> ConversationResponse | None:
+        """이미 처리된 VoiceSession이면 저장된 Conversation으로 응답을 만듭니다."""
+        conversation = await self.conversation_repository.get_by_voice_session_id(voice_session_id)
+        if conversation is None or conversation.id is None:
+            return None
+
+        memory_ids, reminder_ids = await self.conversation_repository.get_linked_ids(conversation.id)
+        return ConversationResponse(
+            conversation_id=conversation.id,
+            intent=Intent.model_validate(conversation.intent),
+            assistant_response=conversation.assistant_response,
+            created_memory_ids=memory_ids,
+            created_reminder_ids=reminder_ids,
+        )
+
     async def _get_voice_session(self, session_id: UUID, user_id: int) -> VoiceSession:
         """VoiceSession을 조회하고 권한을 검증합니다."""
         voice_session = await self.voice_session_service.get_by_session_id(session_id)
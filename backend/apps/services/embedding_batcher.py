@@ -0,0 +1,98 @@
+import asyncio
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable
+
+from apps.exceptions import AIUnavailableError
+from apps.metrics import EMBEDDING_BATCH_SIZE
+from apps.types.embedding_batch import EmbeddingBatchConfig
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    단건 임베딩 요청 묶기 (AssistantConfig.embedding_batch)
+
+    저장/질문마다 텍스트 하나씩 임베딩하면 동시 요청이 많을 때 작은 API 요청이 그만큼 생깁니다.
+    요청을 모아 embed(텍스트 목록) 한 번으로 보내고 결과를 요청별로 나눠 줍니다.
+
+    - 첫 요청부터 max_wait_seconds가 지나거나 max_batch_size개가 모이면 전송
+    - 같은 배치 안의 같은 텍스트는 한 번만 보냄
+    - 배치 호출이 실패하면 그 배치의 요청 모두에 같은 예외 전달
+    - 요청별로 request_timeout_seconds 안에 결과가 없으면 AIUnavailableError
+
+    사용 예:
+        batcher = EmbeddingBatcher(config.embedding_batch, self.embed_documents)
+        embedding = await batcher.embed(text)
+    """
+
+    def __init__(
+        self,
+        config: EmbeddingBatchConfig,
+        embed: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ):
+        self.config = config
+        self._embed = embed
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # 실행 중인 배치 태스크 참조 유지 (GC로 인한 태스크 유실 방지)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        """텍스트 하나를 다른 요청과 묶어서 임베딩합니다."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.config.max_wait_seconds, self._flush)
+
+        # 시간 초과/취소되면 future도 취소되어 배치 결과를 받지 않음
+        try:
+            async with asyncio.timeout(self.config.request_timeout_seconds):
+                return await future
+        except TimeoutError as e:
+            raise AIUnavailableError() from e
+
+    def _flush(self) -> None:
+        """모인 요청을 배치 하나로 보냅니다."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+        # 먼저 온 요청의 컨텍스트(요청 단위 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        task = asyncio.create_task(self._run(batch), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        texts = list(dict.fromkeys(text for text, _future in batch))
+        EMBEDDING_BATCH_SIZE.observe(len(texts))
+        try:
+            embeddings = await self._embed(texts)
+        except asyncio.CancelledError:
+            for _text, future in batch:
+                if not future.done():
+                    future.set_exception(AIUnavailableError())
+            raise
+        except Exception as e:
+            for _text, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings, strict=True))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+    async def close(self) -> None:
+        """대기 중인 요청을 보내고 진행 중인 배치가 끝날 때까지 기다립니다 (종료 시 호출)."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
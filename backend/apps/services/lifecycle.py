@@ -0,0 +1,206 @@
+import asyncio
+import contextvars
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, suppress
+
+from apps.cache import RedisCache
+from apps.schemas.health import ReadinessResponse
+from apps.services.ai_log_sink import AILogSink
+from apps.services.assistant import AssistantService
+from apps.services.assistant_job import AssistantJobService
+from apps.services.memory_import import MemoryImportService
+from apps.services.session import SessionService
+from apps.services.streaming_voice import StreamingVoiceService
+from apps.services.voice import VoiceService
+from apps.types.lifecycle import ComponentStatus, LifecycleConfig, LifecycleState
+from database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class LifecycleService:
+    """
+    API 프로세스 시작/종료 관리 (main.lifespan에서 사용)
+
+    시작:
+    - 외부 클라이언트(DB 풀, Redis, Speech gRPC 채널, LLM/임베딩)를 백그라운드에서 미리 연결
+    - warm-up이 끝날 때까지 /ready는 503 (로드 밸런서가 트래픽을 보내지 않음)
+    - 필수 구성 요소(DB primary, Redis)는 연결될 때까지 warmup_retry_seconds마다 재시도
+    - 선택 구성 요소(DB 복제본, Speech, LLM) warm-up 실패는 로그만 남김 (첫 요청에서 다시 연결)
+
+    종료:
+    1. DRAINING 상태로 바꿔 /ready는 503, 새 음성 스트림은 거절
+    2. 처리 중인 음성 스트림(녹음 저장, VoiceSession 생성 포함)이 끝날 때까지 대기
+    3. 백그라운드 작업(비동기 Assistant 작업, Memory 가져오기, AI 로그 큐) 마무리
+    4. 모든 외부 클라이언트 종료 (DB 풀은 마지막 - 앞 단계에서 DB를 쓰므로)
+
+    uvicorn은 lifespan 종료 전에 열린 WebSocket을 먼저 닫지만 (1012), 연결이 끊긴 뒤에도
+    consumer의 정리 작업(녹음 저장 등)은 계속 실행되므로 2단계에서 이를 기다립니다.
+    """
+
+    REQUIRED_COMPONENTS = ("database", "redis")
+
+    def __init__(
+        self,
+        config: LifecycleConfig,
+        database: Database,
+        redis_cache: RedisCache,
+        session_service: SessionService,
+        streaming_voice_service: StreamingVoiceService,
+        voice_service: VoiceService,
+        assistant_service: AssistantService,
+        assistant_job_service: AssistantJobService,
+        memory_import_service: MemoryImportService,
+        ai_log_sink: AILogSink,
+    ):
+        self.config = config
+        self.database = database
+        self.redis_cache = redis_cache
+        self.session_service = session_service
+        self.streaming_voice_service = streaming_voice_service
+        self.voice_service = voice_service
+        self.assistant_service = assistant_service
+        self.assistant_job_service = assistant_job_service
+        self.memory_import_service = memory_import_service
+        self.ai_log_sink = ai_log_sink
+        self.state = LifecycleState.STARTING
+        self.components: dict[str, ComponentStatus] = {}
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._active_streams = 0
+        self._streams_idle = asyncio.Event()
+        self._streams_idle.set()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == LifecycleState.READY
+
+    @property
+    def accepting_streams(self) -> bool:
+        """새 음성 스트림을 받을 수 있는지 (종료 중에는 거절)"""
+        return self.state in (LifecycleState.STARTING, LifecycleState.READY)
+
+    def readiness(self) -> ReadinessResponse:
+        return ReadinessResponse(
+            state=self.state,
+            components=dict(self.components),
+            active_streams=self._active_streams,
+        )
+
+    def start(self) -> None:
+        """백그라운드 작업과 warm-up을 시작합니다 (warm-up이 끝나기 전에도 요청은 처리됨)."""
+        self.ai_log_sink.start()
+        # 이전 프로세스에서 임베딩 없이 저장된 Memory 채우기 (남은 것이 없으면 바로 끝남)
+        self.assistant_service.schedule_embedding_backfill()
+        if not self.config.warmup_enabled:
+            self.state = LifecycleState.READY
+            return
+        # 요청 컨텍스트를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        self._warmup_task = asyncio.create_task(self.warmup(), context=contextvars.Context())
+
+    async def warmup(self) -> None:
+        """구성 요소를 동시에 warm-up하고, 필수 구성 요소가 모두 준비되면 READY로 바꿉니다."""
+        config = self.config
+        components: dict[str, Callable[[], Awaitable[None]] | None] = {
+            "database": self._warmup_database,
+            # 복제본은 선택 구성 요소 - 연결하지 못해도 읽기는 primary로 대체됨
+            "database_replicas": self._warmup_database_replicas if self.database.has_replicas else None,
+            "redis": self._warmup_redis if config.warmup_redis else None,
+            "speech": self.streaming_voice_service.warmup if config.warmup_speech else None,
+            "llm": self._warmup_llm if config.warmup_llm else None,
+        }
+        jobs = []
+        for name, warmup in components.items():
+            if warmup is None:
+                self.components[name] = ComponentStatus.SKIPPED
+                continue
+            self.components[name] = ComponentStatus.PENDING
+            jobs.append(self._warmup_component(name, warmup))
+
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*jobs)
+        if self.state == LifecycleState.STARTING:
+            self.state = LifecycleState.READY
+            logger.info(
+                "Warm-up finished in %.2fs: %s",
+                asyncio.get_running_loop().time() - started,
+                {name: status.value for name, status in self.components.items()},
+            )
+
+    async def _warmup_component(self, name: str, warmup: Callable[[], Awaitable[None]]) -> None:
+        """필수 구성 요소는 성공할 때까지 재시도하고, 선택 구성 요소는 한 번만 시도합니다."""
+        required = name in self.REQUIRED_COMPONENTS
+        while True:
+            try:
+                await asyncio.wait_for(warmup(), timeout=self.config.warmup_timeout_seconds)
+            except Exception as e:
+                self.components[name] = ComponentStatus.FAILED
+                if not required:
+                    logger.warning("Warm-up of %s failed (connects on first use): %r", name, e)
+                    return
+                logger.warning("Warm-up of %s failed, retrying in %.0fs: %r", name, self.config.warmup_retry_seconds, e)
+                await asyncio.sleep(self.config.warmup_retry_seconds)
+            else:
+                self.components[name] = ComponentStatus.READY
+                return
+
+    async def _warmup_database(self) -> None:
+        await self.database.warmup(self.config.warmup_database_connections)
+
+    async def _warmup_database_replicas(self) -> None:
+        await self.database.warmup_replicas(self.config.warmup_database_connections)
+
+    async def _warmup_redis(self) -> None:
+        await asyncio.gather(self.redis_cache.ping(), self.session_service.ping())
+
+    async def _warmup_llm(self) -> None:
+        await self.assistant_service.warmup(call_embedding=self.config.warmup_embedding_call)
+
+    @contextmanager
+    def track_stream(self) -> Iterator[None]:
+        """처리 중인 음성 스트림으로 등록합니다 (종료 시 끝날 때까지 대기)."""
+        self._active_streams += 1
+        self._streams_idle.clear()
+        try:
+            yield
+        finally:
+            self._active_streams -= 1
+            if self._active_streams == 0:
+                self._streams_idle.set()
+
+    async def shutdown(self) -> None:
+        """처리 중인 작업을 마무리하고 모든 외부 클라이언트를 닫습니다."""
+        self.state = LifecycleState.DRAINING
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._warmup_task
+
+        if self._active_streams:
+            logger.info("Draining %d voice streams", self._active_streams)
+            try:
+                await asyncio.wait_for(self._streams_idle.wait(), timeout=self.config.drain_timeout_seconds)
+            except TimeoutError:
+                logger.warning("Voice streams still running after drain timeout: %d", self._active_streams)
+
+        # 처리 중인 비동기 작업 마무리 후, 큐에 남은 AI 로그 저장
+        await self.assistant_job_service.stop()
+        await self.memory_import_service.stop()
+        await self.ai_log_sink.stop()
+
+        await self._close("speech", self.streaming_voice_service.close())
+        await self._close("speech_sync", self.voice_service.close())
+        await self._close("llm", self.assistant_service.close())
+        await self._close("redis", self.redis_cache.close())
+        await self._close("session_redis", self.session_service.close())
+        await self._close("database", self.database.dispose())
+        self.state = LifecycleState.STOPPED
+        logger.info("Shutdown complete")
+
+    @staticmethod
+    async def _close(name: str, close: Awaitable[None]) -> None:
+        """클라이언트 하나를 닫습니다 (실패해도 나머지는 계속 닫음)."""
+        try:
+            await close
+        except Exception:
+            logger.exception("Failed to close %s", name)
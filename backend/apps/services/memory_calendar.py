@@ -0,0 +1,87 @@
+import hashlib
+import json
+from datetime import date
+
+from apps.cache import RedisCache
+from apps.exceptions import AppException
+from apps.i18n import _
+from apps.repositories.memory import MemoryRepository
+from apps.types.calendar import CalendarConfig, CalendarMarks
+from apps.utils.datetime_utils import add_months, local_dates_to_utc_range
+
+
+class MemoryCalendarService:
+    """
+    Memory 캘린더 마킹 서비스
+
+    집계 테이블(memory_hourly_count) 조회 결과를 Redis에 캐시합니다.
+    캐시 키에 사용자별 버전을 포함하여, Memory가 생성/삭제되면 버전만 올려 이전 캐시를 무효화합니다.
+    """
+
+    CACHE_KEY_PREFIX = "memory_calendar:"
+    VERSION_KEY_PREFIX = "memory_calendar_version:"
+
+    def __init__(
+        self,
+        config: CalendarConfig,
+        memory_repository: MemoryRepository,
+        redis_cache: RedisCache,
+    ):
+        self.config = config
+        self.memory_repository = memory_repository
+        self.redis_cache = redis_cache
+
+    async def get_marks(
+        self,
+        user_id: int,
+        timezone: str = "UTC",
+        start_month: date | None = None,
+        end_month: date | None = None,
+    ) -> CalendarMarks:
+        """
+        날짜별 Memory 개수를 조회합니다.
+
+        Args:
+            user_id: 사용자 ID
+            timezone: 날짜를 나눌 사용자 시간대
+            start_month: 시작 월 (포함, 1일 기준). None이면 처음부터
+            end_month: 종료 월 (포함, 1일 기준). None이면 끝까지
+        """
+        if start_month is not None and end_month is not None:
+            months = (end_month.year - start_month.year) * 12 + end_month.month - start_month.month + 1
+            if months < 1:
+                raise AppException(_("Invalid month range."))
+            if months > self.config.max_months:
+                raise AppException(_("Month range is too long. Max: {}").format(self.config.max_months))
+
+        version = await self.redis_cache.get(f"{self.VERSION_KEY_PREFIX}{user_id}") or "0"
+        cache_key = (
+            f"{self.CACHE_KEY_PREFIX}{user_id}:{version}:{timezone}:"
+            f"{start_month.isoformat() if start_month else ''}:{end_month.isoformat() if end_month else ''}"
+        )
+        cached = await self.redis_cache.get_json(cache_key)
+        if cached is not None:
+            return CalendarMarks.model_validate(cached)
+
+        start = end = None
+        if start_month is not None:
+            start = local_dates_to_utc_range(start_month, start_month, timezone)[0]
+        if end_month is not None:
+            end = local_dates_to_utc_range(end_month, add_months(end_month, 1), timezone)[1]
+
+        marks = await self.memory_repository.get_calendar_marks(
+            user_id=user_id, timezone=timezone, start=start, end=end
+        )
+        result = CalendarMarks(etag=_make_etag(marks), marks=marks)
+        await self.redis_cache.set_json(cache_key, result.model_dump(), ex=self.config.cache_ttl_seconds)
+        return result
+
+    async def invalidate(self, user_id: int) -> None:
+        """사용자의 캘린더 캐시를 무효화합니다 (Memory 생성/삭제 후 호출)."""
+        await self.redis_cache.incr(f"{self.VERSION_KEY_PREFIX}{user_id}")
+
+
+def _make_etag(marks: dict[str, int]) -> str:
+    """결과 내용으로 ETag를 만듭니다 (내용이 같으면 버전이 바뀌어도 같은 값)."""
+    payload = json.dumps(marks, sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
@@ -0,0 +1,199 @@
+import asyncio
+import contextvars
+import logging
+from uuid import uuid4
+
+from apps.cache import RedisCache
+from apps.exceptions import AIUnavailableError, AppException, NotFoundError
+from apps.i18n import _
+from apps.models.memory import Memory
+from apps.models.reminder import Reminder
+from apps.repositories.memory import MemoryRepository
+from apps.repositories.reminder import ReminderRepository
+from apps.schemas.memory import MemoryImportJobResponse
+from apps.services.assistant import AssistantService
+from apps.services.memory_calendar import MemoryCalendarService
+from apps.types.assistant import ParsedMemory
+from apps.types.memory_import import MemoryImportConfig, MemoryImportJob, MemoryImportStatus
+from database import transactional
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryImportService:
+    """
+    Memory 일괄 가져오기 서비스 (다른 앱의 메모 이전용)
+
+    요청을 받으면 작업 상태만 Redis에 기록하고 즉시 반환하며,
+    실제 처리는 백그라운드 태스크에서 배치 단위로 진행합니다.
+
+    1. 파싱: 의도 분류 없이 LLM 파싱만 수행 (동시 호출 수 제한)
+    2. 임베딩: 배치마다 aembed_documents 한 번 호출 (사용할 수 없으면 임베딩 없이 저장 후 나중에 채움)
+    3. 저장: 배치마다 Memory/Reminder를 각각 multi-row INSERT ... RETURNING 한 번으로 저장
+    """
+
+    JOB_KEY_PREFIX = "memory_import:"
+
+    def __init__(
+        self,
+        config: MemoryImportConfig,
+        assistant_service: AssistantService,
+        memory_repository: MemoryRepository,
+        reminder_repository: ReminderRepository,
+        memory_calendar_service: MemoryCalendarService,
+        redis_cache: RedisCache,
+    ):
+        self.config = config
+        self.assistant_service = assistant_service
+        self.memory_repository = memory_repository
+        self.reminder_repository = reminder_repository
+        self.memory_calendar_service = memory_calendar_service
+        self.redis_cache = redis_cache
+        # 실행 중인 태스크 참조 유지 (GC로 인한 태스크 유실 방지)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def start_import(
+        self, items: list[str], user_id: int, timezone: str = "Asia/Seoul"
+    ) -> MemoryImportJobResponse:
+        """가져오기 작업을 등록하고 백그라운드 처리를 시작합니다."""
+        texts = [item.strip() for item in items if item.strip()]
+        if not texts:
+            raise AppException(_("No items to import."))
+        if len(texts) > self.config.max_items:
+            raise AppException(_("Too many items to import. Max: {}").format(self.config.max_items))
+
+        job = MemoryImportJob(job_id=uuid4().hex, user_id=user_id, total=len(texts))
+        await self._save_job(job)
+
+        # 요청 컨텍스트(요청 단위 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        task = asyncio.create_task(self._run(job, texts, timezone), context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return MemoryImportJobResponse.model_validate(job)
+
+    async def stop(self) -> None:
+        """처리 중인 가져오기 작업이 끝날 때까지 기다립니다 (종료 시 호출)."""
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        _done, pending = await asyncio.wait(tasks, timeout=self.config.shutdown_timeout_seconds)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("Memory import jobs cancelled on shutdown: %d", len(pending))
+
+    async def get_job(self, job_id: str, user_id: int) -> MemoryImportJobResponse:
+        """가져오기 작업 진행 상태를 조회합니다 (본인 작업만)."""
+        data = await self.redis_cache.get_json(f"{self.JOB_KEY_PREFIX}{job_id}")
+        if data is None:
+            raise NotFoundError(_("Import job not found."))
+
+        job = MemoryImportJob.model_validate(data)
+        if job.user_id != user_id:
+            raise NotFoundError(_("Import job not found."))
+        return MemoryImportJobResponse.model_validate(job)
+
+    async def _run(self, job: MemoryImportJob, texts: list[str], timezone: str) -> None:
+        """배치 단위로 파싱 → 임베딩 → 저장을 수행합니다."""
+        job.status = MemoryImportStatus.RUNNING
+        await self._save_job(job)
+
+        semaphore = asyncio.Semaphore(self.config.parse_concurrency)
+        try:
+            for start in range(0, len(texts), self.config.batch_size):
+                batch = texts[start : start + self.config.batch_size]
+                parsed_list = await asyncio.gather(
+                    *(self._parse_with_limit(semaphore, text, job.user_id, timezone) for text in batch)
+                )
+                job.parsed += len(batch)
+                await self._save_job(job)
+
+                try:
+                    embeddings = await self._embed_batch(batch)
+                    memories, reminders = await self._insert_batch(
+                        batch, parsed_list, embeddings, job.user_id, timezone
+                    )
+                except Exception:
+                    logger.exception("Memory import batch failed: job_id=%s, offset=%d", job.job_id, start)
+                    job.failed += len(batch)
+                else:
+                    await self.memory_calendar_service.invalidate(job.user_id)
+                    job.saved += len(memories)
+                    job.memory_ids.extend(m.id for m in memories if m.id is not None)
+                    job.reminder_ids.extend(r.id for r in reminders if r.id is not None)
+                await self._save_job(job)
+
+            job.status = MemoryImportStatus.COMPLETED
+        except Exception as e:
+            logger.exception("Memory import failed: job_id=%s", job.job_id)
+            job.status = MemoryImportStatus.FAILED
+            job.error = str(e)
+
+        await self._save_job(job)
+        logger.info(
+            "Memory import finished: job_id=%s, status=%s, saved=%d, failed=%d",
+            job.job_id,
+            job.status.value,
+            job.saved,
+            job.failed,
+        )
+
+    async def _parse_with_limit(
+        self,
+        semaphore: asyncio.Semaphore,
+        text: str,
+        user_id: int,
+        timezone: str,
+    ) -> ParsedMemory:
+        """동시 LLM 호출 수를 제한하여 파싱합니다."""
+        async with semaphore:
+            return await self.assistant_service.parse(text, user_id, timezone)
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float] | None]:
+        """
+        배치 전체를 한 번의 요청으로 임베딩합니다.
+
+        임베딩 서비스를 쓸 수 없으면 임베딩 없이 저장하고 나중에 백그라운드에서 채웁니다.
+        """
+        try:
+            return list(await self.assistant_service.embed_documents(texts))
+        except AIUnavailableError:
+            logger.warning("Embedding unavailable, importing %d memories without embedding", len(texts))
+            self.assistant_service.schedule_embedding_backfill()
+            return [None] * len(texts)
+
+    @transactional
+    async def _insert_batch(
+        self,
+        texts: list[str],
+        parsed_list: list[ParsedMemory],
+        embeddings: list[list[float] | None],
+        user_id: int,
+        timezone: str,
+    ) -> tuple[list[Memory], list[Reminder]]:
+        """배치의 Memory와 Reminder를 하나의 트랜잭션에서 저장합니다."""
+        memories = await self.memory_repository.bulk_create(
+            [
+                self.assistant_service.build_memory(parsed, text, embedding, user_id)
+                for text, parsed, embedding in zip(texts, parsed_list, embeddings, strict=True)
+            ]
+        )
+
+        reminders: list[Reminder] = []
+        for memory, parsed in zip(memories, parsed_list, strict=True):
+            if memory.id is None:
+                raise ValueError("Memory ID should not be None after creation")
+            reminder = self.assistant_service.build_reminder(parsed.reminder, memory.id, user_id, timezone)
+            if reminder is not None:
+                reminders.append(reminder)
+
+        return memories, await self.reminder_repository.bulk_create(reminders)
+
+    async def _save_job(self, job: MemoryImportJob) -> None:
+        """작업 상태를 Redis에 저장합니다."""
+        await self.redis_cache.set_json(
+            f"{self.JOB_KEY_PREFIX}{job.job_id}",
+            job.model_dump(mode="json"),
+            ex=self.config.job_ttl_seconds,
+        )
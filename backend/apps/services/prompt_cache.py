@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from apps.types.assistant import AssistantConfig
+
+if TYPE_CHECKING:
+    from google.genai import Client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedPrompt:
+    """프롬프트 하나의 cached content 상태"""
+
+    name: str | None = None
+    expires_at: float = 0.0  # time.monotonic 기준
+    retry_at: float = 0.0  # 생성 실패 후 다시 시도할 시각
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class PromptCache:
+    """
+    고정 시스템 프롬프트의 Gemini cached content 관리 (AssistantConfig.prompt_cache_enabled)
+
+    프롬프트마다 cached content를 한 번 만들어 두고, 호출 시 시스템 프롬프트 대신 cached content
+    이름을 보내 입력 토큰 처리를 생략합니다.
+
+    - 만료 prompt_cache_refresh_seconds 전부터 TTL 연장 (연장 중에도 다른 요청은 기존 캐시 사용)
+    - 만료/삭제된 캐시는 새로 생성
+    - 생성 실패(최소 토큰 수 미달 등) 시 prompt_cache_retry_seconds 동안은 시도하지 않고 None 반환
+      → 호출자는 시스템 프롬프트를 그대로 보냄
+
+    캐시는 프로세스마다 따로 만들어지고 TTL 동안 저장 비용이 발생합니다. 종료 시 clear()로 삭제합니다.
+    """
+
+    def __init__(self, config: AssistantConfig):
+        self.config = config
+        self._prompts: dict[str, _CachedPrompt] = {}
+
+    async def get(self, client: "Client", key: str, system_prompt: str, model: str) -> str | None:
+        """key 프롬프트의 model용 cached content 이름을 반환합니다 (사용할 수 없으면 None)."""
+        if not self.config.prompt_cache_enabled:
+            return None
+
+        prompt = self._prompts.setdefault(key, _CachedPrompt())
+        now = time.monotonic()
+        valid = prompt.name is not None and now < prompt.expires_at
+        if valid and now < prompt.expires_at - self.config.prompt_cache_refresh_seconds:
+            return prompt.name
+        if not valid and now < prompt.retry_at:
+            return None
+        if valid and prompt.lock.locked():
+            return prompt.name  # 다른 요청이 연장 중
+
+        async with prompt.lock:
+            if time.monotonic() < prompt.expires_at - self.config.prompt_cache_refresh_seconds:
+                return prompt.name  # 기다리는 동안 다른 요청이 갱신함
+            await self._refresh(client, key, system_prompt, model, prompt)
+        return prompt.name if time.monotonic() < prompt.expires_at else None
+
+    async def _refresh(self, client: "Client", key: str, system_prompt: str, model: str, prompt: _CachedPrompt) -> None:
+        from google.genai import types
+
+        ttl = f"{self.config.prompt_cache_ttl_seconds}s"
+        if prompt.name is not None:
+            try:
+                await client.aio.caches.update(name=prompt.name, config=types.UpdateCachedContentConfig(ttl=ttl))
+                prompt.expires_at = time.monotonic() + self.config.prompt_cache_ttl_seconds
+                return
+            except Exception as e:
+                # 만료/삭제된 캐시 - 새로 생성
+                logger.info("Prompt cache %s refresh failed, recreating: %r", key, e)
+                prompt.name = None
+
+        try:
+            cached = await client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    display_name=f"assistant-{key}",
+                    ttl=ttl,
+                ),
+            )
+        except Exception as e:
+            prompt.expires_at = 0.0
+            prompt.retry_at = time.monotonic() + self.config.prompt_cache_retry_seconds
+            logger.warning("Prompt cache %s creation failed, sending the full prompt: %r", key, e)
+            return
+
+        prompt.name = cached.name
+        prompt.expires_at = time.monotonic() + self.config.prompt_cache_ttl_seconds
+        logger.info("Prompt cache created: %s (%s)", key, cached.name)
+
+    async def clear(self, client: "Client") -> None:
+        """이 프로세스가 만든 cached content를 삭제합니다 (종료 시 호출)."""
+        for key, prompt in self._prompts.items():
+            if prompt.name is None:
+                continue
+            try:
+                await client.aio.caches.delete(name=prompt.name)
+            except Exception as e:
+                logger.warning("Prompt cache %s deletion failed: %r", key, e)
+            prompt.name = None
+            prompt.expires_at = 0.0
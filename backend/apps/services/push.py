@@ -1,21 +1,29 @@
 import logging
 
-import firebase_admin
-from firebase_admin import credentials, messaging
+from apps.metrics import PUSH_NOTIFICATIONS
 
 logger = logging.getLogger(__name__)
 
 
 class PushService:
-    """FCM 푸시 알림 서비스"""
+    """
+    FCM 푸시 알림 서비스
+
+    firebase_admin은 푸시를 보내는 프로세스(리마인더 태스크)에서만 필요하므로 생성 시점에 import합니다.
+    """
 
     def __init__(self, credentials_path: str) -> None:
+        import firebase_admin
+        from firebase_admin import credentials
+
         cred = credentials.Certificate(credentials_path)
         if not firebase_admin._apps:
             firebase_admin.initialize_app(cred)
 
     def send(self, token: str, title: str, body: str) -> None:
         """단일 기기에 FCM 푸시 알림을 전송합니다."""
+        from firebase_admin import messaging
+
         message = messaging.Message(
             notification=messaging.Notification(title=title, body=body),
             data={"title": title, "body": body},
@@ -29,13 +37,16 @@ class PushService:
         )
         try:
             messaging.send(message)
+            PUSH_NOTIFICATIONS.labels("success").inc()
         except Exception as e:
+            PUSH_NOTIFICATIONS.labels("error").inc()
             logger.error("FCM 단일 전송 실패 token=%s: %s", token, e)
 
     def send_multicast(self, tokens: list[str], title: str, body: str) -> None:
         """여러 기기에 FCM 푸시 알림을 일괄 전송합니다 (최대 500개)."""
         if not tokens:
             return
+        from firebase_admin import messaging
 
         # FCM 멀티캐스트는 한 번에 최대 500개
         chunk_size = 500
@@ -54,6 +65,8 @@ class PushService:
             )
             try:
                 response = messaging.send_each_for_multicast(message)
+                PUSH_NOTIFICATIONS.labels("success").inc(response.success_count)
+                PUSH_NOTIFICATIONS.labels("failure").inc(response.failure_count)
                 if response.failure_count > 0:
                     logger.warning(
                         "FCM 멀티캐스트 일부 실패: success=%d, failure=%d",
@@ -61,4 +74,5 @@ class PushService:
                         response.failure_count,
                     )
             except Exception as e:
+                PUSH_NOTIFICATIONS.labels("error").inc(len(chunk))
                 logger.error("FCM 멀티캐스트 전송 실패: %s", e)
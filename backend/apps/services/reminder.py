@@ -5,12 +5,16 @@ from apps.repositories.memory import MemoryRepository
 from apps.repositories.reminder import ReminderRepository
 from apps.schemas.reminder import ReminderCreate, ReminderResponse, ReminderUpdate
 from apps.types.reminder import ReminderStatus
+from apps.utils.pagination import Cursor
 from apps.utils.reminder_calculator import ReminderCalculator
 
 
 class ReminderService:
     """Reminder 서비스"""
 
+    # 다음 실행 시각 계산에 쓰이는 필드 (ReminderCalculator.calculate_next_run 인자)
+    SCHEDULE_FIELDS = {"frequency", "time", "weekdays", "day_of_month", "specific_date"}
+
     def __init__(
         self,
         reminder_repository: ReminderRepository,
@@ -32,6 +36,7 @@ class ReminderService:
         status: ReminderStatus | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[ReminderResponse]:
         """Reminder 목록을 조회합니다."""
         reminders = await self.reminder_repository.get_all(
@@ -39,6 +44,7 @@ class ReminderService:
             status=status,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
         return [ReminderResponse.model_validate(r) for r in reminders]
 
@@ -76,35 +82,27 @@ class ReminderService:
         if not reminder:
             raise NotFoundError(_("Reminder not found."))
 
-        update_data = data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(reminder, key, value)
-
-        reminder.next_run_at = ReminderCalculator.calculate_next_run(
-            frequency=reminder.frequency,
-            time=reminder.time,
-            weekdays=reminder.weekdays,
-            day_of_month=reminder.day_of_month,
-            specific_date=reminder.specific_date,
-        )
-        updated = await self.reminder_repository.update(reminder)
+        # 다음 실행 시각은 기존 스케줄에 변경값을 덮어써서 계산합니다.
+        values = data.model_dump(exclude_unset=True)
+        schedule = reminder.model_dump(include=self.SCHEDULE_FIELDS)
+        schedule.update({key: value for key, value in values.items() if key in self.SCHEDULE_FIELDS})
+        values["next_run_at"] = ReminderCalculator.calculate_next_run(**schedule)
+        updated = await self.reminder_repository.update_by_id(reminder_id, values, user_id)
+        if not updated:
+            raise NotFoundError(_("Reminder not found."))
         return ReminderResponse.model_validate(updated)
 
     async def delete_reminder(self, reminder_id: int, user_id: int | None = None) -> None:
         """Reminder를 삭제합니다."""
-        reminder = await self.reminder_repository.get_by_id(reminder_id, user_id)
-        if not reminder:
+        deleted = await self.reminder_repository.delete_by_id(reminder_id, user_id)
+        if not deleted:
             raise NotFoundError(_("Reminder not found."))
-        await self.reminder_repository.delete(reminder)
 
     async def pause_reminder(self, reminder_id: int, user_id: int | None = None) -> ReminderResponse:
         """Reminder를 일시정지합니다."""
-        reminder = await self.reminder_repository.get_by_id(reminder_id, user_id)
-        if not reminder:
+        updated = await self.reminder_repository.update_by_id(reminder_id, {"status": ReminderStatus.PAUSED}, user_id)
+        if not updated:
             raise NotFoundError(_("Reminder not found."))
-
-        reminder.status = ReminderStatus.PAUSED
-        updated = await self.reminder_repository.update(reminder)
         return ReminderResponse.model_validate(updated)
 
     async def resume_reminder(self, reminder_id: int, user_id: int | None = None) -> ReminderResponse:
@@ -113,13 +111,16 @@ class ReminderService:
         if not reminder:
             raise NotFoundError(_("Reminder not found."))
 
-        reminder.status = ReminderStatus.ACTIVE
-        reminder.next_run_at = ReminderCalculator.calculate_next_run(
+        next_run_at = ReminderCalculator.calculate_next_run(
             frequency=reminder.frequency,
             time=reminder.time,
             weekdays=reminder.weekdays,
             day_of_month=reminder.day_of_month,
             specific_date=reminder.specific_date,
         )
-        updated = await self.reminder_repository.update(reminder)
+        updated = await self.reminder_repository.update_by_id(
+            reminder_id, {"status": ReminderStatus.ACTIVE, "next_run_at": next_run_at}, user_id
+        )
+        if not updated:
+            raise NotFoundError(_("Reminder not found."))
         return ReminderResponse.model_validate(updated)
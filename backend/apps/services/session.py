@@ -2,6 +2,7 @@ import secrets
 
 from redis.asyncio import Redis
 
+from apps.metrics import REDIS_COMMAND_DURATION
 from apps.types.auth import AuthCodeData
 from apps.types.redis import RedisConfig
 
@@ -27,6 +28,14 @@ class SessionService:
         self.token_max_age = token_max_age
         self.auth_code_max_age = auth_code_max_age
 
+    async def ping(self) -> None:
+        """Redis 연결을 미리 열어 둡니다 (시작 시 warm-up)."""
+        await self.redis.ping()  # type: ignore[misc]
+
+    async def close(self) -> None:
+        """Redis 연결을 종료합니다."""
+        await self.redis.aclose()
+
     def _generate_token(self) -> str:
         return secrets.token_urlsafe(32)
 
@@ -40,7 +49,9 @@ class SessionService:
     async def get_user_id(self, token: str) -> int | None:
         """세션 토큰으로 사용자 ID를 조회합니다."""
         key = f"{self.SESSION_PREFIX}{token}"
-        user_id = await self.redis.get(key)
+        # 인증이 필요한 모든 요청에서 호출되므로 Redis 응답 시간을 기록
+        with REDIS_COMMAND_DURATION.labels("get").time():
+            user_id = await self.redis.get(key)
         if user_id is None:
             return None
         return int(user_id)
@@ -0,0 +1,143 @@
+import asyncio
+import contextvars
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from apps.cache import RedisCache
+from apps.metrics import AI_COALESCED_CALLS
+from apps.types.ai_log import AILogStep
+from apps.types.single_flight import SingleFlightConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    동시에 들어온 같은 LLM/임베딩 호출을 하나로 합칩니다 (AssistantConfig.single_flight)
+
+    클라이언트 중복 전송이나 재시도가 원래 요청과 겹치면 같은 (step, model, 입력) 호출이
+    동시에 실행됩니다. 같은 호출이 진행 중이면 새로 호출하지 않고 그 결과를 같이 받습니다.
+
+    - 프로세스 안: 호출을 태스크 하나로 실행하고 모든 요청이 그 태스크를 기다림
+      (먼저 온 요청이 취소되어도 호출은 계속되어 나머지 요청이 결과를 받음)
+    - 프로세스 간(redis_enabled): 잠금(SET NX)을 잡은 프로세스만 호출하고 결과를
+      result_ttl_seconds 동안 Redis에 저장, 잠금을 못 잡은 프로세스만 결과 키를 확인하며 대기
+      → 호출이 실패했거나 wait_seconds 안에 결과가 없으면 직접 호출
+
+    실패(예외)도 기다리던 요청 모두에게 그대로 전달되며, 결과는 저장하지 않습니다.
+    """
+
+    KEY_PREFIX = "single_flight:"
+
+    def __init__(self, config: SingleFlightConfig, redis_cache: RedisCache):
+        self.config = config
+        self.redis_cache = redis_cache
+        self._flights: dict[str, asyncio.Task[Any]] = {}
+
+    async def do[T](
+        self,
+        step: AILogStep,
+        key: Sequence[str],
+        call: Callable[[], Awaitable[T]],
+        adapter: TypeAdapter[T],
+    ) -> T:
+        """
+        key(모델명, 입력 등)가 같은 step 호출이 진행 중이면 그 결과를, 아니면 call()의 결과를 반환합니다.
+
+        adapter: 프로세스 간 결과 전달용 JSON 직렬화 (redis_enabled일 때만 사용)
+        """
+        if not self.config.enabled:
+            return await call()
+
+        flight_key = self._flight_key(step, key)
+        task = self._flights.get(flight_key)
+        if task is None:
+            # 여러 요청이 같이 기다리는 호출이므로 처음 온 요청의 컨텍스트(DB 세션 등)를 물려받지 않게 함
+            task = asyncio.create_task(self._lead(step, flight_key, call, adapter), context=contextvars.Context())
+            self._flights[flight_key] = task
+            task.add_done_callback(partial(self._finish, flight_key))
+        else:
+            AI_COALESCED_CALLS.labels(step=step.value, scope="process").inc()
+        result: T = await asyncio.shield(task)
+        return result
+
+    @staticmethod
+    def _flight_key(step: AILogStep, key: Sequence[str]) -> str:
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()
+        return f"{step.value}:{digest}"
+
+    def _finish(self, flight_key: str, task: asyncio.Task[Any]) -> None:
+        self._flights.pop(flight_key, None)
+        # 기다리던 요청이 모두 취소되어 아무도 예외를 꺼내지 않아도 경고가 남지 않게 함
+        if not task.cancelled():
+            task.exception()
+
+    async def _lead[T](
+        self,
+        step: AILogStep,
+        flight_key: str,
+        call: Callable[[], Awaitable[T]],
+        adapter: TypeAdapter[T],
+    ) -> T:
+        """프로세스 안에서 처음 온 요청의 호출 (redis_enabled면 다른 프로세스와도 합침)"""
+        if not self.config.redis_enabled:
+            return await call()
+
+        lock_key = f"{self.KEY_PREFIX}lock:{flight_key}"
+        result_key = f"{self.KEY_PREFIX}result:{flight_key}"
+        try:
+            # 결과 키는 잠금을 잡은 호출을 기다릴 때만 확인 (먼저 확인하면 result_ttl_seconds 동안 캐시처럼 동작)
+            acquired = await self.redis_cache.set_if_absent(lock_key, "1", ex=self.config.lock_ttl_seconds)
+        except Exception as e:
+            # Redis 장애는 합치기만 포기하고 직접 호출
+            logger.warning("Single-flight lock failed, calling directly: %r", e)
+            return await call()
+
+        if not acquired:
+            shared = await self._wait_for_result(lock_key, result_key, adapter)
+            if shared is not None:
+                AI_COALESCED_CALLS.labels(step=step.value, scope="redis").inc()
+                return shared[0]
+            return await call()
+
+        try:
+            result = await call()
+            try:
+                await self.redis_cache.set(
+                    result_key, adapter.dump_json(result).decode(), ex=self.config.result_ttl_seconds
+                )
+            except Exception as e:
+                logger.warning("Single-flight result store failed: %r", e)
+            return result
+        finally:
+            try:
+                await self.redis_cache.delete(lock_key)
+            except Exception as e:
+                logger.warning("Single-flight lock release failed: %r", e)
+
+    async def _wait_for_result[T](self, lock_key: str, result_key: str, adapter: TypeAdapter[T]) -> tuple[T] | None:
+        """
+        다른 프로세스의 결과를 기다립니다 (결과가 있으면 (결과,), 잠금이 풀렸는데 결과가 없거나 시간이 지나면 None).
+
+        결과 자체가 None일 수 있어 튜플로 감싸 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.wait_seconds
+        try:
+            while loop.time() < deadline:
+                await asyncio.sleep(self.config.poll_interval_seconds)
+                cached = await self.redis_cache.get(result_key)
+                if cached is not None:
+                    return (adapter.validate_json(cached),)
+                if await self.redis_cache.get(lock_key) is None:
+                    # 호출이 실패했거나 잠금이 만료됨 - 결과가 방금 저장됐을 수 있으므로 한 번 더 확인
+                    cached = await self.redis_cache.get(result_key)
+                    return None if cached is None else (adapter.validate_json(cached),)
+        except Exception as e:
+            logger.warning("Single-flight wait failed, calling directly: %r", e)
+        return None
@@ -1,8 +1,7 @@
 import secrets
-from typing import cast
+from typing import TYPE_CHECKING, cast
 from urllib.parse import urlparse
 
-from authlib.integrations.starlette_client import OAuth, OAuthError
 from fastapi import Request
 from starlette.responses import RedirectResponse
 
@@ -11,6 +10,10 @@ from apps.i18n import _
 from apps.services.session import SessionService
 from apps.types.social import Social, SocialProvider, SocialUserInfo
 
+# authlib은 소셜 로그인 요청에서만 필요하므로 처음 사용할 때 import합니다.
+if TYPE_CHECKING:
+    from authlib.integrations.starlette_client import OAuth
+
 
 class SocialAuthService:
     def __init__(
@@ -21,20 +24,30 @@ class SocialAuthService:
         allowed_redirect_hosts: list[str],
         session_service: SessionService,
     ):
-        self.oauth = OAuth()
+        self.socials = socials
+        self._oauth: OAuth | None = None
         self.redirect_uri_base = redirect_uri_base
         self.allowed_redirect_schemes = allowed_redirect_schemes
         self.allowed_redirect_hosts = allowed_redirect_hosts
         self.session_service = session_service
 
-        for social in socials:
-            self.oauth.register(
-                name=social.provider.value,
-                client_id=social.id,
-                client_secret=social.secret,
-                server_metadata_url=social.server_metadata_url,
-                client_kwargs=social.client_kwargs,
-            )
+    @property
+    def oauth(self) -> "OAuth":
+        """OAuth 클라이언트 지연 로딩"""
+        if self._oauth is None:
+            from authlib.integrations.starlette_client import OAuth
+
+            oauth = OAuth()
+            for social in self.socials:
+                oauth.register(
+                    name=social.provider.value,
+                    client_id=social.id,
+                    client_secret=social.secret,
+                    server_metadata_url=social.server_metadata_url,
+                    client_kwargs=social.client_kwargs,
+                )
+            self._oauth = oauth
+        return self._oauth
 
     def validate_redirect_uri(self, redirect_uri: str) -> None:
         """redirect_uri가 허용된 스킴 또는 호스트인지 검증합니다."""
@@ -68,6 +81,8 @@ class SocialAuthService:
 
     async def handle_callback(self, request: Request, provider: SocialProvider) -> tuple[SocialUserInfo, str | None]:
         """OAuth 콜백을 처리하고 사용자 정보 및 redirect_uri를 반환합니다."""
+        from authlib.integrations.starlette_client import OAuthError
+
         provider_client = getattr(self.oauth, provider.value)
 
         # Extract state and verify it (manual CSRF validation)
@@ -1,14 +1,16 @@
 import logging
 import struct
 from collections.abc import AsyncGenerator
-
-from google.cloud.speech_v2 import SpeechAsyncClient
-from google.cloud.speech_v2.types import cloud_speech
-from google.oauth2 import service_account
+from typing import TYPE_CHECKING
 
 from apps.schemas.voice import StreamingTranscribeResponse
 from apps.types.voice import LanguageCode, SpeechModel, VoiceConfig
 
+# Speech SDK는 import 비용이 커서 스트리밍을 처음 시작할 때 import합니다.
+if TYPE_CHECKING:
+    from google.cloud.speech_v2 import SpeechAsyncClient
+    from google.cloud.speech_v2.types import cloud_speech
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,14 +20,18 @@ class StreamingVoiceService:
     # 오디오 신호 감지 임계값 (RMS 평균 진폭)
     AUDIO_SILENCE_THRESHOLD = 100
 
-    def __init__(self, config: VoiceConfig):
+    def __init__(self, config: VoiceConfig, client: "SpeechAsyncClient | None" = None):
         self.config = config
-        self._client: SpeechAsyncClient | None = None
+        # 주입하지 않으면 처음 사용할 때 생성 (벤치마크에서는 fake를 주입)
+        self._client = client
 
     @property
-    def client(self) -> SpeechAsyncClient:
+    def client(self) -> "SpeechAsyncClient":
         """Async Speech 클라이언트 지연 로딩"""
         if self._client is None:
+            from google.cloud.speech_v2 import SpeechAsyncClient
+            from google.oauth2 import service_account
+
             if self.config.credentials_path:
                 credentials: service_account.Credentials = service_account.Credentials.from_service_account_file(
                     self.config.credentials_path
@@ -35,6 +41,20 @@ class StreamingVoiceService:
                 self._client = SpeechAsyncClient()
         return self._client
 
+    async def warmup(self) -> None:
+        """gRPC 채널을 미리 연결합니다 (첫 스트림의 TLS/채널 연결 비용 제거)."""
+        from google.cloud.speech_v2.services.speech.transports import SpeechGrpcAsyncIOTransport
+
+        transport = self.client.transport
+        if isinstance(transport, SpeechGrpcAsyncIOTransport):
+            await transport.grpc_channel.channel_ready()
+
+    async def close(self) -> None:
+        """gRPC 채널을 닫습니다 (생성된 경우에만)."""
+        if self._client is not None:
+            await self._client.transport.close()
+            self._client = None
+
     def has_audio_signal(
         self,
         audio_bytes: bytes,
@@ -102,8 +122,10 @@ class StreamingVoiceService:
         audio_generator: AsyncGenerator[bytes],
         language: LanguageCode,
         sample_rate: int,
-    ) -> AsyncGenerator[cloud_speech.StreamingRecognizeRequest]:
+    ) -> AsyncGenerator["cloud_speech.StreamingRecognizeRequest"]:
         """스트리밍 요청 제너레이터를 생성합니다."""
+        from google.cloud.speech_v2.types import cloud_speech
+
         # 첫 번째 요청: 설정 전송
         streaming_config = await self._build_streaming_config(language, sample_rate)
         yield cloud_speech.StreamingRecognizeRequest(
@@ -117,8 +139,10 @@ class StreamingVoiceService:
 
     async def _build_streaming_config(
         self, language: LanguageCode, sample_rate: int
-    ) -> cloud_speech.StreamingRecognitionConfig:
+    ) -> "cloud_speech.StreamingRecognitionConfig":
         """스트리밍 Recognition 설정을 생성합니다."""
+        from google.cloud.speech_v2.types import cloud_speech
+
         recognition_config = cloud_speech.RecognitionConfig(
             explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
                 encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
@@ -1,8 +1,5 @@
 from pathlib import Path
-
-from google.cloud.speech_v2 import SpeechClient
-from google.cloud.speech_v2.types import cloud_speech
-from google.oauth2 import service_account
+from typing import TYPE_CHECKING
 
 from apps.exceptions import VoiceProcessingError
 from apps.i18n import _
@@ -13,6 +10,11 @@ from apps.schemas.voice import (
 )
 from apps.types.voice import LanguageCode, SpeechModel, VoiceConfig
 
+# Speech SDK는 import 비용이 커서 처음 인식 요청 시 import합니다.
+if TYPE_CHECKING:
+    from google.cloud.speech_v2 import SpeechClient
+    from google.cloud.speech_v2.types import cloud_speech
+
 
 class VoiceService:
     """음성 인식 서비스 (Google Cloud Speech-to-Text v2)"""
@@ -22,9 +24,12 @@ class VoiceService:
         self._client: SpeechClient | None = None
 
     @property
-    def client(self) -> SpeechClient:
+    def client(self) -> "SpeechClient":
         """Speech 클라이언트 지연 로딩"""
         if self._client is None:
+            from google.cloud.speech_v2 import SpeechClient
+            from google.oauth2 import service_account
+
             if self.config.credentials_path:
                 credentials = service_account.Credentials.from_service_account_file(  # type: ignore[no-untyped-call]
                     self.config.credentials_path
@@ -34,6 +39,12 @@ class VoiceService:
                 self._client = SpeechClient()
         return self._client
 
+    async def close(self) -> None:
+        """gRPC 채널을 닫습니다 (생성된 경우에만)."""
+        if self._client is not None:
+            self._client.transport.close()  # type: ignore[no-untyped-call]
+            self._client = None
+
     def validate_file(self, filename: str, file_size: int) -> None:
         """파일 유효성 검사"""
         ext = Path(filename).suffix.lower().lstrip(".")
@@ -72,8 +83,10 @@ class VoiceService:
         response = self._recognize(audio_content, used_language)
         return self._build_response(response, used_language, detailed)
 
-    def _build_recognition_config(self, language: LanguageCode) -> cloud_speech.RecognitionConfig:
+    def _build_recognition_config(self, language: LanguageCode) -> "cloud_speech.RecognitionConfig":
         """Recognition 설정을 생성합니다."""
+        from google.cloud.speech_v2.types import cloud_speech
+
         return cloud_speech.RecognitionConfig(
             auto_decoding_config=cloud_speech.AutoDetectDecodingConfig(),
             language_codes=[language.value],
@@ -83,8 +96,10 @@ class VoiceService:
             ),
         )
 
-    def _recognize(self, audio_content: bytes, language: LanguageCode) -> cloud_speech.RecognizeResponse:
+    def _recognize(self, audio_content: bytes, language: LanguageCode) -> "cloud_speech.RecognizeResponse":
         """Google Speech API를 호출합니다."""
+        from google.cloud.speech_v2.types import cloud_speech
+
         config = self._build_recognition_config(language)
         request = cloud_speech.RecognizeRequest(
             recognizer=f"projects/{self.config.project_id}/locations/global/recognizers/_",
@@ -99,7 +114,7 @@ class VoiceService:
 
     def _build_response(
         self,
-        response: cloud_speech.RecognizeResponse,
+        response: "cloud_speech.RecognizeResponse",
         language: LanguageCode,
         detailed: bool,
     ) -> TranscribeResponse | TranscribeDetailedResponse:
@@ -126,7 +141,7 @@ class VoiceService:
         )
 
     def _extract_results(
-        self, response: cloud_speech.RecognizeResponse
+        self, response: "cloud_speech.RecognizeResponse"
     ) -> tuple[list[str], list[float], list[TranscribeSegment]]:
         """API 응답에서 텍스트, 신뢰도, 세그먼트를 추출합니다."""
         texts: list[str] = []
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+from apps.celery import celery_app
+from apps.repositories.ai_log import AIProcessingLogRepository
+from apps.utils.datetime_utils import add_months
+from database import Database
+from settings import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="apps.tasks.ai_log.maintain_ai_log")  # type: ignore[untyped-decorator]
+def maintain_ai_log() -> None:
+    """AI 처리 로그 일별 집계, 다음 달 파티션 생성, 보관 기간이 지난 파티션 삭제를 수행합니다."""
+    asyncio.run(_async_maintain())
+
+
+async def _async_maintain() -> None:
+    # asyncio.run마다 이벤트 루프가 새로 만들어지므로, 연결이 이전 루프에 남지 않도록 실행마다 엔진을 정리합니다.
+    database = Database(Settings.database)
+    try:
+        await _maintain(AIProcessingLogRepository(database))
+    finally:
+        await database.dispose()
+
+
+async def _maintain(ai_log_repo: AIProcessingLogRepository) -> None:
+    config = Settings.ai_log
+    today = datetime.now(UTC).date()
+
+    # 늦게 저장된 로그까지 반영되도록 어제와 오늘을 다시 집계 (덮어쓰기라 여러 번 실행해도 같음)
+    await ai_log_repo.rollup(today - timedelta(days=1), today + timedelta(days=1))
+
+    created = await ai_log_repo.ensure_partitions(today, config.partition_months_ahead + 1)
+    if created:
+        logger.info("AI 로그 파티션 생성: %s", ", ".join(created))
+
+    if config.retention_months > 0:
+        dropped = await ai_log_repo.drop_partitions_before(add_months(today, -config.retention_months))
+        if dropped:
+            logger.info("AI 로그 파티션 삭제: %s", ", ".join(dropped))
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+from datetime import UTC, datetime
 
 from apps.celery import celery_app
+from apps.metrics import REMINDER_LAG
 from apps.repositories.device_token import DeviceTokenRepository
 from apps.repositories.reminder import ReminderRepository
 from apps.services.push import PushService
@@ -21,10 +23,17 @@ def process_due_reminders() -> None:
 
 
 async def _async_process() -> None:
+    # asyncio.run마다 이벤트 루프가 새로 만들어지므로, 연결이 이전 루프에 남지 않도록 실행마다 엔진을 정리합니다.
     database = Database(Settings.database)
+    try:
+        await _process_due_reminders(database, PushService(Settings.firebase.credentials_path))
+    finally:
+        await database.dispose()
+
+
+async def _process_due_reminders(database: Database, push_svc: PushService) -> None:
     reminder_repo = ReminderRepository(database)
     device_repo = DeviceTokenRepository(database)
-    push_svc = PushService(Settings.firebase.credentials_path)
 
     reminders = await reminder_repo.get_due_reminders()
     logger.info("처리할 리마인더: %d건", len(reminders))
@@ -36,6 +45,9 @@ async def _async_process() -> None:
                 logger.warning("리마인더 %d에 user_id가 없습니다.", reminder.id)
                 continue
 
+            if reminder.next_run_at is not None:
+                REMINDER_LAG.observe(max((datetime.now(UTC) - reminder.next_run_at).total_seconds(), 0))
+
             tokens = await device_repo.get_by_user(user_id)
             if tokens:
                 push_svc.send_multicast(
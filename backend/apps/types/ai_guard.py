@@ -0,0 +1,40 @@
+"""LLM/임베딩 호출 보호(동시 호출 제한, 서킷 브레이커) 관련 타입 정의"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class CircuitState(str, Enum):
+    """서킷 브레이커 상태"""
+
+    CLOSED = "closed"  # 정상 - 모든 호출 허용
+    OPEN = "open"  # 차단 - 호출하지 않고 즉시 실패 (breaker_open_seconds 동안)
+    HALF_OPEN = "half_open"  # 회복 확인 중 - 시험 호출만 허용
+
+
+class AIGuardConfig(BaseModel):
+    """
+    LLM/임베딩 호출 보호 설정 (AssistantConfig.guard)
+
+    LLM과 임베딩은 각각 따로 제한/차단됩니다 (같은 설정 사용).
+    """
+
+    enabled: bool = Field(default=True, description="동시 호출 제한/서킷 브레이커 사용 여부")
+    max_concurrency: int = Field(default=16, ge=1, description="프로세스당 동시 호출 수")
+    queue_timeout_seconds: float = Field(default=2.0, ge=0, description="동시 호출 슬롯 대기 시간(초)")
+    # LLM은 단계별 timeout_seconds(AssistantConfig.steps)가 있으면 그 값을 사용
+    deadline_seconds: float = Field(default=20.0, gt=0, description="호출 하나의 제한 시간(초)")
+
+    # 최근 breaker_window개 호출 중 실패/느린 호출 비율로 차단 여부 판단
+    breaker_window: int = Field(default=20, ge=1, description="차단 판단에 쓰는 최근 호출 수")
+    breaker_min_calls: int = Field(default=10, ge=1, description="차단 판단에 필요한 최소 호출 수")
+    breaker_error_rate: float = Field(default=0.5, gt=0, le=1, description="차단할 실패 비율")
+    breaker_slow_call_seconds: float = Field(default=10.0, gt=0, description="느린 호출 기준(초)")
+    breaker_slow_call_rate: float = Field(default=0.8, gt=0, le=1, description="차단할 느린 호출 비율")
+    breaker_open_seconds: float = Field(default=30.0, gt=0, description="차단 후 시험 호출까지 대기(초)")
+    breaker_half_open_calls: int = Field(default=2, ge=1, description="차단 해제에 필요한 시험 호출 성공 수")
+
+    # 임베딩 없이 저장된 Memory의 임베딩 채우기 (AssistantService.schedule_embedding_backfill)
+    backfill_interval_seconds: float = Field(default=30.0, gt=0, description="임베딩 채우기 시도 간격(초)")
+    backfill_batch_size: int = Field(default=50, ge=1, le=100, description="임베딩 채우기 배치 크기")
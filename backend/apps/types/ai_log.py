@@ -2,6 +2,8 @@
 
 from enum import Enum
 
+from pydantic import BaseModel, Field
+
 
 class AILogStep(str, Enum):
     """AI 처리 단계"""
@@ -9,3 +11,19 @@ class AILogStep(str, Enum):
     INTENT_CLASSIFICATION = "intent_classification"
     TEXT_PARSING = "text_parsing"
     ANSWER_GENERATION = "answer_generation"
+    ANSWER_TEMPLATE = "answer_template"  # LLM 없이 템플릿으로 만든 답변 (AnswerPlanner)
+    EMBEDDING = "embedding"
+
+
+class AILogConfig(BaseModel):
+    """AI 처리 로그 저장/보관 설정"""
+
+    queue_size: int = Field(default=10000, ge=1, description="메모리 큐 최대 크기 (초과 시 로그 폐기)")
+    batch_size: int = Field(default=200, ge=1, description="한 번에 INSERT할 최대 로그 수")
+    flush_interval_seconds: float = Field(default=1.0, gt=0, description="배치가 덜 찼을 때 최대 대기 시간(초)")
+    shutdown_timeout_seconds: float = Field(default=10.0, gt=0, description="종료 시 남은 로그 저장 대기 시간(초)")
+
+    # 월별 파티션 관리 (apps.tasks.ai_log.maintain_ai_log, 1시간마다 실행)
+    partition_months_ahead: int = Field(default=3, ge=1, description="미리 만들어 둘 다음 달 파티션 수")
+    # 업그레이드 시 기존 로그가 삭제되지 않도록 기본값은 0 (운영 환경에서 필요한 보관 기간을 설정)
+    retention_months: int = Field(default=0, ge=0, description="원본 로그 보관 개월 수 (0이면 삭제하지 않음)")
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import date
 from datetime import time as _time
 from enum import Enum
@@ -5,6 +6,11 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from apps.types.ai_guard import AIGuardConfig
+from apps.types.ai_log import AILogStep
+from apps.types.embedding_batch import EmbeddingBatchConfig
+from apps.types.single_flight import SingleFlightConfig
+
 # ============================================================
 # Enums
 # ============================================================
@@ -98,11 +104,35 @@ class ParsedMemory(BaseModel):
     )
 
 
+@dataclass
+class PreparedSave:
+    """저장 의도의 LLM 처리 결과 (파싱 + 임베딩, DB 저장 전)"""
+
+    text: str
+    parsed: ParsedMemory
+    embedding: list[float] | None  # None: 임베딩 서비스를 쓸 수 없어 나중에 채움
+
+
 # ============================================================
 # Config
 # ============================================================
 
 
+class LLMSettings(BaseModel):
+    """
+    단계별 LLM 설정 (AssistantConfig.steps)
+
+    지정하지 않은 값(None)은 AssistantConfig의 기본값을 사용합니다.
+    """
+
+    model: str | None = Field(default=None, description="LLM 모델명")
+    temperature: float | None = Field(default=None, ge=0, le=1, description="LLM 온도")
+    max_tokens: int | None = Field(default=None, ge=1, description="최대 출력 토큰 수")
+    timeout_seconds: float | None = Field(default=None, gt=0, description="요청 타임아웃(초)")
+    # Gemini 2.5는 thinking 토큰도 max_tokens에 포함되므로, 출력이 짧은 단계는 0으로 꺼야 응답이 잘리지 않음
+    thinking_budget: int | None = Field(default=None, ge=-1, description="thinking 토큰 예산 (0: 끔, -1: 자동)")
+
+
 class AssistantConfig(BaseModel):
     """AI Assistant 설정 (LangChain + Gemini)"""
 
@@ -112,5 +142,50 @@ class AssistantConfig(BaseModel):
     embedding_dimensions: int = Field(description="임베딩 벡터 차원 (최대 3072)")
     temperature: float = Field(ge=0, le=1, description="LLM 온도")
     max_tokens: int = Field(ge=1, description="최대 토큰 수")
+    timeout_seconds: float | None = Field(default=None, gt=0, description="LLM 요청 타임아웃(초), None이면 SDK 기본값")
+    # 단계별 모델/토큰 설정 (예: 의도 분류는 작고 빠른 모델 + 작은 max_tokens)
+    #   steps:
+    #     intent_classification: {model: gemini-2.5-flash-lite, max_tokens: 256, thinking_budget: 0}
+    #     answer_generation: {model: gemini-2.5-pro}
+    steps: dict[AILogStep, LLMSettings] = Field(default_factory=dict, description="단계별 LLM 설정")
     vector_search_limit: int = Field(default=5, ge=1, description="벡터 검색 결과 개수 제한")
     vector_search_threshold: float = Field(default=0.3, ge=0.0, le=1.0, description="벡터 유사도 임계값")
+
+    # 답이 metadata 필드 하나인 질문(물건 위치, 전화번호)은 LLM 없이 템플릿으로 답변 (AnswerPlanner)
+    # 질문 판단이 단어 규칙 기반이므로 기본값은 꺼 둠
+    answer_template_enabled: bool = Field(default=False, description="템플릿 답변 사용 여부")
+    answer_template_min_similarity: float = Field(
+        default=0.8, ge=0.0, le=1.0, description="템플릿 답변에 필요한 1위 검색 결과 최소 유사도"
+    )
+    answer_template_min_margin: float = Field(
+        default=0.1, ge=0.0, le=1.0, description="템플릿 답변에 필요한 1위와 2위 유사도 차이"
+    )
+
+    # 고정 시스템 프롬프트(의도 분류, 파싱)의 Gemini cached content 사용 (PromptCache)
+    # 모델별 최소 토큰 수(예: 2.5 Flash 1024)보다 짧은 프롬프트는 생성에 실패하고 전체 프롬프트를 보냄
+    prompt_cache_enabled: bool = Field(default=False, description="시스템 프롬프트 cached content 사용 여부")
+    prompt_cache_ttl_seconds: int = Field(default=3600, ge=60, description="cached content TTL(초)")
+    prompt_cache_refresh_seconds: int = Field(default=300, ge=0, description="만료 몇 초 전부터 TTL을 연장할지")
+    prompt_cache_retry_seconds: float = Field(default=600.0, gt=0, description="생성 실패 후 재시도까지 대기(초)")
+
+    # LLM/임베딩 동시 호출 제한, 제한 시간, 서킷 브레이커 (AIGuard)
+    guard: AIGuardConfig = Field(default_factory=AIGuardConfig, description="LLM/임베딩 호출 보호 설정")
+    # 동시에 들어온 단건 임베딩 요청을 배치 요청 하나로 묶기 (EmbeddingBatcher)
+    embedding_batch: EmbeddingBatchConfig = Field(
+        default_factory=EmbeddingBatchConfig, description="단건 임베딩 요청 묶기 설정"
+    )
+    # 동시에 들어온 같은 의도 분류/파싱/임베딩 호출 합치기 (SingleFlight)
+    single_flight: SingleFlightConfig = Field(
+        default_factory=SingleFlightConfig, description="같은 LLM/임베딩 호출 합치기 설정"
+    )
+
+    def llm_settings(self, step: AILogStep) -> LLMSettings:
+        """step에 사용할 LLM 설정 (단계별 설정이 없는 값은 기본값으로 채움)"""
+        step_settings = self.steps.get(step, LLMSettings())
+        return LLMSettings(
+            model=step_settings.model or self.model,
+            temperature=self.temperature if step_settings.temperature is None else step_settings.temperature,
+            max_tokens=step_settings.max_tokens or self.max_tokens,
+            timeout_seconds=step_settings.timeout_seconds or self.timeout_seconds,
+            thinking_budget=step_settings.thinking_budget,
+        )
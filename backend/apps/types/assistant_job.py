@@ -0,0 +1,55 @@
+"""Assistant 비동기 작업 관련 타입 정의"""
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ProcessMode(str, Enum):
+    """요청 처리 방식"""
+
+    SYNC = "sync"  # 처리 완료 후 응답
+    ASYNC = "async"  # 작업 ID를 즉시 반환, 결과는 작업 조회로 확인
+
+
+class AssistantJobKind(str, Enum):
+    """작업 종류"""
+
+    CHAT = "chat"  # /assistant/chat
+    VOICE = "voice"  # /assistant/voice
+
+
+class AssistantJobStatus(str, Enum):
+    """작업 상태"""
+
+    PENDING = "pending"  # 대기
+    RUNNING = "running"  # 처리 중
+    COMPLETED = "completed"  # 완료
+    FAILED = "failed"  # 실패
+
+
+class AssistantJob(BaseModel):
+    """Assistant 작업 상태 (Redis 저장용)"""
+
+    job_id: str = Field(description="작업 ID")
+    user_id: int = Field(description="사용자 ID")
+    kind: AssistantJobKind = Field(description="작업 종류")
+    status: AssistantJobStatus = Field(default=AssistantJobStatus.PENDING, description="작업 상태")
+    result: dict[str, Any] | None = Field(default=None, description="처리 결과 (동기 응답의 result와 같은 형태)")
+    error: str | None = Field(default=None, description="작업 실패 사유")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (AssistantJobStatus.COMPLETED, AssistantJobStatus.FAILED)
+
+
+class AssistantJobConfig(BaseModel):
+    """Assistant 비동기 작업 설정"""
+
+    max_concurrency: int = Field(default=8, ge=1, description="프로세스당 동시에 처리할 작업 수")
+    max_pending_per_user: int = Field(default=20, ge=1, description="사용자별 대기 가능한 최대 작업 수")
+    job_ttl_seconds: int = Field(default=3600, ge=60, description="작업 상태 보관 시간(초)")
+    max_wait_seconds: float = Field(default=30.0, gt=0, description="작업 조회 long-poll 최대 대기 시간(초)")
+    poll_interval_seconds: float = Field(default=0.5, gt=0, description="다른 프로세스 작업의 상태 확인 간격(초)")
+    shutdown_timeout_seconds: float = Field(default=30.0, gt=0, description="종료 시 처리 중인 작업 대기 시간(초)")
@@ -0,0 +1,17 @@
+"""Memory 캘린더 관련 타입 정의"""
+
+from pydantic import BaseModel, Field
+
+
+class CalendarMarks(BaseModel):
+    """캘린더 마킹 결과 (Redis 캐시 저장용)"""
+
+    etag: str = Field(description="결과 내용 기반 ETag")
+    marks: dict[str, int] = Field(description="날짜(YYYY-MM-DD)별 Memory 개수")
+
+
+class CalendarConfig(BaseModel):
+    """Memory 캘린더 설정"""
+
+    cache_ttl_seconds: int = Field(default=3600, ge=1, description="캘린더 결과 캐시 보관 시간(초)")
+    max_months: int = Field(default=12, ge=1, description="한 번에 조회할 수 있는 최대 개월 수")
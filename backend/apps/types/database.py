@@ -1,4 +1,15 @@
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, Field, computed_field
+
+
+class ReplicaConfig(BaseModel):
+    """읽기 전용 복제본 (계정/DB 이름은 primary와 같음)"""
+
+    host: str
+    port: int = 5432
+
+    @property
+    def name(self) -> str:
+        return f"{self.host}:{self.port}"
 
 
 class DatabaseConfig(BaseModel):
@@ -10,7 +21,65 @@ class DatabaseConfig(BaseModel):
 
     echo: bool
 
+    # 연결 풀 (프로세스마다 따로 생김)
+    # 최대 연결 수 = (uvicorn 워커 수 + Celery 워커 수) x (pool_size + max_overflow)
+    pool_size: int = Field(default=5, ge=1, description="유지할 연결 수")
+    max_overflow: int = Field(default=10, ge=0, description="pool_size를 넘어 임시로 열 수 있는 연결 수")
+    pool_timeout: float = Field(default=30.0, gt=0, description="연결을 얻기 위한 최대 대기 시간(초)")
+    pool_recycle: int = Field(default=1800, description="연결 재생성 주기(초), -1이면 재생성하지 않음")
+    pool_pre_ping: bool = Field(default=False, description="체크아웃 시 연결 유효성 확인 여부")
+    pool_checkout_warn_seconds: float = Field(default=1.0, gt=0, description="이 시간 이상 대기하면 경고 로그")
+
+    # asyncpg 설정 (PgBouncer transaction 모드에서는 두 캐시 모두 0)
+    statement_cache_size: int = Field(default=100, ge=0, description="asyncpg prepared statement 캐시 크기")
+    prepared_statement_cache_size: int = Field(
+        default=100, ge=0, description="SQLAlchemy asyncpg 드라이버의 prepared statement 캐시 크기"
+    )
+    # 연결마다 적용할 PostgreSQL 설정 (예: {"jit": "off"})
+    server_settings: dict[str, str] = Field(default_factory=dict, description="PostgreSQL 세션 설정")
+
+    # 읽기 복제본 - session(readonly=True) 읽기를 분산 (비어 있으면 모두 primary)
+    replicas: list[ReplicaConfig] = Field(default_factory=list, description="읽기 전용 복제본 목록")
+    replica_max_lag_seconds: float = Field(default=5.0, ge=0, description="이보다 지연된 복제본은 사용하지 않음")
+    replica_lag_check_seconds: float = Field(default=5.0, gt=0, description="복제 지연 확인 주기(초)")
+    replica_lag_check_timeout_seconds: float = Field(
+        default=1.0, gt=0, description="복제 지연 확인 제한 시간(초) - 넘기면 다음 확인까지 primary 사용"
+    )
+    read_your_writes_seconds: int = Field(default=5, ge=1, description="쓰기 후 읽기를 primary로 보낼 시간(초)")
+
+    # 요청 단위 세션 (RequestSessionMiddleware) - 요청당 세션 하나, 응답 직전 한 번 커밋
+    request_scope: bool = Field(default=False, description="요청 단위 세션 사용 여부")
+    request_scope_exclude_paths: list[str] = Field(
+        # LLM/STT 호출, 작업 결과 대기(long-poll), 푸시 발송 동안 연결을 붙잡지 않도록 제외
+        # (자체적으로 짧은 트랜잭션을 사용)
+        default=[
+            "/api/v1/assistant/chat",
+            "/api/v1/assistant/voice",
+            "/api/v1/assistant/jobs",
+            "/api/v1/voice/transcribe",
+            "/api/v1/devices/test-push",
+        ],
+        description="요청 단위 세션을 적용하지 않을 경로 prefix",
+    )
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def async_psql_database_url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
+    def async_replica_database_url(self, replica: ReplicaConfig) -> str:
+        return f"postgresql+asyncpg://{self.user}:{self.password}@{replica.host}:{replica.port}/{self.name}"
+
+
+class PoolStatus(BaseModel):
+    """연결 풀 상태 (Database.pool_status)"""
+
+    size: int = Field(description="pool_size")
+    in_use: int = Field(description="사용 중인 연결 수")
+    idle: int = Field(description="풀에서 대기 중인 연결 수")
+    overflow: int = Field(description="pool_size를 넘어 열린 연결 수")
+    checkouts: int = Field(description="누적 체크아웃 수")
+    checkout_wait_seconds_total: float = Field(description="누적 체크아웃 대기 시간(초)")
+    checkout_wait_seconds_max: float = Field(description="최대 체크아웃 대기 시간(초)")
+    overflow_checkouts: int = Field(description="overflow 연결을 사용한 체크아웃 수")
+    timeouts: int = Field(description="pool_timeout 초과로 실패한 체크아웃 수")
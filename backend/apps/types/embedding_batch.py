@@ -0,0 +1,18 @@
+"""임베딩 요청 묶기(micro-batching) 관련 타입 정의"""
+
+from pydantic import BaseModel, Field
+
+
+class EmbeddingBatchConfig(BaseModel):
+    """
+    동시에 들어온 단건 임베딩 요청을 aembed_documents 한 번으로 묶는 설정 (AssistantConfig.embedding_batch)
+
+    첫 요청부터 max_wait_seconds 동안(또는 max_batch_size개가 모일 때까지) 모아서 보냅니다.
+    대기 시간만큼 단건 지연이 늘어나는 대신, 동시 요청이 많을 때 API 요청 수가 줄어 rate limit에 덜 걸립니다.
+    """
+
+    enabled: bool = Field(default=True, description="단건 임베딩 요청 묶기 여부")
+    max_batch_size: int = Field(default=32, ge=1, le=100, description="한 번에 보낼 최대 텍스트 수")
+    max_wait_seconds: float = Field(default=0.005, ge=0, description="첫 요청 후 묶을 요청을 기다리는 시간(초)")
+    # 배치 호출 자체의 제한 시간은 AIGuard deadline_seconds가 적용되므로 그보다 약간 길게 설정
+    request_timeout_seconds: float = Field(default=25.0, gt=0, description="요청 하나가 결과를 기다리는 최대 시간(초)")
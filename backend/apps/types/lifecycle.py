@@ -0,0 +1,40 @@
+"""프로세스 시작(warm-up)/종료(drain) 관련 타입 정의"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class LifecycleState(str, Enum):
+    """API 프로세스 상태"""
+
+    STARTING = "starting"  # warm-up 중 (readiness 실패)
+    READY = "ready"  # 트래픽 처리 가능
+    DRAINING = "draining"  # 종료 중 - 새 스트림을 받지 않고 처리 중인 작업을 마무리
+    STOPPED = "stopped"  # 모든 클라이언트 종료
+
+
+class ComponentStatus(str, Enum):
+    """warm-up 대상 구성 요소 상태"""
+
+    PENDING = "pending"  # 아직 warm-up하지 않음
+    READY = "ready"  # warm-up 완료
+    FAILED = "failed"  # warm-up 실패 (필수 구성 요소는 재시도)
+    SKIPPED = "skipped"  # 설정으로 비활성화
+
+
+class LifecycleConfig(BaseModel):
+    """시작 시 warm-up / 종료 시 drain 설정"""
+
+    warmup_enabled: bool = Field(default=True, description="시작 시 외부 클라이언트 warm-up 여부")
+    warmup_database_connections: int = Field(
+        default=2, ge=0, description="미리 열어 둘 DB 연결 수 (복제본별, pool_size 이하로 제한)"
+    )
+    warmup_redis: bool = Field(default=True, description="Redis 연결 warm-up 여부")
+    warmup_speech: bool = Field(default=True, description="Speech-to-Text gRPC 채널 연결 여부")
+    warmup_llm: bool = Field(default=True, description="LLM/임베딩 클라이언트 미리 생성 여부")
+    # 실제 API 호출이라 비용이 들어서 기본값은 꺼 둠 (켜면 첫 요청의 TLS 연결 비용까지 없어짐)
+    warmup_embedding_call: bool = Field(default=False, description="warm-up 시 짧은 임베딩 호출 여부")
+    warmup_timeout_seconds: float = Field(default=30.0, gt=0, description="구성 요소별 warm-up 시도 시간(초)")
+    warmup_retry_seconds: float = Field(default=5.0, gt=0, description="필수 구성 요소(DB, Redis) 재시도 간격(초)")
+    drain_timeout_seconds: float = Field(default=30.0, gt=0, description="종료 시 처리 중인 스트림 대기 시간(초)")
@@ -0,0 +1,26 @@
+"""Memory 조회 관련 타입 정의"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from apps.types.assistant import MemoryType
+
+
+@dataclass(frozen=True, slots=True)
+class MemorySummary:
+    """
+    목록 조회용 Memory 읽기 모델 (embedding, user_id 제외)
+
+    ORM 엔티티 대신 필요한 컬럼만 SELECT하여 만들며, identity map/변경 추적 비용이 없습니다.
+    필드 순서는 MemoryRepository.SUMMARY_COLUMNS와 같아야 합니다.
+    """
+
+    id: int
+    type: MemoryType
+    keywords: str
+    content: str
+    metadata_: dict[str, Any] | None
+    original_text: str
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,39 @@
+"""Memory 일괄 가져오기 관련 타입 정의"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class MemoryImportStatus(str, Enum):
+    """가져오기 작업 상태"""
+
+    PENDING = "pending"  # 대기
+    RUNNING = "running"  # 처리 중
+    COMPLETED = "completed"  # 완료
+    FAILED = "failed"  # 실패
+
+
+class MemoryImportJob(BaseModel):
+    """가져오기 작업 상태 (Redis 저장용)"""
+
+    job_id: str = Field(description="작업 ID")
+    user_id: int = Field(description="사용자 ID")
+    status: MemoryImportStatus = Field(default=MemoryImportStatus.PENDING, description="작업 상태")
+    total: int = Field(description="전체 항목 수")
+    parsed: int = Field(default=0, description="파싱 완료 항목 수")
+    saved: int = Field(default=0, description="저장 완료 항목 수")
+    failed: int = Field(default=0, description="실패 항목 수")
+    memory_ids: list[int] = Field(default_factory=list, description="생성된 Memory ID 목록")
+    reminder_ids: list[int] = Field(default_factory=list, description="생성된 Reminder ID 목록")
+    error: str | None = Field(default=None, description="작업 실패 사유")
+
+
+class MemoryImportConfig(BaseModel):
+    """Memory 일괄 가져오기 설정"""
+
+    max_items: int = Field(default=500, ge=1, description="요청당 최대 항목 수")
+    parse_concurrency: int = Field(default=5, ge=1, description="동시에 실행할 LLM 파싱 호출 수")
+    batch_size: int = Field(default=50, ge=1, le=100, description="임베딩/INSERT 배치 크기")
+    job_ttl_seconds: int = Field(default=86400, ge=60, description="작업 상태 보관 시간(초)")
+    shutdown_timeout_seconds: float = Field(default=30.0, gt=0, description="종료 시 처리 중인 작업 대기 시간(초)")
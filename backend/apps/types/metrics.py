@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class MetricsConfig(BaseModel):
+    """
+    Prometheus 지표 설정
+
+    여러 프로세스(uvicorn --workers, Celery prefork)의 지표를 합치려면 프로세스 시작 전에
+    PROMETHEUS_MULTIPROC_DIR 환경 변수를 비어 있는 디렉토리로 지정해야 합니다 (yaml 설정으로는 지정 불가).
+    """
+
+    enabled: bool = Field(default=True, description="/metrics 엔드포인트와 HTTP 지표 수집 사용 여부")
+    celery_port: int | None = Field(
+        default=9101, description="Celery 워커 지표를 노출할 HTTP 포트 (None이면 노출하지 않음)"
+    )
@@ -0,0 +1,22 @@
+"""같은 LLM/임베딩 호출 합치기(single-flight) 관련 타입 정의"""
+
+from pydantic import BaseModel, Field
+
+
+class SingleFlightConfig(BaseModel):
+    """
+    동시에 들어온 같은 (step, model, 입력) 호출 합치기 설정 (AssistantConfig.single_flight)
+
+    프로세스 안에서는 진행 중인 호출 하나의 결과를 같이 기다리고,
+    redis_enabled면 다른 프로세스의 호출도 Redis 잠금 + 결과 키로 합칩니다.
+    """
+
+    enabled: bool = Field(default=True, description="프로세스 안에서 같은 호출 합치기 여부")
+    # 호출마다 Redis 왕복이 3~4번 늘어나므로 기본값은 꺼 둠 (워커가 여러 개이고 재시도가 잦을 때 켬)
+    redis_enabled: bool = Field(default=False, description="프로세스 간 같은 호출 합치기 여부")
+    lock_ttl_seconds: int = Field(default=30, ge=1, description="호출 중 잠금 만료 시간(초) - 호출 제한 시간 이상")
+    result_ttl_seconds: int = Field(
+        default=10, ge=1, description="기다리던 다른 프로세스에 넘겨줄 결과 보관 시간(초) - 캐시로 쓰지 않음"
+    )
+    wait_seconds: float = Field(default=20.0, gt=0, description="다른 프로세스의 결과를 기다리는 최대 시간(초)")
+    poll_interval_seconds: float = Field(default=0.05, gt=0, description="다른 프로세스의 결과 확인 간격(초)")
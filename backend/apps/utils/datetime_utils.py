@@ -1,59 +1,70 @@
 """Datetime 변환 유틸리티"""
 
-from datetime import datetime
-from typing import Any
-from zoneinfo import ZoneInfo
+from datetime import UTC, date, datetime, time
+from functools import lru_cache
+from typing import Annotated, Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel
+from pydantic import SerializationInfo, SerializerFunctionWrapHandler, WrapSerializer
 
+# 직렬화 context에 사용자 시간대를 넣는 키 (ResponseProvider의 timezone 인자)
+TIMEZONE_CONTEXT_KEY = "timezone"
 
-class TimezoneConverter:
-    """UTC datetime을 사용자 시간대로 변환하는 유틸리티.
 
-    Pydantic 응답 모델의 모든 datetime 필드를 재귀적으로 탐색하여
-    지정된 시간대로 변환합니다.
+@lru_cache(maxsize=64)
+def _zone(timezone: str) -> ZoneInfo | None:
+    try:
+        return ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
 
-    사용 예::
 
-        result = TimezoneConverter.model_dump(reminder_response, request.state.timezone)
-        return ResponseProvider.success(result)
-    """
+def _serialize_local_datetime(value: datetime, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+    context = info.context
+    if context and (timezone := context.get(TIMEZONE_CONTEXT_KEY)):
+        tz = _zone(timezone)
+        if tz is not None:
+            value = value.astimezone(tz)
+    if info.mode_is_json():
+        # pydantic은 UTC 오프셋을 "Z"로 쓰므로, 기존 응답과 같은 isoformat() 형식(+00:00)으로 직렬화
+        return value.isoformat()
+    return handler(value)
+
+
+# 응답 스키마용 datetime 타입 - 직렬화 context에 timezone이 있으면 그 시간대로 변환합니다.
+# 모델을 따로 순회하지 않고 직렬화 한 번으로 변환되며, context가 없으면 (Redis 저장, 로그 등) UTC 그대로입니다.
+# 잘못된 시간대 이름이면 변환하지 않습니다. JSON에는 isoformat() 형식(예: "2026-02-24T15:30:00+09:00")으로 씁니다.
+#
+#     class ReminderResponse(BaseModel):
+#         next_run_at: LocalDatetime | None
+#
+#     ResponseProvider.success(reminder_response, timezone=request.state.timezone)
+#     reminder_response.model_dump(mode="json", context={"timezone": "Asia/Seoul"})
+LocalDatetime = Annotated[datetime, WrapSerializer(_serialize_local_datetime)]
+
 
-    @classmethod
-    def model_dump(cls, model: BaseModel, timezone: str) -> dict[str, Any]:
-        """Pydantic 모델의 datetime 필드를 지정 시간대로 변환하여 dict로 반환합니다."""
-        tz = ZoneInfo(timezone)
-        raw: dict[str, Any] = model.model_dump()
-        return cls._convert_dict(raw, tz)
-
-    @classmethod
-    def _convert_dict(cls, d: dict[str, Any], tz: ZoneInfo) -> dict[str, Any]:
-        return {k: cls._convert_value(v, tz) for k, v in d.items()}
-
-    @classmethod
-    def _convert_value(cls, value: Any, tz: ZoneInfo) -> Any:
-        if isinstance(value, datetime):
-            return value.astimezone(tz)
-        if isinstance(value, dict):
-            return cls._convert_dict(value, tz)
-        if isinstance(value, list):
-            return [cls._convert_value(item, tz) for item in value]
-        return value
-
-
-def format_datetime_for_timezone(dt: datetime, timezone: str) -> str:
+def local_dates_to_utc_range(start: date, end: date, timezone: str) -> tuple[datetime, datetime]:
     """
-    UTC datetime을 지정된 시간대로 변환하여 ISO 8601 형식으로 반환합니다.
+    사용자 시간대의 날짜 구간 [start, end)를 UTC datetime 구간으로 변환합니다.
+
+    created_at 등 UTC 컬럼을 범위 조건으로 비교하여 인덱스를 사용할 수 있게 합니다.
 
     Args:
-        dt: UTC datetime 객체 (timezone-aware)
-        timezone: IANA 시간대 문자열 (예: "Asia/Seoul", "America/New_York")
+        start: 시작 날짜 (포함)
+        end: 종료 날짜 (미포함)
+        timezone: IANA 시간대 문자열 (예: "Asia/Seoul")
 
     Returns:
-        ISO 8601 형식의 문자열 (예: "2026-02-24T15:30:00+09:00")
+        (start 자정의 UTC 시각, end 자정의 UTC 시각)
     """
-    try:
-        tz = ZoneInfo(timezone)
-        return dt.astimezone(tz).isoformat()
-    except Exception:
-        return dt.isoformat()
+    tz = ZoneInfo(timezone)
+    return (
+        datetime.combine(start, time.min, tzinfo=tz).astimezone(UTC),
+        datetime.combine(end, time.min, tzinfo=tz).astimezone(UTC),
+    )
+
+
+def add_months(month: date, months: int) -> date:
+    """month가 속한 달에서 months개월 이동한 달의 1일을 반환합니다 (음수면 이전 달)."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
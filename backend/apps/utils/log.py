@@ -9,6 +9,7 @@ from typing import Any
 from dependency_injector.wiring import Provide, inject
 from pydantic import BaseModel
 
+from apps.models.ai_log import AIProcessingLog
 from apps.types.ai_log import AILogStep
 
 
@@ -20,7 +21,7 @@ def ai_log[**P, R](
     """
     AI 처리 결과를 자동으로 로깅하는 데코레이터.
 
-    Repository는 DI 컨테이너에서 자동 주입됩니다.
+    로그는 DI 컨테이너의 AILogSink로 전달되어 백그라운드에서 배치 저장됩니다.
 
     Args:
         step: 처리 단계 (AILogStep Enum)
@@ -47,7 +48,7 @@ def ai_log[**P, R](
         @inject
         async def wrapper(  # type: ignore[valid-type]
             *args: P.args,
-            ai_log_repository: Any = Provide["ai_log_repository"],
+            ai_log_sink: Any = Provide["ai_log_sink"],
             **kwargs: P.kwargs,
         ) -> R:
             # 파라미터 바인딩
@@ -63,7 +64,7 @@ def ai_log[**P, R](
             user_id = arguments.get(user_id_param)
 
             # 모델명 추출
-            model_name = _get_model_name(self_obj)
+            model_name = _get_model_name(self_obj, step)
 
             # 실행 및 시간 측정
             start_time = time.monotonic()
@@ -73,16 +74,18 @@ def ai_log[**P, R](
             # 결과를 dict로 변환
             output_data = _to_dict(result)
 
-            # 로그 저장
-            if ai_log_repository and input_text:
+            # 로그 저장 (큐에 넣고 즉시 반환)
+            if ai_log_sink and input_text:
                 try:
-                    await ai_log_repository.create_log(
-                        step=step.value,
-                        input_text=str(input_text),
-                        output_data=output_data,
-                        user_id=user_id if isinstance(user_id, int) else None,
-                        model_name=model_name,
-                        processing_time_ms=processing_time_ms,
+                    await ai_log_sink.emit(
+                        AIProcessingLog(
+                            step=step.value,
+                            input_text=str(input_text),
+                            output_data=output_data,
+                            user_id=user_id if isinstance(user_id, int) else None,
+                            model_name=model_name,
+                            processing_time_ms=processing_time_ms,
+                        )
                     )
                 except Exception as e:
                     import logging
@@ -96,11 +99,20 @@ def ai_log[**P, R](
     return decorator
 
 
-def _get_model_name(self_obj: Any) -> str | None:
-    """객체에서 모델명을 추출합니다."""
+def _get_model_name(self_obj: Any, step: AILogStep) -> str | None:
+    """
+    객체에서 모델명을 추출합니다.
+
+    단계별로 다른 모델을 쓰는 서비스는 model_name(step) 메서드로 실제 호출하는 모델명을 제공합니다.
+    """
     if self_obj is None:
         return None
 
+    model_name = getattr(self_obj, "model_name", None)
+    if callable(model_name):
+        name: str = model_name(step)
+        return name
+
     config = getattr(self_obj, "config", None)
     if config:
         return getattr(config, "model", None)
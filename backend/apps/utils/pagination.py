@@ -0,0 +1,63 @@
+"""Keyset(커서) 페이지네이션 유틸리티"""
+
+import base64
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from apps.exceptions import AppException
+from apps.i18n import _
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    정렬 키 (value, id)를 담는 커서.
+
+    클라이언트에는 base64로 인코딩된 불투명 문자열로만 노출됩니다.
+    value는 정렬 컬럼 값(created_at, next_run_at 등)이며, NULL일 수 있습니다.
+
+    사용 예::
+
+        cursor = Cursor.decode(cursor_str) if cursor_str else None
+        memories = await memory_repository.get_all(user_id=user_id, limit=limit, cursor=cursor)
+        next_cursor = Cursor.next(memories, limit, lambda m: (m.created_at, m.id))
+    """
+
+    value: datetime | None
+    id: int
+
+    def encode(self) -> str:
+        """커서를 URL-safe 문자열로 인코딩합니다."""
+        payload = json.dumps([self.value.isoformat() if self.value else None, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "Cursor":
+        """인코딩된 커서 문자열을 해석합니다."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            value, id_ = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(
+                value=datetime.fromisoformat(value) if value is not None else None,
+                id=int(id_),
+            )
+        except (ValueError, TypeError):
+            raise AppException(_("Invalid cursor.")) from None
+
+    @classmethod
+    def next[T](
+        cls,
+        items: Sequence[T],
+        limit: int,
+        key: Callable[[T], tuple[datetime | None, int | None]],
+    ) -> str | None:
+        """조회 결과로 다음 페이지 커서를 만듭니다 (마지막 페이지면 None)."""
+        if not items or len(items) < limit:
+            return None
+
+        value, id_ = key(items[-1])
+        if id_ is None:
+            return None
+        return cls(value=value, id=id_).encode()
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from dependency_injector import containers, providers
 
 from apps.auth import SessionAuthBackend
@@ -9,9 +11,14 @@ from apps.repositories.memory import MemoryRepository
 from apps.repositories.reminder import ReminderRepository
 from apps.repositories.user import UserRepository
 from apps.repositories.voice import VoiceSessionRepository
+from apps.services.ai_log_sink import AILogSink
 from apps.services.assistant import AssistantService
+from apps.services.assistant_job import AssistantJobService
 from apps.services.auth import AuthService
 from apps.services.conversation import ConversationService
+from apps.services.lifecycle import LifecycleService
+from apps.services.memory_calendar import MemoryCalendarService
+from apps.services.memory_import import MemoryImportService
 from apps.services.push import PushService
 from apps.services.reminder import ReminderService
 from apps.services.session import SessionService
@@ -19,13 +26,23 @@ from apps.services.social import SocialAuthService
 from apps.services.streaming_voice import StreamingVoiceService
 from apps.services.voice import VoiceService
 from apps.services.voice_session import VoiceSessionService
+from apps.types.ai_log import AILogConfig
 from apps.types.assistant import AssistantConfig
+from apps.types.assistant_job import AssistantJobConfig
+from apps.types.calendar import CalendarConfig
 from apps.types.database import DatabaseConfig
+from apps.types.lifecycle import LifecycleConfig
+from apps.types.memory_import import MemoryImportConfig
 from apps.types.redis import RedisConfig
 from apps.types.social import Social
 from apps.types.voice import VoiceConfig
 from database import Database
 
+# 외부 SDK는 각 서비스에서 처음 사용할 때 import합니다 (여기서는 타입 표기에만 사용).
+if TYPE_CHECKING:
+    from google.cloud.speech_v2 import SpeechAsyncClient
+    from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(packages=["apps"])
@@ -115,12 +132,28 @@ class Container(containers.DeclarativeContainer):
         credentials_path=config.firebase.credentials_path,
     )
 
+    # 외부 API 클라이언트 - None이면 각 서비스가 설정으로 지연 생성 (벤치마크/테스트에서 override)
+    speech_client: providers.Object["SpeechAsyncClient | None"] = providers.Object(None)
+    llm: providers.Object["ChatGoogleGenerativeAI | None"] = providers.Object(None)
+    embeddings: providers.Object["GoogleGenerativeAIEmbeddings | None"] = providers.Object(None)
+
     streaming_voice_service = providers.Singleton(
         StreamingVoiceService,
         config=providers.Factory(
             lambda c: VoiceConfig(**c),
             config.voice,
         ),
+        client=speech_client,
+    )
+
+    memory_calendar_service = providers.Singleton(
+        MemoryCalendarService,
+        config=providers.Factory(
+            lambda c: CalendarConfig(**c),
+            config.calendar,
+        ),
+        memory_repository=memory_repository,
+        redis_cache=redis_cache,
     )
 
     assistant_service = providers.Singleton(
@@ -131,6 +164,23 @@ class Container(containers.DeclarativeContainer):
         ),
         memory_repository=memory_repository,
         reminder_repository=reminder_repository,
+        memory_calendar_service=memory_calendar_service,
+        redis_cache=redis_cache,
+        llm=llm,
+        embeddings=embeddings,
+    )
+
+    memory_import_service = providers.Singleton(
+        MemoryImportService,
+        config=providers.Factory(
+            lambda c: MemoryImportConfig(**c),
+            config.memory_import,
+        ),
+        assistant_service=assistant_service,
+        memory_repository=memory_repository,
+        reminder_repository=reminder_repository,
+        memory_calendar_service=memory_calendar_service,
+        redis_cache=redis_cache,
     )
 
     reminder_service = providers.Factory(
@@ -154,6 +204,15 @@ class Container(containers.DeclarativeContainer):
         database=database,
     )
 
+    ai_log_sink = providers.Singleton(
+        AILogSink,
+        config=providers.Factory(
+            lambda c: AILogConfig(**c),
+            config.ai_log,
+        ),
+        ai_log_repository=ai_log_repository,
+    )
+
     voice_session_service = providers.Factory(
         VoiceSessionService,
         voice_session_repository=voice_session_repository,
@@ -165,3 +224,31 @@ class Container(containers.DeclarativeContainer):
         conversation_repository=conversation_repository,
         assistant_service=assistant_service,
     )
+
+    assistant_job_service = providers.Singleton(
+        AssistantJobService,
+        config=providers.Factory(
+            lambda c: AssistantJobConfig(**c),
+            config.assistant_job,
+        ),
+        assistant_service=assistant_service,
+        conversation_service=conversation_service,
+        redis_cache=redis_cache,
+    )
+
+    lifecycle_service = providers.Singleton(
+        LifecycleService,
+        config=providers.Factory(
+            lambda c: LifecycleConfig(**c),
+            config.lifecycle,
+        ),
+        database=database,
+        redis_cache=redis_cache,
+        session_service=session_service,
+        streaming_voice_service=streaming_voice_service,
+        voice_service=voice_service,
+        assistant_service=assistant_service,
+        assistant_job_service=assistant_job_service,
+        memory_import_service=memory_import_service,
+        ai_log_sink=ai_log_sink,
+    )
@@ -1,20 +1,199 @@
-from collections.abc import AsyncIterator, Callable
-from contextlib import asynccontextmanager
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager, suppress
 from contextvars import ContextVar
 from functools import wraps
+from typing import Any
 
 from dependency_injector.wiring import Provide, inject
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
-from apps.types.database import DatabaseConfig
+from apps.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS, DB_POOL_OVERFLOW_CHECKOUTS, DB_POOL_TIMEOUTS
+from apps.types.database import DatabaseConfig, PoolStatus
+
+logger = logging.getLogger(__name__)
 
 # 현재 트랜잭션 세션을 저장하는 컨텍스트 변수
 _current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
 
+# 커밋 후 실행할 콜백 목록을 저장하는 session.info 키
+_ON_COMMIT_KEY = "on_commit_callbacks"
+
+# 세션에서 쓰기(INSERT/UPDATE/DELETE 등)가 있었는지 표시하는 session.info 키
+_HAS_WRITES_KEY = "has_writes"
+
+
+class ReadRouting:
+    """
+    요청(또는 작업) 단위 읽기 라우팅 상태
+
+    - primary: True면 읽기도 primary에서 수행 (직전 쓰기를 읽어야 하는 경우)
+    - wrote: 이번 요청에서 쓰기가 있었는지 (ReadReplicaMiddleware가 다음 요청의 stickiness에 사용)
+    - sticky: primary에서 읽어야 하는지 확인하는 함수 (ReadReplicaMiddleware의 Redis 조회)
+      복제본 읽기 세션을 처음 열 때 한 번만 호출하므로, 복제본을 읽지 않는 요청은 조회하지 않음
+    """
+
+    def __init__(self, primary: bool = False, sticky: Callable[[], Awaitable[bool]] | None = None) -> None:
+        self.primary = primary
+        self.wrote = False
+        self._sticky = sticky
+
+    async def primary_reads(self) -> bool:
+        """읽기를 primary에서 해야 하는지 확인합니다."""
+        if self._sticky is not None:
+            sticky = await self._sticky()
+            self._sticky = None
+            self.primary = self.primary or sticky
+        return self.primary or self.wrote
+
+
+# 현재 읽기 라우팅 상태 (read_routing에서 설정)
+_read_routing: ContextVar[ReadRouting | None] = ContextVar("read_routing", default=None)
+
+
+@contextmanager
+def read_routing(primary: bool = False, sticky: Callable[[], Awaitable[bool]] | None = None) -> Iterator[ReadRouting]:
+    """
+    블록 안의 읽기 라우팅 상태를 설정합니다.
+
+    - ReadReplicaMiddleware: 요청마다 설정하고, 요청이 끝나면 routing.wrote로 쓰기 여부 확인
+    - primary=True: 블록 안의 읽기를 모두 primary로 보냄 (방금 쓴 데이터를 다시 읽는 백그라운드 작업 등)
+    - sticky: 복제본 읽기 직전에 primary로 보낼지 확인하는 함수 (ReadRouting 참고)
+    """
+    routing = ReadRouting(primary=primary, sticky=sticky)
+    token = _read_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _read_routing.reset(token)
+
+
+class _TrackedSession(Session):
+    """쓰기 여부를 session.info에 기록하는 세션 (요청 단위 커밋 생략, 읽기 stickiness 판단용)"""
+
+
+@event.listens_for(_TrackedSession, "do_orm_execute")
+def _mark_write(orm_execute_state: Any) -> None:
+    # SELECT가 아닌 문장(DML, text() 등)은 모두 쓰기로 간주합니다.
+    if not orm_execute_state.is_select:
+        _record_write(orm_execute_state.session)
+
+
+@event.listens_for(_TrackedSession, "after_flush")
+def _mark_flush(session: Session, _flush_context: Any) -> None:
+    _record_write(session)
+
+
+def _record_write(session: Session) -> None:
+    session.info[_HAS_WRITES_KEY] = True
+    routing = _read_routing.get()
+    if routing is not None:
+        routing.wrote = True
+
+
+class RequestScope:
+    """
+    요청 단위 세션 (Database.request_scope에서 생성)
+
+    첫 DB 접근 시점에 세션을 만들고, 요청 안의 repository 호출이 모두 이 세션을 공유합니다.
+    """
+
+    def __init__(self, database: "Database") -> None:
+        self.database = database
+        self.session: AsyncSession | None = None
+        self.closed = False
+
+    def get_session(self) -> AsyncSession:
+        if self.session is None:
+            self.session = self.database._session_factory()
+        return self.session
+
+    @property
+    def has_writes(self) -> bool:
+        return self.session is not None and bool(self.session.info.get(_HAS_WRITES_KEY))
+
+    async def finish(self, commit: bool) -> None:
+        """
+        요청 단위 세션을 종료합니다. 여러 번 호출해도 한 번만 처리합니다.
+
+        - commit=True이고 쓰기가 있었으면 COMMIT 후 on_commit 콜백 실행
+        - 읽기만 했거나 commit=False면 COMMIT 없이 세션을 닫음 (연결 반환 시 롤백)
+        """
+        if self.closed:
+            return
+        self.closed = True
+        session = self.session
+        if session is None:
+            return
+
+        callbacks: list[Callable[[], Awaitable[None]]] = []
+        try:
+            if commit and self.has_writes:
+                await session.commit()
+            if commit:
+                callbacks = session.info.pop(_ON_COMMIT_KEY, [])
+        finally:
+            await session.close()
+
+        for callback in callbacks:
+            await _run_callback(callback)
+
+
+# 현재 요청 단위 세션 (RequestSessionMiddleware가 적용된 요청에서만 설정)
+_request_scope: ContextVar[RequestScope | None] = ContextVar("request_scope", default=None)
+
+
+def _active_request_scope() -> RequestScope | None:
+    scope = _request_scope.get()
+    if scope is None or scope.closed:
+        return None
+    return scope
+
+
+async def on_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Django의 transaction.on_commit과 유사하게 현재 트랜잭션이 커밋된 뒤 콜백을 실행합니다.
+
+    - 트랜잭션 컨텍스트 내부: 커밋 후 실행 (롤백되면 실행하지 않음)
+    - 트랜잭션 컨텍스트 외부: 즉시 실행 (repository 호출마다 이미 커밋됨)
+
+    캐시 무효화처럼 커밋 전에 실행하면 다른 요청이 이전 데이터를 다시 캐시할 수 있는 작업에 사용합니다.
+    콜백에서 발생한 예외는 로그만 남기고 전파하지 않습니다.
+
+    사용 예:
+        await on_commit(lambda: calendar_service.invalidate(user_id))
+    """
+    session = _current_session.get()
+    if session is None:
+        # 요청 단위 세션에 쓰기가 있었다면 요청 종료 시 커밋 후 실행
+        scope = _active_request_scope()
+        if scope is not None and scope.session is not None:
+            session = scope.session
+    if session is None:
+        await _run_callback(callback)
+    else:
+        session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+async def _run_callback(callback: Callable[[], Awaitable[None]]) -> None:
+    try:
+        await callback()
+    except Exception:
+        logger.exception("on_commit callback failed")
+
 
 def transactional[**P, R](func: Callable[P, R]) -> Callable[P, R]:
     """
@@ -44,31 +223,301 @@ def transactional[**P, R](func: Callable[P, R]) -> Callable[P, R]:
     return wrapper  # type: ignore[return-value]
 
 
+class PoolStats:
+    """연결 풀 누적 지표 (InstrumentedAsyncPool에서 기록, Prometheus 지표에도 pool=name으로 기록)"""
+
+    def __init__(self, name: str, warn_seconds: float) -> None:
+        self.name = name
+        self.warn_seconds = warn_seconds
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+
+    def record_checkout(self, wait_seconds: float, overflow: bool) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        DB_POOL_CHECKOUT_WAIT.labels(self.name).observe(wait_seconds)
+        if overflow:
+            self.overflow_checkouts += 1
+            DB_POOL_OVERFLOW_CHECKOUTS.labels(self.name).inc()
+        if wait_seconds >= self.warn_seconds:
+            logger.warning("Slow DB connection checkout: %.3fs (pool=%s)", wait_seconds, self.name)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+        DB_POOL_TIMEOUTS.labels(self.name).inc()
+
+    def record_usage(self, in_use: int, idle: int, overflow: int) -> None:
+        DB_POOL_CONNECTIONS.labels(self.name, "in_use").set(in_use)
+        DB_POOL_CONNECTIONS.labels(self.name, "idle").set(idle)
+        DB_POOL_CONNECTIONS.labels(self.name, "overflow").set(overflow)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간, overflow 사용, 타임아웃, 연결 수를 PoolStats에 기록하는 연결 풀"""
+
+    stats: PoolStats
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_checkout(time.perf_counter() - started, overflow=self.checkedout() > self.size())
+        self._record_usage()
+        return entry
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._record_usage()
+
+    def _record_usage(self) -> None:
+        self.stats.record_usage(self.checkedout(), self.checkedin(), max(self.overflow(), 0))
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        # dispose/연결 무효화로 풀이 다시 만들어져도 지표는 이어서 기록
+        pool: InstrumentedAsyncPool = super().recreate()  # type: ignore[assignment]
+        pool.stats = self.stats
+        return pool
+
+
+class Replica:
+    """읽기 전용 복제본 연결과 마지막으로 확인한 복제 지연"""
+
+    # 재생할 WAL이 없으면 0, 아니면 마지막 재생 트랜잭션 이후 경과 시간
+    LAG_SQL = text(
+        """
+        SELECT CASE
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+        """
+    )
+
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.session_factory = _session_factory(engine)
+        self.lag_seconds: float | None = None
+        self.checked_at = float("-inf")
+        self._check_task: asyncio.Task[None] | None = None
+
+    def schedule_lag_check(self, timeout_seconds: float, max_lag_seconds: float) -> None:
+        """
+        복제 지연 확인을 백그라운드에서 시작합니다 (이미 확인 중이면 무시).
+
+        요청은 결과를 기다리지 않고 마지막으로 확인한 값을 사용하므로, 복제본이 응답하지 않아도
+        연결 시간 초과만큼 요청이 지연되지 않습니다.
+        """
+        if self._check_task is not None and not self._check_task.done():
+            return
+        self.checked_at = time.monotonic()
+        # 요청 컨텍스트(트랜잭션/요청 단위 세션)를 물려받지 않도록 빈 컨텍스트에서 실행합니다.
+        self._check_task = asyncio.create_task(
+            self.check_lag(timeout_seconds, max_lag_seconds), context=contextvars.Context()
+        )
+
+    async def check_lag(self, timeout_seconds: float, max_lag_seconds: float) -> None:
+        """복제 지연을 확인합니다. 실패하거나 timeout_seconds 안에 응답이 없으면 다음 확인 때까지 사용하지 않습니다."""
+        self.checked_at = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout_seconds), self.engine.connect() as conn:
+                lag = await conn.scalar(self.LAG_SQL)
+            self.lag_seconds = float(lag or 0)
+        except Exception:
+            logger.warning("Replica lag check failed: %s", self.name, exc_info=True)
+            self.lag_seconds = None
+            return
+        if self.lag_seconds > max_lag_seconds:
+            logger.warning("Replica %s lagging %.1fs, reading from primary", self.name, self.lag_seconds)
+
+    async def cancel_lag_check(self) -> None:
+        if self._check_task is not None and not self._check_task.done():
+            self._check_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._check_task
+
+
+def _session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=_TrackedSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
 class Database:
     def __init__(self, database_config: DatabaseConfig) -> None:
         self.database_config = database_config
-        self._engine = create_async_engine(database_config.async_psql_database_url, echo=database_config.echo)
-        self._session_factory = async_sessionmaker(
-            bind=self._engine,
-            class_=AsyncSession,
-            autocommit=False,
-            autoflush=False,
-            expire_on_commit=False,
+        self._engine = self._create_engine("primary", database_config.async_psql_database_url)
+        self._pool_stats = self._pool.stats
+        self._session_factory = _session_factory(self._engine)
+        self._replicas = [
+            Replica(
+                replica.name, self._create_engine(replica.name, database_config.async_replica_database_url(replica))
+            )
+            for replica in database_config.replicas
+        ]
+        self._replica_cycle = itertools.cycle(self._replicas)
+
+    def _create_engine(self, name: str, url: str) -> AsyncEngine:
+        database_config = self.database_config
+        engine = create_async_engine(
+            url,
+            echo=database_config.echo,
+            poolclass=InstrumentedAsyncPool,
+            pool_size=database_config.pool_size,
+            max_overflow=database_config.max_overflow,
+            pool_timeout=database_config.pool_timeout,
+            pool_recycle=database_config.pool_recycle,
+            pool_pre_ping=database_config.pool_pre_ping,
+            connect_args={
+                "statement_cache_size": database_config.statement_cache_size,
+                "prepared_statement_cache_size": database_config.prepared_statement_cache_size,
+                "server_settings": database_config.server_settings,
+            },
         )
+        pool: InstrumentedAsyncPool = engine.sync_engine.pool  # type: ignore[assignment]
+        pool.stats = PoolStats(name, database_config.pool_checkout_warn_seconds)
+        return engine
+
+    @property
+    def _pool(self) -> InstrumentedAsyncPool:
+        pool: InstrumentedAsyncPool = self._engine.sync_engine.pool  # type: ignore[assignment]
+        return pool
+
+    def pool_status(self) -> PoolStatus:
+        """연결 풀 현재 상태와 누적 지표를 반환합니다."""
+        pool = self._pool
+        stats = self._pool_stats
+        return PoolStatus(
+            size=pool.size(),
+            in_use=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            checkouts=stats.checkouts,
+            checkout_wait_seconds_total=stats.wait_seconds_total,
+            checkout_wait_seconds_max=stats.wait_seconds_max,
+            overflow_checkouts=stats.overflow_checkouts,
+            timeouts=stats.timeouts,
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    async def warmup(self, connections: int) -> int:
+        """
+        primary 연결 풀에 연결을 미리 열어 둡니다 (시작 시 호출).
+
+        connections개(pool_size 이하)를 동시에 체크아웃해서 SELECT 1을 실행한 뒤 풀에 반납하므로,
+        첫 요청들이 연결 생성(TCP/인증) 비용을 내지 않습니다. 열어 둔 연결 수를 반환합니다.
+        """
+        count = min(connections, self.database_config.pool_size)
+        await self._warmup_engine(self._engine, count)
+        return count
+
+    async def warmup_replicas(self, connections: int) -> None:
+        """
+        각 복제본의 연결 풀에 연결을 미리 열어 둡니다 (시작 시 호출).
+
+        복제본 읽기는 실패하면 primary로 대체되므로 primary warm-up과 분리합니다.
+        연결하지 못한 복제본은 로그만 남기고, 모든 복제본이 실패하면 마지막 예외를 발생시킵니다.
+        """
+        count = min(connections, self.database_config.pool_size)
+        error: Exception | None = None
+        warmed = 0
+        for replica in self._replicas:
+            try:
+                await self._warmup_engine(replica.engine, count)
+                warmed += 1
+                # 첫 읽기부터 복제본을 쓸 수 있도록 지연도 미리 확인
+                await replica.check_lag(
+                    self.database_config.replica_lag_check_timeout_seconds, self.database_config.replica_max_lag_seconds
+                )
+            except Exception as e:
+                logger.warning("Warm-up of replica %s failed: %r", replica.name, e)
+                error = e
+        if warmed == 0 and error is not None:
+            raise error
+
+    @staticmethod
+    async def _warmup_engine(engine: AsyncEngine, count: int) -> None:
+        async with AsyncExitStack() as stack:
+            for _ in range(count):
+                connection = await stack.enter_async_context(engine.connect())
+                await connection.execute(text("SELECT 1"))
+
+    async def dispose(self) -> None:
+        """풀의 모든 연결을 닫습니다 (프로세스 종료 시 호출)."""
+        logger.debug("Disposing DB engine: %s", self.pool_status().model_dump())
+        await self._engine.dispose()
+        for replica in self._replicas:
+            await replica.cancel_lag_check()
+            await replica.engine.dispose()
+
+    def _pick_replica(self) -> Replica | None:
+        """
+        복제 지연이 허용 범위 안인 복제본을 라운드 로빈으로 고릅니다 (없으면 None → primary).
+
+        마지막으로 확인한 지연만 읽고, replica_lag_check_seconds가 지났으면 백그라운드 확인을 시작합니다.
+        """
+        config = self.database_config
+        for _ in range(len(self._replicas)):
+            replica = next(self._replica_cycle)
+            if time.monotonic() - replica.checked_at >= config.replica_lag_check_seconds:
+                replica.schedule_lag_check(config.replica_lag_check_timeout_seconds, config.replica_max_lag_seconds)
+            if replica.lag_seconds is not None and replica.lag_seconds <= config.replica_max_lag_seconds:
+                return replica
+        return None
+
+    @staticmethod
+    async def _primary_reads_required(scope: RequestScope | None) -> bool:
+        """직전 쓰기를 읽어야 해서 primary에서 읽어야 하는지 확인합니다."""
+        if scope is not None and scope.has_writes:
+            return True
+        routing = _read_routing.get()
+        return routing is not None and await routing.primary_reads()
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
         """
         세션을 가져옵니다.
 
         - 트랜잭션 컨텍스트 내부: 기존 세션 재사용 (커밋 안 함)
-        - 트랜잭션 컨텍스트 외부: 새 세션 생성 후 자동 커밋
+        - readonly=True: 복제본 세션 (커밋 안 함) - 아래 경우에는 primary 사용
+            - 복제본이 없거나 모두 replica_max_lag_seconds 이상 지연됨
+            - 최근 쓰기가 있었던 사용자/요청 (read-your-writes, ReadReplicaMiddleware)
+        - 요청 단위 세션 내부: 요청 세션 재사용 (요청 종료 시 한 번 커밋)
+        - 그 외: 새 세션 생성 후 자동 커밋
         """
         existing_session = _current_session.get()
+        scope = _active_request_scope()
+        replica = None
+        if existing_session is None and readonly and self._replicas and not await self._primary_reads_required(scope):
+            replica = self._pick_replica()
 
         if existing_session is not None:
             # 트랜잭션 내부 - 기존 세션 사용, 커밋하지 않음
             yield existing_session
+        elif replica is not None:
+            # 복제본 읽기 - 커밋할 것이 없으므로 닫기만 함
+            replica_session = replica.session_factory()
+            try:
+                yield replica_session
+            finally:
+                await replica_session.close()
+        elif scope is not None:
+            # 요청 단위 세션 - 커밋은 RequestSessionMiddleware가 응답 직전에 수행
+            yield scope.get_session()
         else:
             # 트랜잭션 외부 - 새 세션 생성, 자동 커밋
             session: AsyncSession = self._session_factory()
@@ -99,20 +548,53 @@ class Database:
                     await repo2.create(item2)
         """
         existing_session = _current_session.get()
+        scope = _active_request_scope()
 
         if existing_session is not None:
             # 이미 트랜잭션 내부 - 같은 세션 사용 (중첩 트랜잭션)
             yield existing_session
+        elif scope is not None:
+            # 요청 단위 세션 내부 - SAVEPOINT로 이 블록만 원자적으로 처리하고, 커밋은 요청 종료 시 수행
+            session = scope.get_session()
+            token = _current_session.set(session)
+            try:
+                async with session.begin_nested():
+                    yield session
+            finally:
+                _current_session.reset(token)
         else:
             # 새 트랜잭션 시작
-            session: AsyncSession = self._session_factory()
+            session = self._session_factory()
             token = _current_session.set(session)
             try:
                 yield session
                 await session.commit()
+                callbacks = session.info.pop(_ON_COMMIT_KEY, [])
             except Exception:
                 await session.rollback()
                 raise
             finally:
                 _current_session.reset(token)
                 await session.close()
+
+            for callback in callbacks:
+                await _run_callback(callback)
+
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncIterator[RequestScope]:
+        """
+        요청 단위 세션 컨텍스트 (RequestSessionMiddleware에서 사용).
+
+        - 세션은 첫 DB 접근 시점에 만들어지므로 DB를 쓰지 않는 요청은 연결을 잡지 않습니다.
+        - 컨텍스트 안의 repository 호출, @transactional은 모두 같은 세션을 사용합니다.
+        - scope.finish(commit=True)로 응답 전에 커밋하며, 호출하지 않고 빠져나가면 커밋 없이 닫습니다.
+
+        백그라운드 태스크는 contextvars.Context()로 빈 컨텍스트에서 실행해야 요청 세션을 물려받지 않습니다.
+        """
+        scope = RequestScope(self)
+        token = _request_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _request_scope.reset(token)
+            await scope.finish(commit=False)
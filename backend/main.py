@@ -15,7 +15,7 @@ from starlette.middleware.sessions import SessionMiddleware
 from apps.controllers import *
 from apps.exceptions import VALIDATION_ERROR_RESPONSES, exception_handlers
 from apps.i18n.middleware import I18nMiddleware
-from apps.middlewares import TimezoneMiddleware
+from apps.middlewares import MetricsMiddleware, ReadReplicaMiddleware, RequestSessionMiddleware, TimezoneMiddleware
 from containers import Container
 from settings import Settings
 
@@ -36,8 +36,15 @@ limiter = Limiter(key_func=get_remote_address, storage_uri=Settings.redis.url)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.container = container
     app.state.limiter = limiter
+
+    # 외부 클라이언트 warm-up (완료 전까지 /ready는 503), 종료 시 처리 중인 작업 마무리 후 모두 닫음
+    lifecycle = container.lifecycle_service()
+    lifecycle.start()
+
     yield
 
+    await lifecycle.shutdown()
+
 
 app = FastAPI(
     lifespan=lifespan,
@@ -73,9 +80,23 @@ def openapi():
 app.openapi = openapi
 
 app.add_middleware(SessionMiddleware, secret_key=Settings.secret_key)
+if Settings.database.replicas:
+    app.add_middleware(
+        ReadReplicaMiddleware,
+        redis_cache=container.redis_cache(),
+        sticky_seconds=Settings.database.read_your_writes_seconds,
+    )
 app.add_middleware(AuthenticationMiddleware, backend=container.auth_backend())
+if Settings.database.request_scope:
+    app.add_middleware(
+        RequestSessionMiddleware,
+        database=container.database(),
+        exclude_paths=Settings.database.request_scope_exclude_paths,
+    )
 app.add_middleware(I18nMiddleware)
 app.add_middleware(TimezoneMiddleware)
+if Settings.metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
 
 exception_handlers(app)
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -83,6 +104,9 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 for router in routers:
     app.include_router(router)
+app.include_router(health.router)
+if Settings.metrics.enabled:
+    app.include_router(metrics.router)
 
 # Static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
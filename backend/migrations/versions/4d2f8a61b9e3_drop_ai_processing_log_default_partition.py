@@ -0,0 +1,83 @@
+"""drop ai_processing_log default partition
+
+Revision ID: 4d2f8a61b9e3
+Revises: e7b3d50a9c12
+Create Date: 2026-10-19 18:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+import pgvector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2f8a61b9e3'
+down_revision: Union[str, Sequence[str], None] = 'e7b3d50a9c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, created_at, updated_at, conversation_id, user_id, step, input_text, output_data, model_name, "
+    "processing_time_ms"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기본 파티션에 행이 있으면 그 달의 월 파티션을 만들 수 없고(ensure_partitions 실패), 집계/보관 대상에서도 빠지므로 제거.
+    # 기본 파티션의 행은 해당 달 파티션을 만들어 옮김. 이후 범위 밖 로그는 INSERT가 실패함 (AILogSink의 failed로 집계).
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            IF to_regclass('ai_processing_log_default') IS NULL THEN
+                RETURN;
+            END IF;
+            ALTER TABLE ai_processing_log DETACH PARTITION ai_processing_log_default;
+
+            FOR month IN
+                SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date FROM ai_processing_log_default
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS ai_processing_log_p%s PARTITION OF ai_processing_log '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month, 'YYYYMM'),
+                    month::timestamp AT TIME ZONE 'UTC',
+                    (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+
+            INSERT INTO ai_processing_log ({COLUMNS}) SELECT {COLUMNS} FROM ai_processing_log_default;
+
+            -- 옮긴 로그가 있는 날짜의 일별 집계 다시 계산 (UTC 날짜)
+            CREATE TEMP TABLE moved_day ON COMMIT DROP AS
+                SELECT DISTINCT CAST(timezone('UTC', created_at) AS DATE) AS day FROM ai_processing_log_default;
+            DELETE FROM ai_processing_log_daily WHERE day IN (SELECT day FROM moved_day);
+            INSERT INTO ai_processing_log_daily (day, step, model_name, count, avg_ms, p50_ms, p95_ms, p99_ms, max_ms)
+            SELECT CAST(timezone('UTC', created_at) AS DATE),
+                   step,
+                   COALESCE(model_name, ''),
+                   count(*),
+                   avg(processing_time_ms),
+                   percentile_cont(0.5) WITHIN GROUP (ORDER BY processing_time_ms),
+                   percentile_cont(0.95) WITHIN GROUP (ORDER BY processing_time_ms),
+                   percentile_cont(0.99) WITHIN GROUP (ORDER BY processing_time_ms),
+                   max(processing_time_ms)
+            FROM ai_processing_log
+            WHERE CAST(timezone('UTC', created_at) AS DATE) IN (SELECT day FROM moved_day)
+            GROUP BY 1, 2, 3;
+
+            DROP TABLE ai_processing_log_default;
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE TABLE ai_processing_log_default PARTITION OF ai_processing_log DEFAULT")
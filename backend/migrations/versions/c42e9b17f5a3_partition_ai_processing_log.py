@@ -0,0 +1,166 @@
+"""partition ai_processing_log by month and add daily rollup
+
+Revision ID: c42e9b17f5a3
+Revises: 8a4e6d21c0b7
+Create Date: 2026-10-19 14:21:08.513276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+import pgvector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c42e9b17f5a3'
+down_revision: Union[str, Sequence[str], None] = '8a4e6d21c0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, created_at, updated_at, conversation_id, user_id, step, input_text, output_data, model_name, "
+    "processing_time_ms"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 테이블은 이름을 바꿔 두고 데이터를 옮긴 뒤 삭제 (id 시퀀스는 새 테이블로 이전)
+    op.execute("ALTER TABLE ai_processing_log RENAME TO ai_processing_log_old")
+    op.execute("ALTER TABLE ai_processing_log_old RENAME CONSTRAINT ai_processing_log_pkey TO ai_processing_log_old_pkey")
+    op.drop_index(op.f('ix_ai_processing_log_user_id'), table_name='ai_processing_log_old')
+    op.drop_index(op.f('ix_ai_processing_log_step'), table_name='ai_processing_log_old')
+    op.drop_index(op.f('ix_ai_processing_log_conversation_id'), table_name='ai_processing_log_old')
+
+    # 파티션 키(created_at)는 기본 키에 포함되어야 함, 쓰기 비용을 줄이기 위해 외래 키는 두지 않음
+    op.execute(
+        """
+        CREATE TABLE ai_processing_log (
+            id INTEGER NOT NULL DEFAULT nextval('ai_processing_log_id_seq'),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            conversation_id INTEGER,
+            user_id INTEGER,
+            step VARCHAR(50) NOT NULL,
+            input_text TEXT NOT NULL,
+            output_data JSON NOT NULL,
+            model_name VARCHAR(100),
+            processing_time_ms INTEGER,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE ai_processing_log_id_seq OWNED BY ai_processing_log.id")
+
+    # 월 파티션이 없는 시각의 로그를 받는 기본 파티션 (평소에는 비어 있어야 함)
+    op.execute("CREATE TABLE ai_processing_log_default PARTITION OF ai_processing_log DEFAULT")
+
+    # 가장 오래된 로그가 있는 달부터 3개월 뒤까지 월 파티션 생성 (UTC 기준)
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE((SELECT min(created_at) FROM ai_processing_log_old), now())
+                                        AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE ai_processing_log_p%s PARTITION OF ai_processing_log FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month, 'YYYYMM'),
+                    month::timestamp AT TIME ZONE 'UTC',
+                    (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END $$
+        """
+    )
+
+    op.execute(f"INSERT INTO ai_processing_log ({COLUMNS}) SELECT {COLUMNS} FROM ai_processing_log_old")
+    op.drop_table('ai_processing_log_old')
+
+    op.create_index(op.f('ix_ai_processing_log_conversation_id'), 'ai_processing_log', ['conversation_id'], unique=False)
+    op.create_index('ix_ai_processing_log_user_id_created_at', 'ai_processing_log', ['user_id', 'created_at'], unique=False)
+
+    op.create_table('ai_processing_log_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('step', sa.String(length=50), nullable=False),
+    sa.Column('model_name', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('avg_ms', sa.Float(), nullable=True),
+    sa.Column('p50_ms', sa.Float(), nullable=True),
+    sa.Column('p95_ms', sa.Float(), nullable=True),
+    sa.Column('p99_ms', sa.Float(), nullable=True),
+    sa.Column('max_ms', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('day', 'step', 'model_name')
+    )
+
+    # 기존 로그로 일별 집계 채우기 (UTC 날짜)
+    op.execute(
+        """
+        INSERT INTO ai_processing_log_daily (day, step, model_name, count, avg_ms, p50_ms, p95_ms, p99_ms, max_ms)
+        SELECT CAST(timezone('UTC', created_at) AS DATE),
+               step,
+               COALESCE(model_name, ''),
+               count(*),
+               avg(processing_time_ms),
+               percentile_cont(0.5) WITHIN GROUP (ORDER BY processing_time_ms),
+               percentile_cont(0.95) WITHIN GROUP (ORDER BY processing_time_ms),
+               percentile_cont(0.99) WITHIN GROUP (ORDER BY processing_time_ms),
+               max(processing_time_ms)
+        FROM ai_processing_log
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ai_processing_log_daily')
+
+    op.execute("ALTER TABLE ai_processing_log RENAME TO ai_processing_log_partitioned")
+    op.execute(
+        "ALTER TABLE ai_processing_log_partitioned RENAME CONSTRAINT ai_processing_log_pkey "
+        "TO ai_processing_log_partitioned_pkey"
+    )
+    op.drop_index('ix_ai_processing_log_user_id_created_at', table_name='ai_processing_log_partitioned')
+    op.drop_index(op.f('ix_ai_processing_log_conversation_id'), table_name='ai_processing_log_partitioned')
+
+    op.create_table('ai_processing_log',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('ai_processing_log_id_seq')"), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('conversation_id', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('step', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('input_text', sa.Text(), nullable=False),
+    sa.Column('output_data', sa.JSON(), nullable=False),
+    sa.Column('model_name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+    sa.Column('processing_time_ms', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversation.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("ALTER SEQUENCE ai_processing_log_id_seq OWNED BY ai_processing_log.id")
+
+    # 외래 키를 만족하지 않는 로그(삭제된 Conversation/사용자)는 옮기지 않음
+    op.execute(
+        f"""
+        INSERT INTO ai_processing_log ({COLUMNS})
+        SELECT {COLUMNS} FROM ai_processing_log_partitioned AS log
+        WHERE (log.conversation_id IS NULL OR EXISTS (SELECT 1 FROM conversation WHERE conversation.id = log.conversation_id))
+          AND (log.user_id IS NULL OR EXISTS (SELECT 1 FROM "user" WHERE "user".id = log.user_id))
+        """
+    )
+    op.execute("DROP TABLE ai_processing_log_partitioned")
+
+    op.create_index(op.f('ix_ai_processing_log_conversation_id'), 'ai_processing_log', ['conversation_id'], unique=False)
+    op.create_index(op.f('ix_ai_processing_log_step'), 'ai_processing_log', ['step'], unique=False)
+    op.create_index(op.f('ix_ai_processing_log_user_id'), 'ai_processing_log', ['user_id'], unique=False)
@@ -0,0 +1,36 @@
+"""add partial index for memories saved without embedding
+
+Revision ID: e7b3d50a9c12
+Revises: c42e9b17f5a3
+Create Date: 2026-10-19 16:42:31.207114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+import pgvector
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d50a9c12'
+down_revision: Union[str, Sequence[str], None] = 'c42e9b17f5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_memory_embedding_missing',
+        'memory',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('embedding IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_memory_embedding_missing', table_name='memory', postgresql_where=sa.text('embedding IS NULL'))
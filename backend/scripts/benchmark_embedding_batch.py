@@ -0,0 +1,98 @@
+"""
+단건 임베딩 요청 묶기(EmbeddingBatcher) 벤치마크 (DB/네트워크 불필요)
+
+서로 다른 텍스트의 AssistantService.embed_query를 --concurrency개씩 동시에 호출하면서,
+묶기를 끈 경우와 켠 경우의 임베딩 API 요청 수와 요청별 지연(p50/p95)을 비교합니다.
+임베딩은 FakeEmbeddings(요청당 --latency-ms 지연, 배치 크기와 무관)를 사용합니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_embedding_batch.py --requests 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+from fakes import FakeChatModel, FakeEmbeddings
+
+from apps.services.assistant import AssistantService
+from settings import Settings
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    """API 요청 수를 세는 FakeEmbeddings"""
+
+    requests: int = 0
+
+    def __init__(self, latency_seconds: float = 0.0, dimensions: int = 3072, **kwargs: Any):
+        super().__init__(latency_seconds=latency_seconds, dimensions=dimensions, **kwargs)
+
+    async def aembed_query(self, text: str, **kwargs: Any) -> list[float]:
+        self.requests += 1
+        return await super().aembed_query(text, **kwargs)
+
+    async def aembed_documents(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        self.requests += 1
+        return await super().aembed_documents(texts, **kwargs)
+
+
+async def run(args: argparse.Namespace, batching: bool) -> tuple[int, list[float], float]:
+    """(API 요청 수, 요청별 지연(ms) 목록, 전체 시간(s))"""
+    config = Settings.assistant.model_copy(deep=True)
+    config.embedding_batch.enabled = batching
+    config.embedding_batch.max_batch_size = args.max_batch_size
+    config.embedding_batch.max_wait_seconds = args.max_wait_ms / 1000
+    config.guard.max_concurrency = args.concurrency
+    embeddings = CountingEmbeddings(latency_seconds=args.latency_ms / 1000, dimensions=args.dimensions)
+    # 저장소/Redis는 사용하지 않음 (single-flight는 프로세스 안에서만 동작)
+    service = AssistantService(
+        config,
+        memory_repository=MagicMock(),
+        reminder_repository=MagicMock(),
+        memory_calendar_service=MagicMock(),
+        redis_cache=MagicMock(),
+        llm=FakeChatModel(),
+        embeddings=embeddings,
+    )
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await service.embed_query(f"안경은 책상 서랍에 있음 {i}")
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    await service.embedding_batcher.close()
+    return embeddings.requests, latencies, elapsed
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, API latency {args.latency_ms:.0f}ms, "
+        f"max batch {args.max_batch_size}, max wait {args.max_wait_ms:.1f}ms\n"
+    )
+    print(f"{'mode':<10} {'API calls':>10} {'p50(ms)':>9} {'p95(ms)':>9} {'req/s':>9}")
+    for name, batching in (("single", False), ("batched", True)):
+        calls, latencies, elapsed = asyncio.run(run(args, batching))
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[18]
+        print(f"{name:<10} {calls:>10,} {p50:>9.1f} {p95:>9.1f} {args.requests / elapsed:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="단건 임베딩 요청 묶기 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="전체 임베딩 요청 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="임베딩 API 요청당 지연(ms)")
+    parser.add_argument("--max-batch-size", type=int, default=32, help="embedding_batch.max_batch_size")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="embedding_batch.max_wait_seconds(ms)")
+    parser.add_argument("--dimensions", type=int, default=768, help="fake 임베딩 차원 (벡터 생성 CPU 비용 조절)")
+    main(parser.parse_args())
@@ -0,0 +1,185 @@
+"""
+날짜별 Memory 조회 벤치마크 (debug 모드에서만 동작)
+
+대량의 가상 Memory를 만든 뒤 다음 쿼리를 비교합니다.
+
+- get_by_date: date(timezone(tz, created_at)) = :date  vs  created_at 범위 조건
+- calendar:    memory GROUP BY date(timezone(...))      vs  memory_hourly_count 월 범위 합산
+
+모든 데이터는 하나의 트랜잭션에서 만들고 마지막에 롤백하므로 DB에 남지 않습니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_memory_by_date.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import Select, desc, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from apps.models.memory import Memory
+from apps.models.memory_count import MemoryHourlyCount
+from apps.utils.datetime_utils import local_dates_to_utc_range
+from containers import Container
+from settings import Settings
+
+TIMEZONE = "Asia/Seoul"
+
+
+async def seed(session: AsyncSession, rows: int, users: int, days: int) -> int:
+    """가상 사용자와 Memory를 만들고, 측정 대상 사용자 ID를 반환합니다."""
+    result = await session.execute(
+        text(
+            """
+            INSERT INTO "user" (created_at, updated_at, email, nickname, social_provider, social_id)
+            SELECT now(), now(), 'bench' || g || '@example.com', 'bench_' || g, 'GOOGLE', 'bench_' || g
+            FROM generate_series(1, :users) AS g
+            RETURNING id
+            """
+        ),
+        {"users": users},
+    )
+    user_ids = [row[0] for row in result.all()]
+
+    # 사용자별로 고르게, 최근 days일에 걸쳐 분포
+    await session.execute(
+        text(
+            """
+            INSERT INTO memory (created_at, updated_at, type, keywords, content, original_text, user_id)
+            SELECT ts, ts, 'MEMO', 'bench', 'benchmark memory ' || g, 'benchmark memory ' || g,
+                   (CAST(:user_ids AS integer[]))[1 + g % cardinality(CAST(:user_ids AS integer[]))]
+            FROM (
+                SELECT g, now() - random() * make_interval(days => :days) AS ts
+                FROM generate_series(1, :rows) AS g
+            ) AS s
+            """
+        ),
+        {"rows": rows, "days": days, "user_ids": user_ids},
+    )
+    await session.execute(
+        text(
+            """
+            INSERT INTO memory_hourly_count (user_id, bucket, count)
+            SELECT user_id, date_trunc('hour', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', count(*)
+            FROM memory
+            WHERE user_id = ANY(CAST(:user_ids AS integer[]))
+            GROUP BY 1, 2
+            ON CONFLICT (user_id, bucket) DO UPDATE SET count = memory_hourly_count.count + excluded.count
+            """
+        ),
+        {"user_ids": user_ids},
+    )
+    await session.execute(text("ANALYZE memory"))
+    await session.execute(text("ANALYZE memory_hourly_count"))
+    return int(user_ids[0])
+
+
+def by_date_function(user_id: int, target_date: date) -> Select[Any]:
+    """기존 방식: 컬럼을 함수로 감싸 비교"""
+    local_date_expr = func.date(func.timezone(TIMEZONE, col(Memory.created_at)))
+    return (
+        select(Memory)
+        .where(local_date_expr == target_date, col(Memory.user_id) == user_id)
+        .order_by(desc(col(Memory.created_at)))
+        .limit(100)
+    )
+
+
+def by_date_range(user_id: int, target_date: date) -> Select[Any]:
+    """개선 방식: UTC 범위 조건 (MemoryRepository.get_by_date)"""
+    start, end = local_dates_to_utc_range(target_date, target_date + timedelta(days=1), TIMEZONE)
+    created_at = col(Memory.created_at)
+    return (
+        select(Memory)
+        .where(created_at >= start, created_at < end, col(Memory.user_id) == user_id)
+        .order_by(desc(created_at), desc(col(Memory.id)))
+        .limit(100)
+    )
+
+
+def calendar_group_by(user_id: int, _month: date) -> Select[Any]:
+    """기존 방식: 전체 Memory를 날짜별로 GROUP BY"""
+    local_date_expr = func.date(func.timezone(TIMEZONE, col(Memory.created_at)))
+    return (
+        select(local_date_expr, func.count(col(Memory.id)))
+        .where(col(Memory.user_id) == user_id)
+        .group_by(local_date_expr)
+    )
+
+
+def calendar_rollup(user_id: int, month: date) -> Select[Any]:
+    """개선 방식: 시간 버킷 집계의 한 달 범위 합산 (MemoryRepository.get_calendar_marks)"""
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    start, end = local_dates_to_utc_range(month, next_month, TIMEZONE)
+    bucket = col(MemoryHourlyCount.bucket)
+    local_date_expr = func.date(func.timezone(TIMEZONE, bucket))
+    return (
+        select(local_date_expr, func.sum(col(MemoryHourlyCount.count)))
+        .where(col(MemoryHourlyCount.user_id) == user_id, bucket >= start, bucket < end)
+        .group_by(local_date_expr)
+    )
+
+
+async def measure(session: AsyncSession, stmt: Select[Any], repeat: int) -> tuple[float, str]:
+    """중앙값 실행 시간(ms)과 실행 계획 첫 줄을 반환합니다."""
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})  # type: ignore[no-untyped-call]
+    plan = await session.execute(text(f"EXPLAIN {compiled}"))
+    plan_lines = [row[0].strip() for row in plan.all()]
+    scan = next((line for line in plan_lines if "Scan" in line), plan_lines[0])
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await session.execute(stmt)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), scan
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not Settings.debug:
+        print("Error: This script only works in debug mode.")
+        print("Set 'debug: true' in your config file.")
+        sys.exit(1)
+
+    container = Container()
+    container.config.from_dict(Settings.model_dump())
+    database = container.database()
+
+    async with database.session() as session:
+        print(f"Seeding {args.rows:,} memories for {args.users} users over {args.days} days...")
+        started = time.perf_counter()
+        user_id = await seed(session, args.rows, args.users, args.days)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s (user_id={user_id})\n")
+
+        target = date.today() - timedelta(days=args.days // 2)
+        cases = [
+            ("get_by_date / function", by_date_function),
+            ("get_by_date / range", by_date_range),
+            ("calendar / group by", calendar_group_by),
+            ("calendar / rollup month", calendar_rollup),
+        ]
+        print(f"{'case':<26} {'median(ms)':>10}  plan")
+        for name, build in cases:
+            month = target.replace(day=1) if name.startswith("calendar") else target
+            median, scan = await measure(session, build(user_id, month), args.repeat)
+            print(f"{name:<26} {median:>10.2f}  {scan}")
+
+        # 측정용 데이터는 남기지 않음
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="날짜별 Memory 조회 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="생성할 Memory 수")
+    parser.add_argument("--users", type=int, default=50, help="Memory를 나눠 가질 사용자 수")
+    parser.add_argument("--days", type=int, default=730, help="created_at 분포 기간(일)")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리별 반복 횟수")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,159 @@
+"""
+Memory 목록 조회 전송량/할당량 측정 (debug 모드에서만 동작)
+
+embedding(3072차원)이 채워진 Memory 한 페이지(기본 100행)를 다음 방식으로 읽어 비교합니다.
+
+- entity + embedding: 기존 동작 (undefer로 embedding까지 로딩)
+- entity (deferred):  Memory 엔티티, embedding 지연 로딩
+- summary:            MemoryRepository.get_all과 같은 컬럼 projection (MemorySummary)
+
+전송량은 선택한 컬럼의 pg_column_size 합계, 할당량은 tracemalloc 최대 사용량으로 측정합니다.
+모든 데이터는 하나의 트랜잭션에서 만들고 마지막에 롤백하므로 DB에 남지 않습니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_memory_list_payload.py --rows 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import desc, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+from sqlmodel import col
+
+from apps.models.memory import Memory
+from apps.repositories.memory import MemoryRepository
+from apps.types.memory import MemorySummary
+from containers import Container
+from settings import Settings
+
+
+async def seed(session: AsyncSession, rows: int) -> int:
+    """임베딩이 채워진 Memory를 만들고 사용자 ID를 반환합니다."""
+    result = await session.execute(
+        text(
+            """
+            INSERT INTO "user" (created_at, updated_at, email, nickname, social_provider, social_id)
+            VALUES (now(), now(), 'bench-payload@example.com', 'bench_payload', 'GOOGLE', 'bench_payload')
+            RETURNING id
+            """
+        )
+    )
+    user_id: int = result.scalar_one()
+
+    await session.execute(
+        text(
+            """
+            INSERT INTO memory (created_at, updated_at, type, keywords, content, metadata, original_text,
+                                embedding, user_id)
+            SELECT now() - make_interval(mins => g), now(), 'ITEM', '안경, 서랍',
+                   '안경은 책상 두 번째 서랍에 있음 ' || g, '{"location": "서랍"}'::jsonb,
+                   '안경 서랍에 뒀어 ' || g,
+                   (SELECT array_agg(random())::vector FROM generate_series(1, 3072) WHERE g > 0),
+                   :user_id
+            FROM generate_series(1, :rows) AS g
+            """
+        ),
+        {"rows": rows, "user_id": user_id},
+    )
+    return user_id
+
+
+async def measure(
+    session: AsyncSession,
+    fetch: Callable[[], Awaitable[list[Any]]],
+    repeat: int,
+) -> tuple[float, int, int]:
+    """(중앙값 시간 ms, tracemalloc 최대 할당 bytes, 행 수)를 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fetch()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    # identity map에 남은 엔티티를 비워 매번 새로 만드는 비용까지 측정
+    session.expunge_all()
+    tracemalloc.start()
+    items = await fetch()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, len(items)
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not Settings.debug:
+        print("Error: This script only works in debug mode.")
+        print("Set 'debug: true' in your config file.")
+        sys.exit(1)
+
+    container = Container()
+    container.config.from_dict(Settings.model_dump())
+    database = container.database()
+
+    async with database.session() as session:
+        user_id = await seed(session, args.rows)
+        order = (desc(col(Memory.created_at)), desc(col(Memory.id)))
+
+        async def entity_with_embedding() -> list[Any]:
+            stmt = select(Memory).options(undefer(MemoryRepository.EMBEDDING)).where(col(Memory.user_id) == user_id)
+            result = await session.execute(
+                stmt.order_by(*order).limit(args.rows).execution_options(populate_existing=True)
+            )
+            return list(result.scalars().all())
+
+        async def entity_deferred() -> list[Any]:
+            stmt = select(Memory).where(col(Memory.user_id) == user_id)
+            result = await session.execute(
+                stmt.order_by(*order).limit(args.rows).execution_options(populate_existing=True)
+            )
+            return list(result.scalars().all())
+
+        async def summary() -> list[Any]:
+            stmt = select(*MemoryRepository.SUMMARY_COLUMNS).where(col(Memory.user_id) == user_id)
+            result = await session.execute(stmt.order_by(*order).limit(args.rows))
+            return [MemorySummary(*row) for row in result.tuples()]
+
+        # 컬럼별 저장 크기 합계 (전송량 근사치)
+        full_bytes = await session.scalar(
+            select(func.sum(func.pg_column_size(text("memory.*")))).where(col(Memory.user_id) == user_id)
+        )
+        embedding_bytes = await session.scalar(
+            select(func.sum(func.pg_column_size(col(Memory.embedding)))).where(col(Memory.user_id) == user_id)
+        )
+        summary_bytes = await session.scalar(
+            select(
+                func.sum(sum((func.pg_column_size(column) for column in MemoryRepository.SUMMARY_COLUMNS), start=0))
+            ).where(col(Memory.user_id) == user_id)
+        )
+        bytes_by_case = {
+            "entity + embedding": int(full_bytes or 0),
+            "entity (deferred)": int(full_bytes or 0) - int(embedding_bytes or 0),
+            "summary": int(summary_bytes or 0),
+        }
+
+        cases: list[tuple[str, Callable[[], Awaitable[list[Any]]]]] = [
+            ("entity + embedding", entity_with_embedding),
+            ("entity (deferred)", entity_deferred),
+            ("summary", summary),
+        ]
+        print(f"{'case':<20} {'rows':>5} {'median(ms)':>11} {'row bytes':>12} {'peak alloc':>12}")
+        for name, fetch in cases:
+            median, peak, count = await measure(session, fetch, args.repeat)
+            print(f"{name:<20} {count:>5} {median:>11.2f} {bytes_by_case[name]:>12,} {peak:>12,}")
+
+        # 측정용 데이터는 남기지 않음
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory 목록 조회 전송량/할당량 측정")
+    parser.add_argument("--rows", type=int, default=100, help="페이지 크기 (생성할 Memory 수)")
+    parser.add_argument("--repeat", type=int, default=20, help="방식별 반복 횟수")
+    asyncio.run(main(parser.parse_args()))
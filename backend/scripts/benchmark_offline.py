@@ -0,0 +1,458 @@
+"""
+오프라인 벤치마크 (debug 모드에서만 동작)
+
+Gemini(LLM/임베딩), Speech-to-Text, FCM을 scripts/fakes.py의 fake로 바꾼 뒤,
+실제 서비스 코드 경로의 처리량과 지연 시간(p50/p95/p99)을 측정합니다.
+외부 API 비용이나 네트워크 변동 없이 같은 조건으로 반복 측정할 수 있습니다 (PostgreSQL은 필요).
+
+- assistant: AssistantService.process (의도 분류 → 파싱/임베딩 → 저장, 또는 임베딩 → 벡터 검색 → 답변)
+- search:    MemoryRepository.search_by_vector (--sizes 별 Memory 수)
+- reminder:  리마인더 Celery 태스크의 발송 루프 (_process_due_reminders)
+- voice:     VoiceStreamConsumer (WebSocket 오디오 수신 → STT 스트리밍 → VoiceSession 저장)
+
+각 작업은 요청 단위 세션(request_scope) 안에서 실행하고 커밋하지 않으므로 데이터가 남지 않습니다.
+동시 실행 작업이 함께 쓰는 측정용 사용자 한 명만 커밋했다가 마지막에 삭제합니다.
+fake 지연 시간은 --*-latency-ms로 조정하며, 0으로 두면 서버 자체 오버헤드만 측정합니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_offline.py --cases assistant,voice
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_offline.py --output benchmarks.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import struct
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import cycle
+from typing import Any, cast
+
+from fakes import FakeChatModel, FakeEmbeddings, FakePushService, FakeSpeechClient
+from fastapi import WebSocket
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apps.consumers.voice_stream_consumer import VoiceStreamConsumer
+from apps.tasks.reminder import _process_due_reminders
+from containers import Container
+from database import Database, read_routing
+from settings import Settings
+
+CASES = ("assistant", "search", "reminder", "voice")
+
+ASSISTANT_TEXTS = (
+    "열쇠는 현관 서랍 두 번째 칸에 있어",
+    "열쇠 어디에 뒀지?",
+    "내일 아침 아홉시에 치과 예약 있다고 알려줘",
+    "치과 예약 언제야?",
+    "김민수 과장 전화번호는 010-1234-5678이야",
+    "김민수 과장 번호 뭐였지?",
+    "자생한방병원은 서대문역 6번 출구로 나가면 돼",
+)
+
+SAMPLE_RATE = 16000
+CHUNK_SAMPLES = SAMPLE_RATE // 10  # 100ms 단위로 전송
+
+
+@dataclass
+class CaseResult:
+    """측정 결과 (latencies_ms는 작업 하나당 지연 시간)"""
+
+    name: str
+    elapsed_seconds: float
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def ops(self) -> int:
+        return len(self.latencies_ms)
+
+    def summary(self) -> dict[str, Any]:
+        latencies = self.latencies_ms
+        if len(latencies) >= 2:
+            quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p95, p99 = quantiles[49], quantiles[94], quantiles[98]
+        else:
+            p50 = p95 = p99 = latencies[0] if latencies else 0.0
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "throughput": round(self.ops / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0,
+            "p50_ms": round(p50, 2),
+            "p95_ms": round(p95, 2),
+            "p99_ms": round(p99, 2),
+        }
+
+
+async def run_concurrently(
+    name: str, total: int, concurrency: int, operation: Callable[[int], Awaitable[None]]
+) -> CaseResult:
+    """operation(i)를 total번, 최대 concurrency개씩 동시에 실행하며 작업별 지연 시간을 잽니다."""
+    result = CaseResult(name=name, elapsed_seconds=0.0)
+    indexes = iter(range(total))
+
+    async def worker() -> None:
+        for i in indexes:
+            started = time.perf_counter()
+            await operation(i)
+            result.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    result.elapsed_seconds = time.perf_counter() - started
+    return result
+
+
+# ============================================================
+# 측정용 데이터
+# ============================================================
+
+
+async def create_bench_user(database: Database) -> int:
+    """동시 실행 작업이 함께 쓰는 측정용 사용자를 만들고 커밋합니다 (delete_bench_user로 삭제)."""
+    async with database.session() as session:
+        result = await session.execute(
+            text(
+                """
+                INSERT INTO "user" (created_at, updated_at, email, nickname, social_provider, social_id)
+                VALUES (now(), now(), 'bench_offline@example.com', 'bench_offline', 'GOOGLE', 'bench_offline')
+                ON CONFLICT (email) DO UPDATE SET updated_at = now()
+                RETURNING id
+                """
+            )
+        )
+        return int(result.scalar_one())
+
+
+async def delete_bench_user(database: Database, user_id: int) -> None:
+    async with database.session() as session:
+        await session.execute(text('DELETE FROM "user" WHERE id = :user_id'), {"user_id": user_id})
+
+
+async def seed_users(session: AsyncSession, users: int, devices_per_user: int) -> list[int]:
+    """가상 사용자와 기기 토큰을 만들고 사용자 ID 목록을 반환합니다."""
+    result = await session.execute(
+        text(
+            """
+            INSERT INTO "user" (created_at, updated_at, email, nickname, social_provider, social_id)
+            SELECT now(), now(), 'bench' || g || '@example.com', 'bench_' || g, 'GOOGLE', 'bench_' || g
+            FROM generate_series(1, :users) AS g
+            RETURNING id
+            """
+        ),
+        {"users": users},
+    )
+    user_ids = [int(row[0]) for row in result.all()]
+    await session.execute(
+        text(
+            """
+            INSERT INTO device_token (created_at, updated_at, user_id, token, platform, is_active)
+            SELECT now(), now(), u.id, 'bench-token-' || u.id || '-' || d, 'android', true
+            FROM unnest(CAST(:user_ids AS integer[])) AS u(id), generate_series(1, :devices) AS d
+            """
+        ),
+        {"user_ids": user_ids, "devices": devices_per_user},
+    )
+    return user_ids
+
+
+async def seed_memories_with_embedding(session: AsyncSession, user_id: int, rows: int, dimensions: int) -> None:
+    """임의의 양수 임베딩을 가진 Memory를 만듭니다 (FakeEmbeddings와 같은 분포)."""
+    await session.execute(
+        text(
+            """
+            INSERT INTO memory (created_at, updated_at, type, keywords, content, original_text, user_id, embedding)
+            SELECT now(), now(), 'MEMO', 'bench', 'benchmark memory ' || g, 'benchmark memory ' || g, :user_id,
+                   CAST(ARRAY(SELECT random() FROM generate_series(1, :dimensions) WHERE g IS NOT NULL) AS vector)
+            FROM generate_series(1, :rows) AS g
+            """
+        ),
+        {"user_id": user_id, "rows": rows, "dimensions": dimensions},
+    )
+    await session.execute(text("ANALYZE memory"))
+
+
+async def seed_due_reminders(session: AsyncSession, user_ids: list[int], reminders: int) -> None:
+    """사용자들에게 고르게 나눠, 실행 시각이 지난 매일 리마인더를 만듭니다."""
+    await session.execute(
+        text(
+            """
+            WITH memories AS (
+                INSERT INTO memory (created_at, updated_at, type, keywords, content, original_text, user_id)
+                SELECT now(), now(), 'SCHEDULE', 'bench', 'benchmark reminder ' || g, 'benchmark reminder ' || g,
+                       (CAST(:user_ids AS integer[]))[1 + g % cardinality(CAST(:user_ids AS integer[]))]
+                FROM generate_series(1, :reminders) AS g
+                RETURNING id, user_id
+            )
+            INSERT INTO reminder (created_at, updated_at, memory_id, frequency, weekdays, time, next_run_at, status,
+                                  user_id)
+            SELECT now(), now(), id, 'DAILY', '{}', '09:00', now() - interval '1 minute', 'ACTIVE', user_id
+            FROM memories
+            """
+        ),
+        {"user_ids": user_ids, "reminders": reminders},
+    )
+
+
+# ============================================================
+# 측정 케이스
+# ============================================================
+
+
+async def bench_assistant(container: Container, user_id: int, args: argparse.Namespace) -> list[CaseResult]:
+    database = container.database()
+    assistant_service = container.assistant_service()
+    texts = cycle(ASSISTANT_TEXTS)
+
+    async def process(_i: int) -> None:
+        async with database.request_scope():
+            await assistant_service.process(text=next(texts), user_id=user_id)
+
+    result = await run_concurrently("assistant / process", args.requests, args.concurrency, process)
+    return [result]
+
+
+async def bench_search(container: Container, user_id: int, args: argparse.Namespace) -> list[CaseResult]:
+    database = container.database()
+    memory_repository = container.memory_repository()
+    embeddings = cast(FakeEmbeddings, container.embeddings())
+    assistant_config = container.assistant_service().config
+    results = []
+
+    async with database.request_scope() as scope:
+        session = scope.get_session()
+        seeded = 0
+        for size in sorted(args.sizes):
+            print(f"  seeding memories: {seeded:,} → {size:,}")
+            await seed_memories_with_embedding(session, user_id, size - seeded, embeddings.dimensions)
+            seeded = size
+
+            async def search(i: int) -> None:
+                await memory_repository.search_by_vector(
+                    embedding=embeddings.vector(f"query {i}"),
+                    user_id=user_id,
+                    limit=assistant_config.vector_search_limit,
+                    threshold=assistant_config.vector_search_threshold,
+                )
+
+            # 한 세션(연결)에서 순서대로 실행
+            results.append(await run_concurrently(f"search / {size:,} rows", args.searches, 1, search))
+    return results
+
+
+async def bench_reminder(container: Container, args: argparse.Namespace) -> list[CaseResult]:
+    database = container.database()
+    push_service = FakePushService(latency_seconds=args.push_latency_ms / 1000)
+
+    async with database.request_scope() as scope:
+        user_ids = await seed_users(scope.get_session(), args.reminder_users, args.devices_per_user)
+        await seed_due_reminders(scope.get_session(), user_ids, args.reminders)
+
+        # 태스크 한 번에 최대 100건(get_due_reminders 기본값)을 처리하므로 모두 발송될 때까지 반복
+        started = time.perf_counter()
+        for _ in range(math.ceil(args.reminders / 100)):
+            await _process_due_reminders(database, push_service)
+        elapsed = time.perf_counter() - started
+
+    # 리마인더당 지연: 직전 발송(첫 건은 시작 시각)부터 이번 발송까지
+    sent_at = [started, *push_service.sent_at]
+    latencies = [(current - previous) * 1000 for previous, current in zip(sent_at, sent_at[1:], strict=False)]
+    return [CaseResult(name="reminder / fan-out", elapsed_seconds=elapsed, latencies_ms=latencies)]
+
+
+class FakeWebSocket:
+    """오디오 청크를 보낸 뒤 stop 메시지를 보내는 WebSocket 클라이언트 fake"""
+
+    def __init__(self, chunks: int, interval_seconds: float):
+        self.chunks = chunks
+        self.interval_seconds = interval_seconds
+        self.started_at = time.perf_counter()
+        self.first_result_at: float | None = None
+        self.session_created_at: float | None = None
+        self._sent = 0
+        self._stopped = False
+        self._chunk = audio_chunk()
+
+    async def receive(self) -> dict[str, Any]:
+        if self._stopped:
+            # Consumer는 stop 이후 더 읽지 않음 - 읽는다면 연결 종료로 응답
+            return {"type": "websocket.disconnect", "code": 1000}
+        await asyncio.sleep(self.interval_seconds)
+        if self._sent < self.chunks:
+            self._sent += 1
+            return {"type": "websocket.receive", "bytes": self._chunk}
+        self._stopped = True
+        return {"type": "websocket.receive", "text": json.dumps({"type": "stop"})}
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if "text" in data and self.first_result_at is None:
+            self.first_result_at = now
+        if data.get("type") == "session_created":
+            self.session_created_at = now
+
+    async def close(self) -> None:
+        return None
+
+
+def audio_chunk() -> bytes:
+    """무음 판정을 넘는 440Hz 사인파 (LINEAR16, 100ms)"""
+    samples = (int(3000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(CHUNK_SAMPLES))
+    return struct.pack(f"<{CHUNK_SAMPLES}h", *samples)
+
+
+async def bench_voice(container: Container, user_id: int, args: argparse.Namespace) -> list[CaseResult]:
+    database = container.database()
+    streaming_voice_service = container.streaming_voice_service()
+    first_result = CaseResult(name="voice / first result", elapsed_seconds=0.0)
+    session_ids = []
+
+    async def stream(_i: int) -> None:
+        websocket = FakeWebSocket(args.voice_chunks, args.voice_chunk_interval_ms / 1000)
+        async with database.request_scope():
+            consumer = VoiceStreamConsumer(
+                websocket=cast(WebSocket, websocket),
+                streaming_voice_service=streaming_voice_service,
+                voice_session_service=container.voice_session_service(),
+                user_id=user_id,
+                language=None,
+                sample_rate=SAMPLE_RATE,
+            )
+            session_ids.append(consumer.session_id)
+            await consumer.handle()
+        if websocket.session_created_at is None:
+            raise RuntimeError(f"Voice session was not created: session_id={consumer.session_id}")
+        if websocket.first_result_at is not None:
+            first_result.latencies_ms.append((websocket.first_result_at - websocket.started_at) * 1000)
+
+    try:
+        session = await run_concurrently("voice / session", args.voice_sessions, args.concurrency, stream)
+    finally:
+        # Consumer가 저장한 녹음 파일 삭제 (파일명: {timestamp}_{session_id}_{language}.wav)
+        recordings_dir = Settings.root_dir / "recordings"
+        for session_id in session_ids:
+            for path in recordings_dir.glob(f"*_{session_id}_*.wav"):
+                path.unlink()
+
+    first_result.elapsed_seconds = session.elapsed_seconds
+    return [first_result, session]
+
+
+# ============================================================
+# 실행
+# ============================================================
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: list[CaseResult]) -> None:
+    print(f"\n{'case':<26} {'ops':>6} {'ops/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+    for result in results:
+        s = result.summary()
+        print(
+            f"{s['name']:<26} {s['ops']:>6} {s['throughput']:>9.2f} "
+            f"{s['p50_ms']:>9.2f} {s['p95_ms']:>9.2f} {s['p99_ms']:>9.2f}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not Settings.debug:
+        print("Error: This script only works in debug mode.")
+        print("Set 'debug: true' in your config file.")
+        sys.exit(1)
+
+    container = Container()
+    container.config.from_dict(Settings.model_dump())
+    container.llm.override(FakeChatModel(latency_seconds=args.llm_latency_ms / 1000))
+    container.embeddings.override(FakeEmbeddings(latency_seconds=args.embedding_latency_ms / 1000))
+    container.speech_client.override(
+        FakeSpeechClient(
+            first_result_seconds=args.stt_first_result_ms / 1000,
+            result_seconds=args.stt_result_ms / 1000,
+        )
+    )
+    database = container.database()
+
+    results: list[CaseResult] = []
+    # 방금 만든 (커밋하지 않은) 데이터를 읽어야 하므로 복제본으로 보내지 않음
+    with read_routing(primary=True):
+        user_id = await create_bench_user(database)
+        try:
+            if "assistant" in args.cases:
+                print(f"assistant: {args.requests} requests, concurrency {args.concurrency}")
+                results += await bench_assistant(container, user_id, args)
+            if "search" in args.cases:
+                print(f"search: {args.searches} searches per size")
+                results += await bench_search(container, user_id, args)
+            if "reminder" in args.cases:
+                print(f"reminder: {args.reminders} reminders, {args.devices_per_user} devices per user")
+                results += await bench_reminder(container, args)
+            if "voice" in args.cases:
+                print(f"voice: {args.voice_sessions} sessions x {args.voice_chunks} chunks")
+                results += await bench_voice(container, user_id, args)
+        finally:
+            await delete_bench_user(database, user_id)
+            await database.dispose()
+
+    print_results(results)
+
+    if args.output:
+        # 실행마다 한 줄씩 추가해서 커밋별 추이를 비교
+        record = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": git_commit(),
+            "args": {key: value for key, value in vars(args).items() if key != "output"},
+            "results": [result.summary() for result in results],
+        }
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"\nResults appended to {args.output}")
+
+
+def comma_list(value: str) -> list[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = set(items) - set(CASES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown cases: {', '.join(sorted(unknown))}")
+    return items
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="외부 API를 fake로 바꾼 오프라인 벤치마크")
+    parser.add_argument("--cases", type=comma_list, default=list(CASES), help=f"실행할 케이스 ({','.join(CASES)})")
+    parser.add_argument("--concurrency", type=int, default=20, help="assistant/voice 동시 실행 수")
+    parser.add_argument("--requests", type=int, default=200, help="assistant 요청 수")
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[1_000, 10_000],
+        help="search 측정 시 Memory 수 (쉼표로 구분)",
+    )
+    parser.add_argument("--searches", type=int, default=100, help="Memory 수별 검색 횟수")
+    parser.add_argument("--reminders", type=int, default=300, help="발송할 리마인더 수")
+    parser.add_argument("--reminder-users", type=int, default=50, help="리마인더를 나눠 가질 사용자 수")
+    parser.add_argument("--devices-per-user", type=int, default=2, help="사용자별 기기 토큰 수")
+    parser.add_argument("--voice-sessions", type=int, default=50, help="voice 세션 수")
+    parser.add_argument("--voice-chunks", type=int, default=50, help="세션별 오디오 청크 수 (100ms 단위)")
+    parser.add_argument("--voice-chunk-interval-ms", type=float, default=0, help="오디오 청크 전송 간격")
+    parser.add_argument("--llm-latency-ms", type=float, default=800, help="LLM 호출 지연")
+    parser.add_argument("--embedding-latency-ms", type=float, default=150, help="임베딩 호출 지연")
+    parser.add_argument("--stt-first-result-ms", type=float, default=300, help="STT 첫 결과 지연")
+    parser.add_argument("--stt-result-ms", type=float, default=100, help="STT 이후 결과 지연")
+    parser.add_argument("--push-latency-ms", type=float, default=50, help="FCM 전송 지연")
+    parser.add_argument("--output", help="결과를 JSON Lines로 추가할 파일 경로")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,189 @@
+"""
+목록 응답 직렬화 벤치마크 (DB 불필요)
+
+Memory/Reminder 한 페이지(기본 100개)를 응답 bytes로 만드는 시간을 기존 방식과 비교합니다.
+
+- legacy: 시간대 변환용 재귀 순회(TimezoneConverter) 또는 필드별 isoformat으로 dict를 만들고,
+          Response 모델 model_dump(mode="json") → JSONResponse(json.dumps)로 다시 인코딩
+- model:  ResponseProvider(ModelJSONResponse) - 모델을 to_json 한 번으로 직렬화,
+          시간대 변환은 LocalDatetime 필드 serializer가 context로 처리
+
+두 방식의 응답 JSON이 같은지 먼저 확인한 뒤 측정합니다. LocalDatetime은 isoformat()(UTC는 "+00:00")으로 쓰는데,
+기존 reminders 경로는 pydantic 기본 형식(UTC는 "Z")이었으므로 datetime 문자열은 같은 시각·오프셋인지로 비교합니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/benchmark_serialization.py --items 100
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from apps.schemas.common import CursorResponse, ResponseProvider
+from apps.schemas.memory import MemoryResponse
+from apps.schemas.reminder import ReminderWithMemoryResponse
+from apps.types.assistant import MemoryType, ReminderFrequency, Weekday
+from apps.types.memory import MemorySummary
+from apps.types.reminder import ReminderStatus
+
+
+def make_memories(count: int) -> list[MemorySummary]:
+    """MemoryRepository.get_all 결과와 같은 형태의 Memory 목록"""
+    now = datetime(2026, 2, 24, 6, 30, tzinfo=UTC)
+    return [
+        MemorySummary(
+            id=i,
+            type=MemoryType.ITEM,
+            keywords="안경, 서랍, 책상",
+            content=f"안경은 책상 두 번째 서랍에 있음 {i}",
+            metadata_={"location": "책상 두 번째 서랍", "quantity": 1},
+            original_text=f"안경 책상 두 번째 서랍에 뒀어 {i}",
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def make_reminder_fields(count: int) -> list[dict[str, Any]]:
+    """ReminderWithMemoryResponse 생성 인자 (컨트롤러가 Reminder 엔티티에서 만드는 값)"""
+    now = datetime(2026, 2, 24, 6, 30, tzinfo=UTC)
+    return [
+        {
+            "id": i,
+            "memory_id": i,
+            "memory_content": f"매주 월요일 회의 자료 준비 {i}",
+            "memory_keywords": "회의, 자료",
+            "memory_type": MemoryType.SCHEDULE,
+            "frequency": ReminderFrequency.WEEKLY,
+            "weekdays": [Weekday.MONDAY, Weekday.THURSDAY],
+            "day_of_month": None,
+            "specific_date": date(2026, 3, 2),
+            "time": time(9, 0),
+            "next_run_at": now + timedelta(hours=i),
+            "status": ReminderStatus.ACTIVE,
+            "created_at": now - timedelta(days=i),
+            "updated_at": now - timedelta(days=i),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def legacy_timezone_dump(model: BaseModel, timezone: str) -> dict[str, Any]:
+    """기존 TimezoneConverter.model_dump (dict/list를 재귀 순회하며 datetime 변환)"""
+    tz = ZoneInfo(timezone)
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.astimezone(tz)
+        if isinstance(value, dict):
+            return {k: convert(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [convert(item) for item in value]
+        return value
+
+    result: dict[str, Any] = convert(model.model_dump())
+    return result
+
+
+def legacy_paginated(result: list[Any], next_cursor: str | None) -> JSONResponse:
+    """기존 ResponseProvider.paginated (모델 dump 후 json.dumps로 다시 인코딩)"""
+    response = CursorResponse(code=200, message="SUCCESS", result=result, next_cursor=next_cursor)
+    return JSONResponse(status_code=200, content=response.model_dump(mode="json"))
+
+
+def build_cases(items: int, timezone: str) -> dict[str, tuple[Callable[[], bytes], Callable[[], bytes]]]:
+    """페이지별 (legacy, model) 응답 생성 함수"""
+    memories = make_memories(items)
+    reminder_fields = make_reminder_fields(items)
+
+    def memories_legacy() -> bytes:
+        tz = ZoneInfo(timezone)
+        data = [
+            {
+                "id": m.id,
+                "type": m.type,
+                "keywords": m.keywords,
+                "content": m.content,
+                "metadata_": m.metadata_,
+                "original_text": m.original_text,
+                "created_at": m.created_at.astimezone(tz).isoformat(),
+                "updated_at": m.updated_at.astimezone(tz).isoformat(),
+            }
+            for m in memories
+        ]
+        return bytes(legacy_paginated(data, "cursor").body)
+
+    def memories_model() -> bytes:
+        data = [MemoryResponse.model_validate(m) for m in memories]
+        return bytes(ResponseProvider.paginated(data, "cursor", timezone=timezone).body)
+
+    def reminders_legacy() -> bytes:
+        data = [legacy_timezone_dump(ReminderWithMemoryResponse(**fields), timezone) for fields in reminder_fields]
+        return bytes(legacy_paginated(data, "cursor").body)
+
+    def reminders_model() -> bytes:
+        data = [ReminderWithMemoryResponse(**fields) for fields in reminder_fields]
+        return bytes(ResponseProvider.paginated(data, "cursor", timezone=timezone).body)
+
+    return {
+        "memories": (memories_legacy, memories_model),
+        "reminders": (reminders_legacy, reminders_model),
+    }
+
+
+def normalize_datetimes(value: Any) -> Any:
+    """JSON 값의 datetime 문자열을 datetime으로 바꿉니다 ("Z"와 "+00:00"을 같은 값으로 비교)."""
+    if isinstance(value, str) and "T" in value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if isinstance(value, dict):
+        return {k: normalize_datetimes(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize_datetimes(item) for item in value]
+    return value
+
+
+def measure(func: Callable[[], bytes], number: int, repeat: int) -> float:
+    """호출 한 번의 중앙값 시간 (µs)"""
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return statistics.median(timings) / number * 1_000_000
+
+
+def main(args: argparse.Namespace) -> None:
+    cases = build_cases(args.items, args.timezone)
+
+    mismatched = False
+    for name, (legacy, model) in cases.items():
+        if normalize_datetimes(json.loads(legacy())) != normalize_datetimes(json.loads(model())):
+            print(f"Error: {name} responses differ between legacy and model serialization")
+            mismatched = True
+    if mismatched:
+        sys.exit(1)
+
+    print(f"{args.items} items per page, timezone {args.timezone}\n")
+    print(f"{'page':<10} {'legacy(µs)':>11} {'model(µs)':>10} {'speedup':>8} {'bytes':>8}")
+    for name, (legacy, model) in cases.items():
+        legacy_us = measure(legacy, args.number, args.repeat)
+        model_us = measure(model, args.number, args.repeat)
+        print(f"{name:<10} {legacy_us:>11.1f} {model_us:>10.1f} {legacy_us / model_us:>7.2f}x {len(model()):>8,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=100, help="페이지당 항목 수")
+    parser.add_argument("--timezone", default="Asia/Seoul", help="응답 시간대 (X-Timezone)")
+    parser.add_argument("--number", type=int, default=200, help="측정 한 번당 호출 횟수")
+    parser.add_argument("--repeat", type=int, default=7, help="측정 반복 횟수 (중앙값 사용)")
+    main(parser.parse_args())
@@ -0,0 +1,248 @@
+"""
+오프라인 벤치마크용 외부 API fake (Gemini LLM/임베딩, Speech-to-Text, FCM)
+
+실제 클라이언트 클래스를 상속하고 네트워크 호출 부분만 바꿔서, 서비스 코드는 그대로 둔 채
+Container provider override로 주입합니다. 응답은 입력에서 결정적으로 만들고, 지연 시간은
+생성자 인자로 지정합니다 (asyncio.sleep이므로 CPU를 쓰지 않음).
+
+사용 예:
+    container.llm.override(FakeChatModel(latency_seconds=0.8))
+    container.embeddings.override(FakeEmbeddings(latency_seconds=0.15))
+    container.speech_client.override(FakeSpeechClient(first_result_seconds=0.3))
+"""
+
+import asyncio
+import hashlib
+import random
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from typing import Any
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.speech_v2 import SpeechAsyncClient
+from google.cloud.speech_v2.types import cloud_speech
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from pydantic import BaseModel, SecretStr
+
+from apps.services.push import PushService
+from apps.types.assistant import (
+    IntentClassification,
+    IntentType,
+    MemoryType,
+    ParsedMemory,
+    ReminderFrequency,
+    ReminderInfo,
+)
+
+# 질문으로 분류할 표현 (나머지는 저장으로 분류)
+QUESTION_MARKERS = ("?", "어디", "언제", "뭐", "무엇", "누구", "알아?")
+REMINDER_MARKERS = ("알려줘", "리마인드")
+
+
+def _last_human_text(messages: Sequence[BaseMessage]) -> str:
+    """마지막 사용자 메시지의 입력 텍스트 (여러 part면 마지막 part - 앞 part는 현재 시각 등 context)"""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            if isinstance(message.content, list):
+                return str(message.content_blocks[-1].get("text", ""))
+            return message.text
+    return ""
+
+
+class FakeChatModel(ChatGoogleGenerativeAI):
+    """
+    Gemini 채팅 모델 fake
+
+    - with_structured_output(IntentClassification): 질문 표현이 있으면 query, 없으면 save
+    - with_structured_output(ParsedMemory): 입력 문장을 그대로 memo로 정리 (알림 표현이 있으면 매일 알림)
+    - ainvoke: 고정된 답변
+    """
+
+    latency_seconds: float = 0.0
+
+    def __init__(self, latency_seconds: float = 0.0, **kwargs: Any):
+        super().__init__(model="fake-chat", google_api_key=SecretStr("fake"), **kwargs)
+        self.latency_seconds = latency_seconds
+
+    def with_structured_output(
+        self, schema: dict[str, Any] | type[BaseModel], *args: Any, **kwargs: Any
+    ) -> Runnable[LanguageModelInput, dict[str, Any] | BaseModel]:
+        async def respond(messages: Any) -> BaseModel:
+            await asyncio.sleep(self.latency_seconds)
+            return self._structured_response(schema, _last_human_text(messages))
+
+        return RunnableLambda(respond)
+
+    @staticmethod
+    def _structured_response(schema: dict[str, Any] | type[BaseModel], text: str) -> BaseModel:
+        if schema is IntentClassification:
+            is_query = any(marker in text for marker in QUESTION_MARKERS)
+            return IntentClassification(
+                intent=IntentType.QUERY if is_query else IntentType.SAVE,
+                reason="fake",
+            )
+        if schema is ParsedMemory:
+            needs_reminder = any(marker in text for marker in REMINDER_MARKERS)
+            return ParsedMemory(
+                type=MemoryType.MEMO,
+                keywords=", ".join(text.split()[:3]),
+                content=text,
+                reminder=ReminderInfo(frequency=ReminderFrequency.DAILY) if needs_reminder else None,
+            )
+        raise NotImplementedError(f"FakeChatModel does not support schema {schema!r}")
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency_seconds)
+        return self._answer(messages)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency_seconds)
+        return self._answer(messages)
+
+    @staticmethod
+    def _answer(messages: list[BaseMessage]) -> ChatResult:
+        content = f"검색된 정보를 바탕으로 답변드립니다. ({len(_last_human_text(messages))}자 질문)"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+class FakeEmbeddings(GoogleGenerativeAIEmbeddings):
+    """
+    Gemini 임베딩 fake
+
+    같은 문장에는 항상 같은 벡터를 반환합니다 (문장 해시를 시드로 사용).
+    모든 성분을 양수로 만들어 서로 다른 문장도 코사인 유사도가 threshold를 넘도록 해서,
+    벡터 검색이 항상 결과를 돌려주는 (답변 생성까지 가는) 경로를 측정합니다.
+    """
+
+    latency_seconds: float = 0.0
+    dimensions: int = 3072
+
+    def __init__(self, latency_seconds: float = 0.0, dimensions: int = 3072, **kwargs: Any):
+        super().__init__(model="models/fake-embedding", api_key=SecretStr("fake"), **kwargs)
+        self.latency_seconds = latency_seconds
+        self.dimensions = dimensions
+
+    def vector(self, text: str) -> list[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+        rng = random.Random(seed)
+        return [rng.random() for _ in range(self.dimensions)]
+
+    def embed_query(self, text: str, **kwargs: Any) -> list[float]:
+        time.sleep(self.latency_seconds)
+        return self.vector(text)
+
+    def embed_documents(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        time.sleep(self.latency_seconds)
+        return [self.vector(text) for text in texts]
+
+    async def aembed_query(self, text: str, **kwargs: Any) -> list[float]:
+        await asyncio.sleep(self.latency_seconds)
+        return self.vector(text)
+
+    async def aembed_documents(self, texts: list[str], **kwargs: Any) -> list[list[float]]:
+        # 배치 요청 한 번으로 처리되므로 지연은 배치 크기와 무관하게 한 번만 적용
+        await asyncio.sleep(self.latency_seconds)
+        return [self.vector(text) for text in texts]
+
+
+class FakeSpeechClient(SpeechAsyncClient):
+    """
+    Speech-to-Text v2 스트리밍 fake
+
+    오디오 요청을 모두 소비하면서 interim_every개 청크마다 중간 결과를, 스트림이 끝나면
+    최종 결과를 돌려줍니다. 첫 결과는 first_result_seconds, 이후 결과는 result_seconds만큼 지연됩니다.
+    """
+
+    def __init__(
+        self,
+        first_result_seconds: float = 0.0,
+        result_seconds: float = 0.0,
+        interim_every: int = 5,
+        transcript: str = "내일 아침 아홉시에 회의 있다고 알려줘",
+    ):
+        super().__init__(credentials=AnonymousCredentials())  # type: ignore[no-untyped-call]
+        self.first_result_seconds = first_result_seconds
+        self.result_seconds = result_seconds
+        self.interim_every = interim_every
+        self.transcript = transcript
+
+    async def streaming_recognize(
+        self,
+        requests: AsyncIterator[cloud_speech.StreamingRecognizeRequest] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterable[cloud_speech.StreamingRecognizeResponse]:
+        if requests is None:
+            raise ValueError("requests is required")
+        return self._responses(requests)
+
+    async def _responses(
+        self, requests: AsyncIterator[cloud_speech.StreamingRecognizeRequest]
+    ) -> AsyncIterator[cloud_speech.StreamingRecognizeResponse]:
+        words = self.transcript.split()
+        audio_chunks = 0
+        results = 0
+
+        async def respond(text: str, is_final: bool) -> cloud_speech.StreamingRecognizeResponse:
+            nonlocal results
+            await asyncio.sleep(self.first_result_seconds if results == 0 else self.result_seconds)
+            results += 1
+            return cloud_speech.StreamingRecognizeResponse(
+                results=[
+                    cloud_speech.StreamingRecognitionResult(
+                        alternatives=[cloud_speech.SpeechRecognitionAlternative(transcript=text, confidence=0.95)],
+                        is_final=is_final,
+                    )
+                ]
+            )
+
+        async for request in requests:
+            if not request.audio:
+                continue  # 첫 요청은 설정
+            audio_chunks += 1
+            if audio_chunks % self.interim_every == 0:
+                partial = " ".join(words[: min(len(words), audio_chunks // self.interim_every)])
+                yield await respond(partial, is_final=False)
+
+        if audio_chunks:
+            yield await respond(self.transcript, is_final=True)
+
+
+class FakePushService(PushService):
+    """
+    FCM 푸시 fake
+
+    Firebase를 초기화하지 않고, 전송마다 latency_seconds만큼 블로킹한 뒤 전송 완료 시각을 기록합니다.
+    (실제 firebase_admin 호출도 동기 HTTP이므로 같은 방식으로 이벤트 루프를 막습니다.)
+    """
+
+    def __init__(self, latency_seconds: float = 0.0) -> None:
+        self.latency_seconds = latency_seconds
+        self.sent_at: list[float] = []
+        self.sent_tokens = 0
+
+    def send(self, token: str, title: str, body: str) -> None:
+        self.send_multicast([token], title, body)
+
+    def send_multicast(self, tokens: list[str], title: str, body: str) -> None:
+        if not tokens:
+            return
+        time.sleep(self.latency_seconds)
+        self.sent_tokens += len(tokens)
+        self.sent_at.append(time.perf_counter())
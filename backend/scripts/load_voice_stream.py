@@ -0,0 +1,289 @@
+"""
+음성 스트리밍 WebSocket 부하 생성기 (debug 모드에서만 동작)
+
+인증된 WebSocket 세션 N개를 동시에 열고 recordings/의 WAV 파일을 실시간(또는 N배속)으로
+프레임 단위로 재생한 뒤 {"type": "stop"}을 보내고, 세션별로 다음을 측정합니다.
+
+- 첫 중간 결과 / 최종 결과 / session_created까지 걸린 시간 (첫 프레임 전송 시점 기준)
+- stop 전송부터 session_created까지 걸린 시간 (녹음 저장 + VoiceSession 생성)
+- 유실 프레임: 보낸 프레임 수 - 서버가 받은 청크 수 (session_created의 audio_chunks)
+- 연결당 서버 메모리: --server-pid 지정 시 서버 프로세스 RSS 증가량 / 연결 수 (Linux /proc)
+
+Google Cloud 없이 실행하려면 scripts/serve_fake_stt.py로 서버를 띄웁니다.
+토큰은 scripts/create_test_user.py와 같은 방식으로 발급하며 (loadtest_N 사용자),
+부하 테스트로 만들어진 VoiceSession과 녹음 파일은 --keep-sessions가 없으면 마지막에 삭제합니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/serve_fake_stt.py
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/load_voice_stream.py --connections 100 --speed 1 \\
+        --server-pid $(pgrep -f serve_fake_stt.py)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from benchmark_offline import CaseResult, print_results
+from sqlalchemy import text
+from sqlmodel import col, select
+from websockets.asyncio.client import connect
+
+from apps.models.user import User
+from apps.types.social import SocialProvider
+from containers import Container
+from settings import Settings
+
+
+@dataclass
+class Recording:
+    """재생할 WAV 파일 (LINEAR16 모노)"""
+
+    path: Path
+    sample_rate: int
+    frames: bytes
+
+
+@dataclass
+class SessionResult:
+    """WebSocket 세션 하나의 측정 결과 (시각은 time.perf_counter 기준)"""
+
+    started_at: float = 0.0
+    stop_sent_at: float | None = None
+    first_interim_at: float | None = None
+    final_at: float | None = None
+    session_created_at: float | None = None
+    frames_sent: int = 0
+    frames_received: int | None = None
+    session_id: str | None = None
+    error: str | None = None
+
+
+def load_recordings(audio_dir: Path) -> list[Recording]:
+    """16-bit 모노 WAV 파일만 읽습니다 (서버 스트리밍 형식: LINEAR16)."""
+    recordings = []
+    for path in sorted(audio_dir.glob("*.wav")):
+        with wave.open(str(path), "rb") as wav_file:
+            if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+                print(f"  skip {path.name}: not 16-bit mono")
+                continue
+            frames = wav_file.readframes(wav_file.getnframes())
+            if frames:
+                recordings.append(Recording(path=path, sample_rate=wav_file.getframerate(), frames=frames))
+    return recordings
+
+
+async def mint_tokens(container: Container, users: int) -> list[str]:
+    """부하 테스트 사용자(loadtest_N)를 만들거나 재사용하고 사용자별 세션 토큰을 발급합니다."""
+    database = container.database()
+    session_service = container.session_service()
+
+    tokens = []
+    async with database.session() as session:
+        for i in range(1, users + 1):
+            email = f"loadtest{i}@example.com"
+            user = (await session.execute(select(User).where(col(User.email) == email))).scalar_one_or_none()
+            if user is None:
+                user = User(
+                    email=email,
+                    nickname=f"loadtest_{i}",
+                    social_provider=SocialProvider.GOOGLE,
+                    social_id=f"loadtest_{i}",
+                )
+                session.add(user)
+                await session.flush()
+                await session.refresh(user)
+            if user.id is None:
+                raise ValueError("User ID should not be None")
+            tokens.append(await session_service.create_session(user.id))
+    return tokens
+
+
+async def delete_sessions(container: Container, session_ids: list[str]) -> int:
+    """부하 테스트로 만들어진 VoiceSession과 녹음 파일을 삭제합니다 (서버와 같은 호스트의 파일만)."""
+    if not session_ids:
+        return 0
+    async with container.database().session() as session:
+        result = await session.execute(
+            text("DELETE FROM voice_session WHERE session_id = ANY(CAST(:session_ids AS uuid[])) RETURNING audio_path"),
+            {"session_ids": [UUID(session_id) for session_id in session_ids]},
+        )
+        audio_paths = [row[0] for row in result.all()]
+    for audio_path in audio_paths:
+        Path(audio_path).unlink(missing_ok=True)
+    return len(audio_paths)
+
+
+async def run_session(
+    url: str, token: str, recording: Recording, args: argparse.Namespace, result: SessionResult
+) -> None:
+    """WAV 한 개를 프레임 단위로 보내고, 서버 응답 시각을 기록합니다."""
+    frame_bytes = recording.sample_rate * args.frame_ms // 1000 * 2
+    frame_interval = args.frame_ms / 1000 / args.speed if args.speed > 0 else 0.0
+    stream_url = f"{url}?sample_rate={recording.sample_rate}"
+
+    async with connect(stream_url, additional_headers={"Authorization": f"Bearer {token}"}) as websocket:
+
+        async def receive() -> None:
+            async for message in websocket:
+                data = json.loads(message)
+                now = time.perf_counter()
+                if "error" in data:
+                    result.error = str(data["error"])
+                elif data.get("type") in ("session_created", "no_speech"):
+                    result.frames_received = data.get("audio_chunks")
+                    if data["type"] == "session_created":
+                        result.session_created_at = now
+                        result.session_id = data["session_id"]
+                    else:
+                        result.error = "no_speech"
+                    return
+                elif data.get("is_final"):
+                    result.final_at = result.final_at or now
+                elif result.first_interim_at is None:
+                    result.first_interim_at = now
+
+        receive_task = asyncio.create_task(receive())
+        result.started_at = time.perf_counter()
+        for offset in range(0, len(recording.frames), frame_bytes):
+            if receive_task.done():
+                break  # 서버가 먼저 종료
+            # 누적 오차가 없도록 시작 시각 기준으로 다음 프레임 시각을 계산
+            delay = result.started_at + result.frames_sent * frame_interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await websocket.send(recording.frames[offset : offset + frame_bytes])
+            result.frames_sent += 1
+
+        await websocket.send(json.dumps({"type": "stop"}))
+        result.stop_sent_at = time.perf_counter()
+        await asyncio.wait_for(receive_task, timeout=args.timeout)
+
+
+def read_rss_bytes(pid: int) -> int | None:
+    """프로세스 RSS (Linux /proc/<pid>/status의 VmRSS)"""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+async def sample_peak_rss(pid: int, peak: list[int], interval: float = 0.2) -> None:
+    """취소될 때까지 서버 RSS 최댓값을 peak[0]에 기록합니다."""
+    while True:
+        rss = read_rss_bytes(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        await asyncio.sleep(interval)
+
+
+def latency_result(name: str, elapsed: float, values: list[float | None]) -> CaseResult:
+    return CaseResult(name=name, elapsed_seconds=elapsed, latencies_ms=[v * 1000 for v in values if v is not None])
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not Settings.debug:
+        print("Error: This script only works in debug mode.")
+        print("Set 'debug: true' in your config file.")
+        sys.exit(1)
+
+    recordings = load_recordings(Path(args.audio_dir))
+    if not recordings:
+        print(f"Error: no 16-bit mono WAV files in {args.audio_dir}")
+        sys.exit(1)
+
+    container = Container()
+    container.config.from_dict(Settings.model_dump())
+    tokens = await mint_tokens(container, args.users)
+    print(f"{args.connections} connections, {len(recordings)} recordings, {args.users} users, speed {args.speed}x")
+
+    baseline_rss = read_rss_bytes(args.server_pid) if args.server_pid else None
+    peak_rss = [baseline_rss or 0]
+    sampler = asyncio.create_task(sample_peak_rss(args.server_pid, peak_rss)) if baseline_rss else None
+
+    results = [SessionResult() for _ in range(args.connections)]
+
+    async def start(i: int) -> None:
+        # ramp-up 동안 연결 시작 시각을 고르게 분산
+        await asyncio.sleep(args.ramp_up_seconds * i / args.connections)
+        try:
+            await run_session(args.url, tokens[i % len(tokens)], recordings[i % len(recordings)], args, results[i])
+        except Exception as e:
+            results[i].error = results[i].error or f"{type(e).__name__}: {e}"
+
+    started = time.perf_counter()
+    await asyncio.gather(*(start(i) for i in range(args.connections)))
+    elapsed = time.perf_counter() - started
+    if sampler is not None:
+        sampler.cancel()
+
+    print_results(
+        [
+            latency_result(
+                "ws / first interim",
+                elapsed,
+                [r.first_interim_at - r.started_at if r.first_interim_at else None for r in results],
+            ),
+            latency_result("ws / final", elapsed, [r.final_at - r.started_at if r.final_at else None for r in results]),
+            latency_result(
+                "ws / session_created",
+                elapsed,
+                [r.session_created_at - r.started_at if r.session_created_at else None for r in results],
+            ),
+            latency_result(
+                "ws / stop → created",
+                elapsed,
+                [
+                    r.session_created_at - r.stop_sent_at if r.session_created_at and r.stop_sent_at else None
+                    for r in results
+                ],
+            ),
+        ]
+    )
+
+    frames_sent = sum(r.frames_sent for r in results)
+    # 서버가 청크 수를 알려주지 않은 세션(연결 실패 등)은 보낸 프레임 전부를 유실로 계산
+    dropped = sum(r.frames_sent - (r.frames_received or 0) for r in results)
+    errors = [r.error for r in results if r.error]
+    print(f"\nsessions: {args.connections - len(errors)} ok, {len(errors)} failed")
+    if frames_sent:
+        print(f"frames:   {frames_sent} sent, {dropped} dropped ({dropped / frames_sent:.2%})")
+    for error in sorted(set(errors))[:5]:
+        print(f"  error: {error} (x{errors.count(error)})")
+    if baseline_rss:
+        growth = peak_rss[0] - baseline_rss
+        print(
+            f"server:   RSS {baseline_rss / 2**20:.1f} MiB → peak {peak_rss[0] / 2**20:.1f} MiB "
+            f"({growth / args.connections / 2**10:.1f} KiB per connection)"
+        )
+
+    if not args.keep_sessions:
+        deleted = await delete_sessions(container, [r.session_id for r in results if r.session_id])
+        print(f"\nDeleted {deleted} voice sessions created by the load test")
+    await container.database().dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="음성 스트리밍 WebSocket 부하 생성기")
+    parser.add_argument("--url", default="ws://127.0.0.1:8000/api/v1/voice/stream", help="WebSocket 엔드포인트")
+    parser.add_argument("--connections", type=int, default=10, help="동시 WebSocket 세션 수")
+    parser.add_argument("--users", type=int, default=10, help="토큰을 발급할 부하 테스트 사용자 수")
+    parser.add_argument("--ramp-up-seconds", type=float, default=0, help="모든 연결을 시작하기까지 걸리는 시간")
+    parser.add_argument("--audio-dir", default=str(Settings.root_dir / "recordings"), help="재생할 WAV 파일 디렉토리")
+    parser.add_argument("--frame-ms", type=int, default=100, help="프레임 하나의 오디오 길이")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0이면 기다리지 않고 전송)")
+    parser.add_argument("--timeout", type=float, default=60, help="stop 이후 session_created 대기 시간(초)")
+    parser.add_argument("--server-pid", type=int, help="메모리를 측정할 서버 프로세스 ID (Linux)")
+    parser.add_argument("--keep-sessions", action="store_true", help="생성된 VoiceSession/녹음 파일을 남김")
+    args = parser.parse_args()
+    if args.frame_ms <= 0 or args.connections <= 0 or args.users <= 0:
+        parser.error("--frame-ms, --connections and --users must be positive")
+    asyncio.run(main(args))
@@ -0,0 +1,137 @@
+"""
+프로세스 시작 시 import 시간 측정 및 예산 검사
+
+모듈마다 새 인터프리터에서 `python -X importtime -c "import <모듈>"`을 실행하고,
+전체 import 시간과 패키지별 시간(self time 합계)을 보여줍니다.
+
+다음 경우 종료 코드 1을 반환하므로 CI/배포 전 검사로 사용할 수 있습니다.
+- import 시간이 예산(BUDGETS_MS × --scale)을 넘음
+- 처음 사용할 때 import해야 하는 SDK(LAZY_MODULES)가 시작 시점에 로딩됨
+
+예산은 개발 컨테이너에서 측정한 기준값 기준이며, 더 느린 환경에서는 --scale로 늘립니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/profile_imports.py
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/profile_imports.py --targets apps.celery --top 30
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# 모듈별 import 시간 예산 (ms) - 측정 기준값(중앙값 범위)에 30% 이상 여유를 둔 값
+# 기준값이 바뀌면(무거운 의존성 제거 등) 함께 조정합니다.
+BUDGETS_MS = {
+    "containers": 4500,  # scripts, Celery 태스크에서 사용 (기준 2.6~3.4 s)
+    "apps.celery": 1500,  # Celery 워커/beat (기준 0.8~1.1 s)
+    "apps.tasks.reminder": 4000,  # 리마인더 태스크 - 워커가 실제로 실행하는 경로 (기준 2.6~3.2 s)
+    "main": 5500,  # API 서버 (기준 3.8~4.3 s)
+}
+
+# 처음 사용할 때만 import해야 하는 SDK (각 서비스의 지연 로딩 프로퍼티/메서드에서 import)
+LAZY_MODULES = (
+    "langchain_core",
+    "langchain_google_genai",
+    "google.genai",
+    "google.cloud.speech_v2",
+    "firebase_admin",
+    "authlib",
+)
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass
+class ImportProfile:
+    """모듈 하나의 import 측정 결과"""
+
+    target: str
+    total_ms: float
+    self_ms_by_package: dict[str, float] = field(default_factory=dict)
+    lazy_modules_loaded: list[str] = field(default_factory=list)
+
+
+def package_of(module: str) -> str:
+    """패키지별로 묶을 이름 (google.*와 apps.*는 한 단계 더 나눔)"""
+    parts = module.split(".")
+    if parts[:2] == ["google", "cloud"]:
+        return ".".join(parts[:3])
+    if parts[0] in ("google", "apps"):
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def profile(target: str) -> ImportProfile:
+    """새 인터프리터에서 target을 import하고 결과를 분석합니다."""
+    code = f"import sys, {target}; print('\\n'.join(sys.modules))"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{process.stderr[-2000:]}")
+
+    total_us = 0
+    self_us: dict[str, int] = defaultdict(int)
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_time, cumulative, indent, module = match.groups()
+        self_us[package_of(module)] += int(self_time)
+        if module == target and not indent:
+            total_us = int(cumulative)
+
+    loaded = set(process.stdout.split())
+    lazy_loaded = [lazy for lazy in LAZY_MODULES if any(m == lazy or m.startswith(f"{lazy}.") for m in loaded)]
+    return ImportProfile(
+        target=target,
+        total_ms=total_us / 1000,
+        self_ms_by_package={package: us / 1000 for package, us in self_us.items()},
+        lazy_modules_loaded=lazy_loaded,
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    failed = False
+    for target in args.targets:
+        # 디스크 캐시 등의 영향을 줄이기 위해 여러 번 실행하고 중앙값 사용
+        profiles = sorted((profile(target) for _ in range(args.repeat)), key=lambda p: p.total_ms)
+        result = profiles[len(profiles) // 2]
+        spread = statistics.pstdev(p.total_ms for p in profiles)
+
+        budget = BUDGETS_MS.get(target)
+        status = ""
+        if budget is not None:
+            budget *= args.scale
+            over = result.total_ms > budget
+            failed |= over
+            status = f"(budget {budget:.0f} ms) {'OVER' if over else 'OK'}"
+        print(f"\n{target:<24} {result.total_ms:>8.0f} ms ±{spread:.0f}  {status}")
+
+        top = sorted(result.self_ms_by_package.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        for package, ms in top:
+            print(f"  {package:<30} {ms:>8.1f} ms")
+
+        if result.lazy_modules_loaded:
+            failed = True
+            print(f"  ERROR: loaded at import time (should be imported on first use): {result.lazy_modules_loaded}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프로세스 시작 시 import 시간 측정 및 예산 검사")
+    parser.add_argument(
+        "--targets",
+        type=lambda value: [target.strip() for target in value.split(",") if target.strip()],
+        default=list(BUDGETS_MS),
+        help="측정할 모듈 (쉼표로 구분)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="모듈별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=12, help="표시할 패키지 수")
+    parser.add_argument("--scale", type=float, default=1.0, help="예산 배율 (느린 CI 환경 등)")
+    main(parser.parse_args())
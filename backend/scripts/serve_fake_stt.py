@@ -0,0 +1,49 @@
+"""
+Speech-to-Text를 fake로 바꾼 API 서버 실행 (debug 모드에서만 동작)
+
+/api/v1/voice/stream 부하 테스트(scripts/load_voice_stream.py)를 Google Cloud 없이 하기 위한 서버입니다.
+STT 외의 경로(인증, VoiceSession 저장, 녹음 파일 저장)는 실제 서버와 같습니다.
+인식 결과는 오디오 내용과 무관하게 FakeSpeechClient의 고정 문장입니다.
+
+사용 예:
+    ENV_FILE=local.yaml PYTHONPATH=. uv run python scripts/serve_fake_stt.py --port 8000
+"""
+
+import argparse
+import os
+import sys
+from importlib import import_module
+
+import uvicorn
+from fakes import FakeSpeechClient
+
+from settings import Settings
+
+
+def main(args: argparse.Namespace) -> None:
+    if not Settings.debug:
+        print("Error: This script only works in debug mode.")
+        print("Set 'debug: true' in your config file.")
+        sys.exit(1)
+
+    # StreamingVoiceService는 Singleton이므로 첫 요청 전에 override하면 서버 전체에 적용됨
+    app_module = import_module("main")
+    app_module.container.speech_client.override(
+        FakeSpeechClient(
+            first_result_seconds=args.stt_first_result_ms / 1000,
+            result_seconds=args.stt_result_ms / 1000,
+            interim_every=args.interim_every,
+        )
+    )
+    print(f"Fake STT server (pid={os.getpid()})")
+    uvicorn.run(app_module.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="STT를 fake로 바꾼 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--stt-first-result-ms", type=float, default=300, help="STT 첫 결과 지연")
+    parser.add_argument("--stt-result-ms", type=float, default=100, help="STT 이후 결과 지연")
+    parser.add_argument("--interim-every", type=int, default=5, help="중간 결과를 보낼 오디오 청크 간격")
+    main(parser.parse_args())
@@ -8,11 +8,17 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
+from apps.types.ai_log import AILogConfig
 from apps.types.assistant import AssistantConfig
+from apps.types.assistant_job import AssistantJobConfig
 from apps.types.auth import AuthConfig
+from apps.types.calendar import CalendarConfig
 from apps.types.celery import CeleryConfig
 from apps.types.database import DatabaseConfig
 from apps.types.firebase import FirebaseConfig
+from apps.types.lifecycle import LifecycleConfig
+from apps.types.memory_import import MemoryImportConfig
+from apps.types.metrics import MetricsConfig
 from apps.types.redis import RedisConfig
 from apps.types.social import SocialConfig
 from apps.types.voice import VoiceConfig
@@ -33,6 +39,12 @@ class _Settings(BaseSettings):
     assistant: AssistantConfig
     celery: CeleryConfig
     firebase: FirebaseConfig = FirebaseConfig()
+    memory_import: MemoryImportConfig = MemoryImportConfig()
+    calendar: CalendarConfig = CalendarConfig()
+    ai_log: AILogConfig = AILogConfig()
+    assistant_job: AssistantJobConfig = AssistantJobConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    lifecycle: LifecycleConfig = LifecycleConfig()
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
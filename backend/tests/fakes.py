@@ -0,0 +1,38 @@
+"""테스트용 가짜 의존성"""
+
+from apps.cache import RedisCache
+from apps.types.redis import RedisConfig
+
+
+class FakeRedisCache(RedisCache):
+    """Redis 대신 쓰는 메모리 저장소 (만료 없음, fail=True면 모든 명령이 ConnectionError)"""
+
+    def __init__(self) -> None:
+        super().__init__(RedisConfig(host="localhost", port=6379, db=0))
+        self.values: dict[str, str] = {}
+        self.fail = False
+        self.gets = 0
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key: str) -> str | None:
+        self.gets += 1
+        self._check()
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._check()
+        self.values[key] = value
+
+    async def set_if_absent(self, key: str, value: str, ex: int) -> bool:
+        self._check()
+        if key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._check()
+        self.values.pop(key, None)
@@ -0,0 +1,168 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from apps.exceptions import AIUnavailableError
+from apps.services.ai_guard import AIGuard
+from apps.types.ai_guard import AIGuardConfig, CircuitState
+
+
+def make_guard(**overrides: Any) -> AIGuard:
+    config = AIGuardConfig(breaker_window=4, breaker_min_calls=4, breaker_half_open_calls=2, **overrides)
+    return AIGuard("test", config)
+
+
+def state(guard: AIGuard) -> CircuitState:
+    # 속성을 직접 비교하면 mypy가 앞선 assert로 타입을 좁혀 이후 비교를 오류로 봄
+    return guard.state
+
+
+def expire_open(guard: AIGuard) -> None:
+    """breaker_open_seconds가 지난 것으로 만듭니다."""
+    guard._opened_at = float("-inf")
+
+
+async def succeed(guard: AIGuard) -> None:
+    async with guard.call():
+        pass
+
+
+async def fail(guard: AIGuard, error: Exception | None = None) -> None:
+    with pytest.raises(type(error) if error else ConnectionError):
+        async with guard.call():
+            raise error or ConnectionError()
+
+
+async def open_breaker(guard: AIGuard) -> None:
+    for _ in range(guard.config.breaker_min_calls):
+        await fail(guard)
+    assert state(guard) == CircuitState.OPEN
+
+
+class Probe:
+    """release()될 때까지 guard.call() 안에서 기다리는 호출"""
+
+    def __init__(self, guard: AIGuard, error: Exception | None = None):
+        self._release = asyncio.Event()
+        self._error = error
+        self.task = asyncio.create_task(self._run(guard))
+
+    async def _run(self, guard: AIGuard) -> None:
+        async with guard.call():
+            await self._release.wait()
+            if self._error is not None:
+                raise self._error
+
+    async def release(self) -> None:
+        self._release.set()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+async def test_opens_on_error_rate_and_rejects() -> None:
+    guard = make_guard()
+    await open_breaker(guard)
+
+    with pytest.raises(AIUnavailableError):
+        await succeed(guard)
+    assert not guard.available
+
+
+async def test_parse_errors_are_not_failures() -> None:
+    guard = make_guard()
+    for _ in range(10):
+        await fail(guard, ValueError("malformed output"))
+    assert state(guard) == CircuitState.CLOSED
+
+
+async def test_half_open_closes_after_successful_probes() -> None:
+    guard = make_guard()
+    await open_breaker(guard)
+    expire_open(guard)
+
+    await succeed(guard)
+    assert state(guard) == CircuitState.HALF_OPEN
+    await succeed(guard)
+    assert state(guard) == CircuitState.CLOSED
+
+
+async def test_half_open_reopens_on_failed_probe() -> None:
+    guard = make_guard()
+    await open_breaker(guard)
+    expire_open(guard)
+
+    await fail(guard)
+    assert state(guard) == CircuitState.OPEN
+    with pytest.raises(AIUnavailableError):
+        await succeed(guard)
+
+
+async def test_half_open_limits_concurrent_probes() -> None:
+    guard = make_guard()
+    await open_breaker(guard)
+    expire_open(guard)
+
+    a, b = Probe(guard), Probe(guard)
+    await asyncio.sleep(0)
+    with pytest.raises(AIUnavailableError):
+        await succeed(guard)
+    await a.release()
+    await b.release()
+    assert state(guard) == CircuitState.CLOSED
+
+
+async def test_probe_from_previous_half_open_period_is_ignored() -> None:
+    # A, B 시험 호출 → A 성공 → C 시험 호출 → B 실패(다시 차단) → C 성공: 차단 상태가 유지되어야 함
+    guard = make_guard()
+    await open_breaker(guard)
+    expire_open(guard)
+
+    a, b = Probe(guard), Probe(guard, ConnectionError())
+    await asyncio.sleep(0)
+    await a.release()
+    c = Probe(guard)
+    await asyncio.sleep(0)
+    await b.release()
+    assert state(guard) == CircuitState.OPEN
+    await c.release()
+    assert state(guard) == CircuitState.OPEN
+
+    # 다음 half-open 구간은 이전 구간의 카운터 영향 없이 시험 호출 2개만 허용
+    expire_open(guard)
+    d, e = Probe(guard), Probe(guard)
+    await asyncio.sleep(0)
+    with pytest.raises(AIUnavailableError):
+        await succeed(guard)
+    await d.release()
+    await e.release()
+    assert state(guard) == CircuitState.CLOSED
+
+
+async def test_queue_timeout_rejects() -> None:
+    guard = make_guard(max_concurrency=1, queue_timeout_seconds=0.01)
+    holder = Probe(guard)
+    await asyncio.sleep(0)
+
+    with pytest.raises(AIUnavailableError):
+        await succeed(guard)
+    await holder.release()
+
+
+async def test_deadline_counts_as_failure() -> None:
+    guard = make_guard(deadline_seconds=0.01)
+    for _ in range(guard.config.breaker_min_calls):
+        with pytest.raises(AIUnavailableError):
+            async with guard.call():
+                await asyncio.sleep(1)
+    assert state(guard) == CircuitState.OPEN
+
+
+async def test_cancelled_calls_are_not_recorded() -> None:
+    guard = make_guard()
+    for _ in range(guard.config.breaker_min_calls):
+        probe = Probe(guard)
+        await asyncio.sleep(0)
+        probe.task.cancel()
+        await asyncio.gather(probe.task, return_exceptions=True)
+    assert state(guard) == CircuitState.CLOSED
+    assert len(guard._outcomes) == 0
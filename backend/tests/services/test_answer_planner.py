@@ -0,0 +1,127 @@
+import pytest
+
+from apps.models.memory import Memory
+from apps.services.answer_planner import AnswerPlanner, asks_location, asks_phone
+from apps.types.assistant import AssistantConfig, MemoryType
+
+
+@pytest.fixture
+def planner() -> AnswerPlanner:
+    config = AssistantConfig(
+        api_key="test",
+        model="test-model",
+        embedding_model="test-embedding",
+        embedding_dimensions=3072,
+        temperature=0.1,
+        max_tokens=100,
+        answer_template_enabled=True,
+    )
+    return AnswerPlanner(config)
+
+
+@pytest.fixture
+def item() -> Memory:
+    return Memory(
+        id=1,
+        type=MemoryType.ITEM,
+        keywords="여권, 서랍",
+        content="여권은 서랍에 있음",
+        metadata_={"location": "서랍"},
+        original_text="여권 서랍에 넣어뒀어",
+    )
+
+
+@pytest.fixture
+def person() -> Memory:
+    return Memory(
+        id=2,
+        type=MemoryType.PERSON,
+        keywords="철수",
+        content="철수 전화번호 010-1234-5678",
+        metadata_={"name": "철수", "phone": "010-1234-5678"},
+        original_text="철수 번호는 010-1234-5678",
+    )
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "여권 어디 있어?",
+        "여권 어딨어?",
+        "여권 어디에 뒀지?",
+        "여권 위치 알려줘",
+        "Where is my passport?",
+        "Where's my passport?",
+    ],
+)
+def test_asks_location(question: str) -> None:
+    assert asks_location(question)
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["여권 어디서 발급받았지?", "여권 어디에서 샀지?", "Where did I buy my passport?", "여권 언제 만료돼?"],
+)
+def test_does_not_ask_location(question: str) -> None:
+    assert not asks_location(question)
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["철수 전화번호 뭐였지?", "철수 번호가 뭐야", "철수 연락처 알려줘", "What is Chulsoo's phone number?"],
+)
+def test_asks_phone(question: str) -> None:
+    assert asks_phone(question)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "철수 계좌번호 알려줘",
+        "철수 계좌 번호 알려줘",
+        "철수 집 비밀번호 뭐였지?",
+        "철수 방번호 몇 호야?",
+        "What is Chulsoo's account number?",
+        "철수한테 전화했던 게 언제지?",
+    ],
+)
+def test_does_not_ask_phone(question: str) -> None:
+    assert not asks_phone(question)
+
+
+def test_plan_renders_location(planner: AnswerPlanner, item: Memory, person: Memory) -> None:
+    assert planner.plan("여권 어디 있어?", [(item, 0.9), (person, 0.5)]) == "It's in 서랍."
+
+
+def test_plan_renders_phone(planner: AnswerPlanner, person: Memory) -> None:
+    assert planner.plan("철수 전화번호 뭐였지?", [(person, 0.9)]) == "철수's phone number is 010-1234-5678."
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["철수 계좌번호 알려줘", "철수 집 비밀번호 뭐였지?", "What is Chulsoo's account number?"],
+)
+def test_plan_leaves_other_numbers_to_llm(planner: AnswerPlanner, person: Memory, question: str) -> None:
+    assert planner.plan(question, [(person, 0.95)]) is None
+
+
+@pytest.mark.parametrize("question", ["여권 어디서 발급받았지?", "Where did I buy my passport?"])
+def test_plan_leaves_non_location_questions_to_llm(planner: AnswerPlanner, item: Memory, question: str) -> None:
+    assert planner.plan(question, [(item, 0.95)]) is None
+
+
+def test_plan_requires_similarity_and_margin(planner: AnswerPlanner, item: Memory, person: Memory) -> None:
+    assert planner.plan("여권 어디 있어?", [(item, 0.7)]) is None
+    assert planner.plan("여권 어디 있어?", [(item, 0.9), (person, 0.85)]) is None
+
+
+def test_plan_disabled_by_default(item: Memory) -> None:
+    config = AssistantConfig(
+        api_key="test",
+        model="test-model",
+        embedding_model="test-embedding",
+        embedding_dimensions=3072,
+        temperature=0.1,
+        max_tokens=100,
+    )
+    assert AnswerPlanner(config).plan("여권 어디 있어?", [(item, 0.95)]) is None
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+from apps.i18n import set_locale
+from apps.services.assistant_job import AssistantJobService
+from apps.types.assistant_job import AssistantJobConfig, AssistantJobStatus
+from tests.fakes import FakeRedisCache
+
+
+class Process:
+    """release()될 때까지 기다리는 AssistantService.process"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._release = asyncio.Event()
+
+    def release(self) -> None:
+        self._release.set()
+
+    async def __call__(self, **_kwargs: Any) -> dict[str, Any]:
+        self.count += 1
+        await self._release.wait()
+        return {"ok": True}
+
+
+def make_service(process: Process, **overrides: Any) -> tuple[AssistantJobService, FakeRedisCache]:
+    redis_cache = FakeRedisCache()
+    assistant_service = MagicMock()
+    assistant_service.process = process
+    service = AssistantJobService(AssistantJobConfig(**overrides), assistant_service, MagicMock(), redis_cache)
+    return service, redis_cache
+
+
+async def test_stop_waits_for_running_jobs() -> None:
+    process = Process()
+    service, _redis_cache = make_service(process)
+    job = await service.submit_chat("안녕", user_id=1)
+    await asyncio.sleep(0)
+
+    asyncio.get_running_loop().call_later(0.01, process.release)
+    await service.stop()
+
+    result = await service.wait(job.job_id, user_id=1)
+    assert result.status == AssistantJobStatus.COMPLETED
+
+
+async def test_stop_fails_unfinished_jobs() -> None:
+    process = Process()
+    service, _redis_cache = make_service(process, shutdown_timeout_seconds=0.01)
+    running = await service.submit_chat("안녕", user_id=1)
+    queued = await service.submit_chat("잘 가", user_id=1)
+    other = await service.submit_chat("안녕", user_id=2)
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service.wait(running.job_id, user_id=1, wait_seconds=10))
+
+    await service.stop()
+    await asyncio.sleep(0)
+    process.release()
+
+    assert process.count == 2
+    for job_id, user_id in ((running.job_id, 1), (queued.job_id, 1), (other.job_id, 2)):
+        result = await service.wait(job_id, user_id=user_id)
+        assert result.status == AssistantJobStatus.FAILED
+        assert result.error == "The server restarted before the request finished. Please try again."
+    assert (await asyncio.wait_for(waiter, timeout=1)).status == AssistantJobStatus.FAILED
+
+
+async def test_stop_fails_jobs_in_their_locale() -> None:
+    process = Process()
+    service, _redis_cache = make_service(process, shutdown_timeout_seconds=0.01)
+    set_locale("ko")
+    job = await service.submit_chat("안녕", user_id=1)
+    set_locale("en")
+    await asyncio.sleep(0)
+
+    await service.stop()
+    process.release()
+
+    result = await service.wait(job.job_id, user_id=1)
+    assert result.error == "요청을 처리하는 중에 서버가 재시작되었습니다. 다시 시도해 주세요."
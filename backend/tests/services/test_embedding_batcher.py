@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from apps.exceptions import AIUnavailableError
+from apps.services.embedding_batcher import EmbeddingBatcher
+from apps.types.embedding_batch import EmbeddingBatchConfig
+
+
+class Embed:
+    """호출된 배치를 기록하고 텍스트 길이로 된 벡터를 반환하는 임베딩 함수"""
+
+    def __init__(self, error: Exception | None = None, delay: float = 0):
+        self.batches: list[list[str]] = []
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+def make_batcher(embed: Embed, **overrides: Any) -> EmbeddingBatcher:
+    return EmbeddingBatcher(EmbeddingBatchConfig(**overrides), embed)
+
+
+async def test_batches_concurrent_requests() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_wait_seconds=0.01)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("bb"), batcher.embed("ccc"))
+
+    assert list(results) == [[1.0], [2.0], [3.0]]
+    assert embed.batches == [["a", "bb", "ccc"]]
+
+
+async def test_deduplicates_texts_in_batch() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_wait_seconds=0.01)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("bb"), batcher.embed("a"))
+
+    assert list(results) == [[1.0], [2.0], [1.0]]
+    assert embed.batches == [["a", "bb"]]
+
+
+async def test_flushes_when_batch_is_full() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_batch_size=2, max_wait_seconds=10)
+
+    results = await asyncio.wait_for(asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=1)
+
+    assert list(results) == [[1.0], [2.0]]
+    assert embed.batches == [["a", "bb"]]
+
+
+async def test_splits_batches_by_size() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_batch_size=2, max_wait_seconds=0.01)
+
+    await asyncio.gather(*(batcher.embed(text) for text in ("a", "bb", "ccc")))
+
+    assert embed.batches == [["a", "bb"], ["ccc"]]
+
+
+async def test_error_is_raised_to_whole_batch() -> None:
+    embed = Embed(error=ConnectionError("boom"))
+    batcher = make_batcher(embed, max_wait_seconds=0.01)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("bb"), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert len(embed.batches) == 1
+
+
+async def test_request_timeout_raises_unavailable() -> None:
+    embed = Embed(delay=1)
+    batcher = make_batcher(embed, max_wait_seconds=0, request_timeout_seconds=0.01)
+
+    with pytest.raises(AIUnavailableError):
+        await batcher.embed("a")
+    await batcher.close()
+
+
+async def test_cancelled_request_is_not_sent() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_wait_seconds=0.01)
+
+    cancelled = asyncio.create_task(batcher.embed("a"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await batcher.embed("bb") == [2.0]
+    assert embed.batches == [["bb"]]
+
+
+async def test_close_sends_pending_requests() -> None:
+    embed = Embed()
+    batcher = make_batcher(embed, max_wait_seconds=10)
+
+    task = asyncio.create_task(batcher.embed("a"))
+    await asyncio.sleep(0)
+    await batcher.close()
+
+    assert await task == [1.0]
@@ -0,0 +1,213 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from apps.cache import RedisCache
+from apps.services.single_flight import SingleFlight
+from apps.types.ai_log import AILogStep
+from apps.types.single_flight import SingleFlightConfig
+from tests.fakes import FakeRedisCache
+
+ADAPTER = TypeAdapter(str)
+STEP = AILogStep.INTENT_CLASSIFICATION
+KEY = ("test-model", "안녕")
+
+_caller: ContextVar[str | None] = ContextVar("caller", default=None)
+
+
+class Call:
+    """release()될 때까지 기다렸다가 result를 반환(또는 error 발생)하는 호출"""
+
+    def __init__(self, result: str = "result", error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.count = 0
+        self.callers: list[str | None] = []
+        self._release = asyncio.Event()
+
+    def release(self) -> None:
+        self._release.set()
+
+    async def __call__(self) -> str:
+        self.count += 1
+        self.callers.append(_caller.get())
+        await self._release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def make_single_flight(redis_cache: RedisCache | None = None, **overrides: Any) -> SingleFlight:
+    config = SingleFlightConfig(poll_interval_seconds=0.001, **overrides)
+    return SingleFlight(config, redis_cache or FakeRedisCache())
+
+
+def lock_key(single_flight: SingleFlight) -> str:
+    return f"{SingleFlight.KEY_PREFIX}lock:{single_flight._flight_key(STEP, KEY)}"
+
+
+def result_key(single_flight: SingleFlight) -> str:
+    return f"{SingleFlight.KEY_PREFIX}result:{single_flight._flight_key(STEP, KEY)}"
+
+
+async def test_coalesces_concurrent_calls() -> None:
+    single_flight = make_single_flight()
+    call = Call()
+
+    tasks = [asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER)) for _ in range(3)]
+    await asyncio.sleep(0)
+    call.release()
+
+    assert await asyncio.gather(*tasks) == ["result"] * 3
+    assert call.count == 1
+    assert not single_flight._flights
+
+
+async def test_different_keys_are_not_coalesced() -> None:
+    single_flight = make_single_flight()
+    call = Call()
+    call.release()
+
+    await asyncio.gather(
+        single_flight.do(STEP, KEY, call, ADAPTER),
+        single_flight.do(STEP, ("test-model", "잘 가"), call, ADAPTER),
+        single_flight.do(AILogStep.TEXT_PARSING, KEY, call, ADAPTER),
+    )
+    assert call.count == 3
+
+
+async def test_finished_call_is_not_reused() -> None:
+    single_flight = make_single_flight()
+    call = Call()
+    call.release()
+
+    await single_flight.do(STEP, KEY, call, ADAPTER)
+    await single_flight.do(STEP, KEY, call, ADAPTER)
+    assert call.count == 2
+
+
+async def test_disabled_calls_directly() -> None:
+    single_flight = make_single_flight(enabled=False)
+    call = Call()
+    call.release()
+
+    await asyncio.gather(*(single_flight.do(STEP, KEY, call, ADAPTER) for _ in range(3)))
+    assert call.count == 3
+
+
+async def test_leader_cancellation_keeps_call_for_other_waiters() -> None:
+    single_flight = make_single_flight()
+    call = Call()
+
+    leader = asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER))
+    follower = asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    call.release()
+
+    assert await follower == "result"
+    assert leader.cancelled()
+    assert call.count == 1
+
+
+async def test_error_is_raised_to_all_waiters() -> None:
+    single_flight = make_single_flight()
+    call = Call(error=ConnectionError("boom"))
+
+    tasks = [asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER)) for _ in range(2)]
+    await asyncio.sleep(0)
+    call.release()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert call.count == 1
+
+
+async def test_call_does_not_inherit_caller_context() -> None:
+    single_flight = make_single_flight()
+    call = Call()
+    call.release()
+
+    token = _caller.set("first request")
+    try:
+        await single_flight.do(STEP, KEY, call, ADAPTER)
+    finally:
+        _caller.reset(token)
+    assert call.callers == [None]
+
+
+async def test_redis_leader_stores_result_and_releases_lock() -> None:
+    redis_cache = FakeRedisCache()
+    single_flight = make_single_flight(redis_cache, redis_enabled=True)
+    call = Call()
+    call.release()
+
+    assert await single_flight.do(STEP, KEY, call, ADAPTER) == "result"
+    assert redis_cache.values == {result_key(single_flight): '"result"'}
+
+
+async def test_redis_result_is_not_used_as_cache() -> None:
+    redis_cache = FakeRedisCache()
+    single_flight = make_single_flight(redis_cache, redis_enabled=True)
+    redis_cache.values[result_key(single_flight)] = '"stale"'
+    call = Call("fresh")
+    call.release()
+
+    assert await single_flight.do(STEP, KEY, call, ADAPTER) == "fresh"
+    assert call.count == 1
+
+
+async def test_redis_waits_for_other_process_result() -> None:
+    redis_cache = FakeRedisCache()
+    single_flight = make_single_flight(redis_cache, redis_enabled=True)
+    redis_cache.values[lock_key(single_flight)] = "1"
+    call = Call()
+    call.release()
+
+    task = asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER))
+    await asyncio.sleep(0.01)
+    redis_cache.values[result_key(single_flight)] = '"shared"'
+    del redis_cache.values[lock_key(single_flight)]
+
+    assert await task == "shared"
+    assert call.count == 0
+
+
+async def test_redis_calls_directly_when_other_process_fails() -> None:
+    redis_cache = FakeRedisCache()
+    single_flight = make_single_flight(redis_cache, redis_enabled=True)
+    redis_cache.values[lock_key(single_flight)] = "1"
+    call = Call()
+    call.release()
+
+    task = asyncio.create_task(single_flight.do(STEP, KEY, call, ADAPTER))
+    await asyncio.sleep(0.01)
+    del redis_cache.values[lock_key(single_flight)]
+
+    assert await task == "result"
+    assert call.count == 1
+
+
+async def test_redis_calls_directly_after_wait_timeout() -> None:
+    redis_cache = FakeRedisCache()
+    single_flight = make_single_flight(redis_cache, redis_enabled=True, wait_seconds=0.01)
+    redis_cache.values[lock_key(single_flight)] = "1"
+    call = Call()
+    call.release()
+
+    assert await single_flight.do(STEP, KEY, call, ADAPTER) == "result"
+    assert call.count == 1
+
+
+async def test_redis_error_calls_directly() -> None:
+    redis_cache = FakeRedisCache()
+    redis_cache.fail = True
+    single_flight = make_single_flight(redis_cache, redis_enabled=True)
+    call = Call()
+    call.release()
+
+    assert await single_flight.do(STEP, KEY, call, ADAPTER) == "result"
+    assert call.count == 1
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from typing import Any
+
+from starlette.types import Message, Receive, Scope, Send
+
+from apps.middlewares import ReadReplicaMiddleware
+from database import ReadRouting, _read_routing
+from tests.fakes import FakeRedisCache
+
+KEY = f"{ReadReplicaMiddleware.STICKY_KEY_PREFIX}1"
+
+
+class App:
+    """복제본 읽기 세션을 reads번 열고(primary_reads 확인) write면 쓰기를 남기는 ASGI 앱"""
+
+    def __init__(self, reads: int = 0, write: bool = False):
+        self.reads = reads
+        self.write = write
+        self.primary_reads: list[bool] = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        routing = _read_routing.get()
+        assert isinstance(routing, ReadRouting)
+        for _ in range(self.reads):
+            self.primary_reads.append(await routing.primary_reads())
+        routing.wrote = self.write
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+
+async def request(middleware: ReadReplicaMiddleware) -> list[Message]:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "path": "/api/v1/memories",
+        "user": SimpleNamespace(is_authenticated=True, user=SimpleNamespace(id=1)),
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+async def test_no_lookup_without_replica_reads() -> None:
+    redis_cache = FakeRedisCache()
+
+    await request(ReadReplicaMiddleware(App(), redis_cache, 5))
+
+    assert redis_cache.gets == 0
+
+
+async def test_sticky_user_reads_from_primary() -> None:
+    redis_cache = FakeRedisCache()
+    redis_cache.values[KEY] = "1"
+    app = App(reads=2)
+
+    await request(ReadReplicaMiddleware(app, redis_cache, 5))
+
+    assert app.primary_reads == [True, True]
+    assert redis_cache.gets == 1
+
+
+async def test_other_user_reads_from_replica() -> None:
+    app = App(reads=1)
+
+    await request(ReadReplicaMiddleware(app, FakeRedisCache(), 5))
+
+    assert app.primary_reads == [False]
+
+
+async def test_write_marks_user_sticky() -> None:
+    redis_cache = FakeRedisCache()
+
+    await request(ReadReplicaMiddleware(App(write=True), redis_cache, 5))
+
+    assert redis_cache.values == {KEY: "1"}
+
+
+async def test_redis_errors_fail_open() -> None:
+    redis_cache = FakeRedisCache()
+    redis_cache.fail = True
+    app = App(reads=1, write=True)
+
+    messages = await request(ReadReplicaMiddleware(app, redis_cache, 5))
+
+    assert app.primary_reads == [False]
+    assert [message["type"] for message in messages] == ["http.response.start", "http.response.body"]
@@ -0,0 +1,71 @@
+import base64
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+
+from apps.exceptions import AppException
+from apps.utils.pagination import Cursor
+
+
+@dataclass
+class Row:
+    id: int | None
+    created_at: datetime | None
+
+
+def key(row: Row) -> tuple[datetime | None, int | None]:
+    return row.created_at, row.id
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        Cursor(value=datetime(2026, 10, 19, 9, 30, 15, 123456, tzinfo=UTC), id=42),
+        Cursor(value=datetime(2026, 1, 1), id=1),
+        Cursor(value=None, id=7),
+    ],
+)
+def test_round_trip(cursor: Cursor) -> None:
+    encoded = cursor.encode()
+
+    assert "=" not in encoded
+    assert Cursor.decode(encoded) == cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b"5").decode(),
+        base64.urlsafe_b64encode(b"[null, 1, 2]").decode(),
+        base64.urlsafe_b64encode(b'["yesterday", 1]').decode(),
+        base64.urlsafe_b64encode(b'[null, "abc"]').decode(),
+    ],
+)
+def test_decode_rejects_invalid(cursor: str) -> None:
+    with pytest.raises(AppException):
+        Cursor.decode(cursor)
+
+
+def test_next_returns_cursor_of_last_item() -> None:
+    created_at = datetime(2026, 10, 19, tzinfo=UTC)
+    rows = [Row(id=2, created_at=datetime(2026, 10, 20, tzinfo=UTC)), Row(id=1, created_at=created_at)]
+
+    next_cursor = Cursor.next(rows, 2, key)
+
+    assert next_cursor is not None
+    assert Cursor.decode(next_cursor) == Cursor(value=created_at, id=1)
+
+
+def test_next_is_none_on_last_page() -> None:
+    rows = [Row(id=1, created_at=None)]
+
+    assert Cursor.next(rows, 2, key) is None
+    assert Cursor.next([], 2, key) is None
+
+
+def test_next_is_none_without_id() -> None:
+    assert Cursor.next([Row(id=None, created_at=None)], 1, key) is None